@@ -0,0 +1,137 @@
+"""Load-test the HTTP API: requests/sec and latency percentiles
+
+Serves a synthetic inventory from a temporary directory and drives it with
+concurrent keep-alive clients sending a mix of lookups, quantity deltas,
+small batches and statistics requests. The server runs on its own event loop
+thread in this process, so client and server share the interpreter.
+
+Run from the project root:
+    python -m benchmarks.bench_api [products] [seconds] [clients]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+from src.api.server import InventoryApiServer
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository
+from src.utils.journal import InventoryJournal
+from benchmarks.synthetic import generate_inventory
+
+# (weight, kind) of each request in the mix
+REQUEST_MIX = [(70, "get"), (20, "adjust"), (5, "batch"), (5, "stats")]
+
+def start_server(controller) -> InventoryApiServer:
+    """Run the server on a background event loop; returns once it is listening"""
+    server = InventoryApiServer(controller, "127.0.0.1", 0)
+    ready = threading.Event()
+    
+    def run():
+        async def main():
+            await server.start()
+            ready.set()
+            await server.serve_forever()
+        asyncio.run(main())
+    
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+    return server
+
+def build_request(kind: str, names: List[str], rng: random.Random) -> bytes:
+    name = rng.choice(names).replace(" ", "%20")
+    if kind == "get":
+        return f"GET /products/{name} HTTP/1.1\r\nHost: bench\r\n\r\n".encode()
+    if kind == "stats":
+        return b"GET /stats HTTP/1.1\r\nHost: bench\r\n\r\n"
+    if kind == "adjust":
+        path = f"/products/{name}/adjust"
+        body = json.dumps({"delta": rng.choice((-1, 1))})
+    else:
+        path = "/batch"
+        body = json.dumps({"operations": [
+            ["adjust", rng.choice(names), rng.choice((-1, 1))] for _ in range(10)
+        ]})
+    return (f"POST {path} HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n{body}").encode()
+
+async def client(port: int, names: List[str], deadline: float, seed: int,
+                 latencies: Dict[str, List[float]], statuses: Counter):
+    rng = random.Random(seed)
+    kinds = [kind for weight, kind in REQUEST_MIX for _ in range(weight)]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while time.perf_counter() < deadline:
+        kind = rng.choice(kinds)
+        request = build_request(kind, names, rng)
+        start = time.perf_counter()
+        writer.write(request)
+        status_line = await reader.readline()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        latencies[kind].append(time.perf_counter() - start)
+        statuses[int(status_line.split()[1])] += 1
+    writer.close()
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def drive(port: int, names: List[str], seconds: float, clients: int):
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Counter = Counter()
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(port, names, deadline, seed, latencies, statuses) for seed in range(clients)
+    ))
+    return time.perf_counter() - start, latencies, statuses
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    clients = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+    
+    with tempfile.TemporaryDirectory() as directory:
+        repository = JsonRepository(
+            os.path.join(directory, "inventory.json"),
+            journal=InventoryJournal(os.path.join(directory, "inventory.journal"))
+        )
+        data = generate_inventory(count)
+        repository.save_snapshot(data)
+        controller = InventoryController(repository)
+        server = start_server(controller)
+        
+        elapsed, latencies, statuses = asyncio.run(
+            drive(server.port, list(data), seconds, clients)
+        )
+        controller.flush()
+        metrics = controller.get_persistence_metrics()
+        controller.close()
+    
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"{count} products, {clients} clients, {elapsed:.1f} s")
+    print(f"{'request':>8} {'count':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for kind in [kind for _, kind in REQUEST_MIX] + ["all"]:
+        samples = ([s for values in latencies.values() for s in values]
+                   if kind == "all" else latencies[kind])
+        if samples:
+            print(f"{kind:>8} {len(samples):>8} {percentile(samples, 0.5) * 1000:>8.2f} "
+                  f"{percentile(samples, 0.99) * 1000:>8.2f}")
+    print(f"Throughput: {total / elapsed:,.0f} requests/s")
+    print(f"Statuses: {dict(sorted(statuses.items()))}")
+    print(f"Snapshot saves: {metrics['saves']} for {metrics['mutations']} mutations")
+
+if __name__ == "__main__":
+    main()
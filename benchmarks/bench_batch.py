@@ -0,0 +1,69 @@
+"""Apply a 2,000-SKU delivery one call at a time vs. as a single batch
+
+Run from the project root:
+    python -m benchmarks.bench_batch [count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository, SqliteRepository
+from src.utils.journal import InventoryJournal
+from benchmarks.synthetic import generate_inventory
+
+class CountingView:
+    """Stands in for MainWindow and counts change notifications"""
+    
+    def __init__(self):
+        self.notifications = 0
+    
+    def on_inventory_changed(self, event):
+        self.notifications += 1
+
+def run(repository, data, delivery, batched: bool):
+    """Return (seconds, view notifications) for applying the delivery"""
+    repository.save_snapshot(data)
+    controller = InventoryController(repository)
+    view = CountingView()
+    controller.set_view(view)
+    
+    start = time.perf_counter()
+    if batched:
+        controller.apply_batch(("adjust", name, delta) for name, delta in delivery)
+    else:
+        for name, delta in delivery:
+            controller.update_quantity(name, delta)
+    controller.flush()
+    elapsed = time.perf_counter() - start
+    controller.close()
+    return elapsed, view.notifications
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    data = generate_inventory(count)
+    # One more unit for every product whose stock limits allow it
+    delivery = [
+        (name, 1) for name, product in data.items()
+        if product["quantity"] + 1 >= product["min_stock"]
+        and (product["max_stock"] is None or product["quantity"] < product["max_stock"])
+    ]
+    
+    print(f"{'backend':>16} {'mode':>9} {'seconds':>9} {'notifications':>14}")
+    for label in ("json journal", "sqlite"):
+        for batched in (False, True):
+            with tempfile.TemporaryDirectory() as directory:
+                if label == "sqlite":
+                    repository = SqliteRepository(os.path.join(directory, "inventory.db"))
+                else:
+                    repository = JsonRepository(
+                        os.path.join(directory, "inventory.json"),
+                        journal=InventoryJournal(os.path.join(directory, "inventory.journal"))
+                    )
+                elapsed, notifications = run(repository, data, delivery, batched)
+            mode = "batch" if batched else "per-call"
+            print(f"{label:>16} {mode:>9} {elapsed:>9.3f} {notifications:>14}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Throughput of the bulk CSV import/export pipeline
+
+Run from the project root:
+    python -m benchmarks.bench_bulk_import [rows] [workers]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository
+from src.utils import bulk_import
+from benchmarks.synthetic import generate_inventory
+
+def write_input(file_path: str, count: int):
+    """Write a synthetic import file; every 50th row is invalid"""
+    with open(file_path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(bulk_import.IMPORT_FIELDS)
+        for i, (name, data) in enumerate(generate_inventory(count).items()):
+            quantity = "lots" if i % 50 == 0 else data["quantity"]
+            writer.writerow([name, quantity, data["value"], data["category"],
+                             data["description"], data["min_stock"],
+                             data["max_stock"] or "", data["sku"]])
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "import.csv")
+        write_input(source, count)
+        
+        for label, pool in (("1 process", 0), (f"pool ({workers or os.cpu_count()})", workers)):
+            start = time.perf_counter()
+            for _ in bulk_import.validate_rows(bulk_import.iter_rows(source), workers=pool):
+                pass
+            elapsed = time.perf_counter() - start
+            print(f"validate, {label:<12} {count / elapsed:>12,.0f} rows/s")
+        
+        controller = InventoryController(JsonRepository(os.path.join(directory, "inventory.json")))
+        start = time.perf_counter()
+        result = bulk_import.import_file(controller, source, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"import + commit          {count / elapsed:>12,.0f} rows/s "
+              f"({result.imported:,} imported, {result.rejected:,} rejected)")
+        
+        start = time.perf_counter()
+        exported = bulk_import.export_csv(
+            sorted(controller.get_all_products().values(), key=lambda p: -p.quantity),
+            os.path.join(directory, "export.csv")
+        )
+        elapsed = time.perf_counter() - start
+        print(f"export (sorted)          {exported / elapsed:>12,.0f} rows/s")
+        controller.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Forecast demand for many SKUs from a synthetic movement history
+
+Records 90 days of sales for every product, then times the first
+forecast_all() (reads the history and computes every rate), a repeat with
+nothing new, an update after a handful of new sales, and the hourly full
+recompute, with NumPy and with the pure-Python fallback. Also checks the
+estimated rates against the rates the sales were drawn from.
+
+Run from the project root:
+    python -m benchmarks.bench_forecast [products] [days]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from src.controllers import forecasting
+from src.controllers.forecasting import DemandForecaster, DAY
+from src.models.product import Product
+from src.storage import MovementLog
+from src.storage.movement_log import StockMovement
+from src.utils import numpy_support
+
+def fill(log: MovementLog, products, rates, days: int, now: float):
+    """Record `days` days of sales drawn around each product's daily rate"""
+    rng = random.Random(11)
+    start = now - days * DAY
+    for day in range(days):
+        movements = []
+        for product in products:
+            units = sum(1 for _ in range(4) if rng.random() < rates[product.name] / 4)
+            if units:
+                movements.append(StockMovement(start + (day + rng.random()) * DAY,
+                                               product.name, -units, 0, "sale"))
+        movements.sort()
+        log.record(movements)
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def run(log: MovementLog, products, now: float):
+    forecaster = DemandForecaster(log)
+    rows = []
+    elapsed, forecasts = timed(lambda: forecaster.forecast_all(products, now))
+    rows.append(("first forecast (reads history)", elapsed))
+    rows.append(("repeat, nothing new", timed(lambda: forecaster.forecast_all(products, now))[0]))
+    
+    rng = random.Random(5)
+    log.record([StockMovement(now, rng.choice(products).name, -1, 0, "sale") for _ in range(20)])
+    forecaster.mark_stale()
+    rows.append(("after 20 new sales", timed(lambda: forecaster.forecast_all(products, now + 1))[0]))
+    rows.append(("next hour (all rates)", timed(lambda: forecaster.forecast_all(products, now + 3600))[0]))
+    return rows, forecasts
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+    now = time.time()
+    rng = random.Random(3)
+    products = []
+    rates = {}
+    for i in range(count):
+        product = Product(f"Product {i:06d}", rng.randrange(0, 500))
+        product.created_ts = now - 2 * days * DAY
+        products.append(product)
+        rates[product.name] = rng.choice((0.0, 0.2, 0.5, 1.0, 2.0, 3.5))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        log = MovementLog(os.path.join(directory, "movements"))
+        elapsed, _ = timed(lambda: fill(log, products, rates, days, now))
+        recorded = sum(1 for _ in log.iter_movements())
+        print(f"{count:,} products, {days} days: {recorded:,} movements recorded in {elapsed:.1f} s")
+        
+        results = {}
+        for label in ("numpy", "pure python"):
+            if label == "pure python":
+                numpy_support.enabled = False
+            elif numpy_support.numpy() is None:
+                continue
+            try:
+                results[label] = run(log, products, now)
+            finally:
+                numpy_support.enabled = True
+        
+        print(f"{'case':>32} " + " ".join(f"{label:>12}" for label in results))
+        for index, (case, _) in enumerate(next(iter(results.values()))[0]):
+            print(f"{case:>32} " + " ".join(
+                f"{rows[index][1] * 1000:>9.1f} ms" for rows, _ in results.values()
+            ))
+        
+        forecasts = next(iter(results.values()))[1]
+        errors = [abs(forecasts[product.name].daily_demand - rates[product.name])
+                  for product in products if rates[product.name] > 0]
+        reorder = sum(1 for forecast in forecasts.values()
+                      if forecast.status == forecasting.REORDER_NOW)
+        print(f"Mean absolute error of the daily rate: {sum(errors) / len(errors):.3f} units; "
+              f"{reorder:,} products to reorder now")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Time startup loading of inventory.json through InventoryController
+
+Run from the project root:
+    python -m benchmarks.bench_load [count]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from src.models.product import Product
+from src.storage import JsonRepository
+from src.controllers.inventory_controller import InventoryController
+from benchmarks.synthetic import generate_inventory
+
+def legacy_from_dict(name: str, data: dict) -> Product:
+    """The previous load path: full __init__ (SKU hash, clock reads), then overwrite"""
+    product = Product(
+        name=name,
+        quantity=data.get("quantity", 0),
+        value=data.get("value", "0"),
+        category=data.get("category", "Uncategorized"),
+        description=data.get("description", ""),
+        min_stock=data.get("min_stock", 0),
+        max_stock=data.get("max_stock")
+    )
+    product.created_at = data.get("created_at")
+    product.updated_at = data.get("updated_at")
+    product.sku = data.get("sku", product.sku)
+    return product
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    data = generate_inventory(count)
+    per_100k = 100_000 / count
+    
+    start = time.perf_counter()
+    for name, product in data.items():
+        legacy_from_dict(name, product)
+    legacy = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for name, product in data.items():
+        Product.hydrate(name, product)
+    hydrate = time.perf_counter() - start
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "inventory.json")
+        with open(path, "w") as file:
+            json.dump(data, file, indent=4)
+        
+        start = time.perf_counter()
+        controller = InventoryController(JsonRepository(path))
+        startup = time.perf_counter() - start
+        controller.close()
+    
+    print(f"products:                 {count:,}")
+    print(f"legacy from_dict:         {legacy * per_100k:7.3f} s per 100k")
+    print(f"Product.hydrate:          {hydrate * per_100k:7.3f} s per 100k")
+    print(f"controller startup (I/O): {startup * per_100k:7.3f} s per 100k")
+
+if __name__ == "__main__":
+    main()
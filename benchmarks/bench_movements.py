@@ -0,0 +1,109 @@
+"""Record and query a large stock movement history
+
+Appends synthetic movements spread over a year (in batches, as commits do),
+then times a per-product history page, a one-week range across all
+products, paging through one product's whole history and a weekly summary.
+Also reports the cost the history adds to InventoryController.update_quantity.
+
+Run from the project root:
+    python -m benchmarks.bench_movements [movements] [products]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository, MovementLog
+from src.storage.movement_log import StockMovement
+from src.utils.journal import InventoryJournal
+
+YEAR = 365 * 24 * 3600
+WEEK = 7 * 24 * 3600
+
+def fill(log: MovementLog, count: int, products: int, start: float):
+    """Append `count` movements evenly spread over a year"""
+    rng = random.Random(7)
+    step = YEAR / count
+    batch = []
+    for i in range(count):
+        batch.append(StockMovement(start + i * step, f"Product {rng.randrange(products):06d}",
+                                   rng.choice((-3, -2, -1, -1, 1, 5)), rng.randrange(1000),
+                                   "adjust"))
+        if len(batch) == 1000:
+            log.record(batch)
+            batch = []
+    log.record(batch)
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def controller_overhead(directory: str, with_history: bool, updates: int = 5000) -> float:
+    """Microseconds per update_quantity"""
+    path = os.path.join(directory, "history" if with_history else "plain")
+    controller = InventoryController(
+        JsonRepository(os.path.join(path, "inventory.json"),
+                       journal=InventoryJournal(os.path.join(path, "inventory.journal"))),
+        movements=MovementLog(os.path.join(path, "movements")) if with_history else None
+    )
+    controller.add_product("Widget", 1_000_000)
+    elapsed, _ = timed(lambda: [controller.update_quantity("Widget", -1) for _ in range(updates)])
+    controller.close()
+    return elapsed / updates * 1e6
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    products = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    start = time.time() - YEAR
+    
+    with tempfile.TemporaryDirectory() as directory:
+        log = MovementLog(os.path.join(directory, "movements"))
+        elapsed, _ = timed(lambda: fill(log, count, products, start))
+        size = sum(os.path.getsize(os.path.join(log.directory, name))
+                   for name in os.listdir(log.directory))
+        print(f"Recorded {count:,} movements in {len(log.partitions())} partitions: "
+              f"{elapsed:.1f} s ({count / elapsed:,.0f}/s), {size / 1e6:.0f} MB on disk")
+        
+        name = "Product 000042"
+        middle = start + YEAR / 2
+        cases = [
+            ("product page (50, newest)", lambda: log.page(name, limit=50, newest_first=True)),
+            ("product, one month", lambda: list(log.iter_movements(name, middle, middle + 30 * 24 * 3600))),
+            ("all products, one week", lambda: list(log.iter_movements(None, middle, middle + WEEK))),
+            ("all products, page of 100", lambda: log.page(None, middle, limit=100)),
+            ("summary, one week", lambda: log.summarize(middle, middle + WEEK)),
+        ]
+        print(f"{'query':>28} {'ms':>9} {'results':>9}")
+        for label, function in cases:
+            elapsed, result = timed(function)
+            results = len(result.movements) if hasattr(result, "movements") else len(result)
+            print(f"{label:>28} {elapsed * 1000:>9.1f} {results:>9,}")
+        
+        # Walk one product's entire history page by page, tracking peak memory
+        tracemalloc.start()
+        pages = seen = 0
+        cursor = None
+        walk_start = time.perf_counter()
+        while True:
+            page = log.page(name, limit=100, cursor=cursor)
+            pages += 1
+            seen += len(page.movements)
+            cursor = page.cursor
+            if cursor is None:
+                break
+        elapsed = time.perf_counter() - walk_start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"Paged through {seen:,} movements of {name} in {pages} pages: "
+              f"{elapsed * 1000:.0f} ms, peak {peak / 1e6:.1f} MB")
+        
+        plain = controller_overhead(directory, False)
+        history = controller_overhead(directory, True)
+        print(f"update_quantity: {plain:.0f} us without history, {history:.0f} us with")
+
+if __name__ == "__main__":
+    main()
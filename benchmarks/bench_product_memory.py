@@ -0,0 +1,51 @@
+"""Compare memory use of the legacy dict-based Product with the slotted one
+
+Run from the project root:
+    python -m benchmarks.bench_product_memory [count]
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+from src.models.product import Product
+from benchmarks.synthetic import generate_inventory
+
+class LegacyProduct:
+    """The previous Product layout: a plain __dict__ with string fields"""
+    
+    def __init__(self, data: dict):
+        self.name = data["name"]
+        self.quantity = data["quantity"]
+        self.value = data["value"]
+        self.category = data["category"]
+        self.description = data["description"]
+        self.min_stock = data["min_stock"]
+        self.max_stock = data["max_stock"]
+        self.created_at = datetime.fromisoformat(data["created_at"]).isoformat()
+        self.updated_at = datetime.fromisoformat(data["updated_at"]).isoformat()
+        self.sku = data["sku"]
+
+def measure(build, data) -> int:
+    """Bytes allocated (and still alive) while building one object per product"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(name, product) for name, product in data.items()]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    data = generate_inventory(count)
+    
+    legacy = measure(lambda name, product: LegacyProduct(product), data)
+    compact = measure(Product.from_dict, data)
+    
+    print(f"products:        {count:,}")
+    print(f"legacy Product:  {legacy / 1024 / 1024:8.1f} MiB  ({legacy / count:6.0f} B/product)")
+    print(f"slotted Product: {compact / 1024 / 1024:8.1f} MiB  ({compact / count:6.0f} B/product)")
+    print(f"saving:          {100 * (1 - compact / legacy):8.1f} %")
+
+if __name__ == "__main__":
+    main()
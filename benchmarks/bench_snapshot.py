@@ -0,0 +1,47 @@
+"""Compare JSON and binary snapshots: file size, save time and load time
+
+Run from the project root:
+    python -m benchmarks.bench_snapshot [count ...]   (default: 10000 100000 1000000)
+"""
+
+import os
+import sys
+import tempfile
+import time
+from src.models.product import Product
+from src.storage import BinarySnapshotRepository, JsonRepository
+from benchmarks.synthetic import generate_inventory
+
+def measure(repository, products):
+    """Return (file size, save seconds, load seconds) for one repository"""
+    start = time.perf_counter()
+    repository.save_snapshot(repository.capture_snapshot(products))
+    save = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    loaded = {}
+    for op, name, data in repository.iter_load():
+        loaded[name] = data if op == "product" else Product.hydrate(name, data)
+    load = time.perf_counter() - start
+    assert len(loaded) == len(products)
+    return os.path.getsize(repository.file_path), save, load
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'products':>10} {'format':>7} {'size MiB':>9} {'save s':>8} {'load s':>8}")
+    for count in counts:
+        products = {
+            name: Product.hydrate(name, data)
+            for name, data in generate_inventory(count).items()
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            repositories = {
+                "json": JsonRepository(os.path.join(directory, "inventory.json")),
+                "binary": BinarySnapshotRepository(os.path.join(directory, "inventory.snap"))
+            }
+            for label, repository in repositories.items():
+                size, save, load = measure(repository, products)
+                print(f"{count:>10,} {label:>7} {size / 2**20:>9.2f} {save:>8.3f} {load:>8.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Time Validators.validate_bulk against the single-field validators
+
+tests/test_validators.py checks that both give the same verdicts; this
+only measures throughput, with and without NumPy.
+
+Run from the project root:
+    python -m benchmarks.bench_validators [rows]
+"""
+
+import sys
+import time
+from src.utils import numpy_support
+from src.utils.validators import Validators
+from benchmarks.synthetic import generate_inventory
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    
+    backends = [("pure Python", False)]
+    if numpy_support.numpy() is not None:
+        backends.insert(0, ("NumPy", True))
+    
+    data = generate_inventory(count)
+    names = list(data)
+    quantities = [str(product["quantity"]) for product in data.values()]
+    values = [f"${product['value']}" for product in data.values()]
+    
+    start = time.perf_counter()
+    for name, quantity, value in zip(names, quantities, values):
+        Validators.validate_product_name(name)
+        Validators.validate_quantity(quantity)
+        Validators.validate_value(value)
+    scalar = time.perf_counter() - start
+    print(f"single-field validators:   {count / scalar:>12,.0f} rows/s")
+    
+    for label, enabled in backends:
+        numpy_support.enabled = enabled
+        start = time.perf_counter()
+        Validators.validate_bulk(names, quantities, values)
+        bulk = time.perf_counter() - start
+        print(f"validate_bulk ({label + '):':<13}{count / bulk:>12,.0f} rows/s")
+    numpy_support.enabled = True
+
+if __name__ == "__main__":
+    main()
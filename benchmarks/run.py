@@ -0,0 +1,189 @@
+"""Benchmark suite for the controller, storage and view hot paths
+
+Times the operations below on synthetic inventories and writes the
+results as JSON. Given a baseline file from an earlier run, any case that
+got slower than the tolerance allows is reported and the run exits with
+status 1.
+
+Run from the project root:
+    python -m benchmarks.run                                  # 1k, 10k, 100k
+    python -m benchmarks.run --sizes 1000 1000000 --output results.json
+    python -m benchmarks.run --baseline results.json --tolerance 0.25
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+from src.controllers.inventory_controller import InventoryController
+from src.controllers.search_engine import ProductSearchEngine
+from src.storage import JsonRepository
+from src.views.product_list_model import ProductListModel
+from src.views.statistics_model import format_statistics
+from benchmarks.synthetic import generate_inventory
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+# Cases faster than this are too noisy to fail a run on
+MIN_COMPARABLE_SECONDS = 0.002
+# Fast cases keep repeating until they have run for this long
+MIN_MEASURE_SECONDS = 0.2
+MAX_REPEAT = 1000
+
+def measure(function: Callable[[], object], repeat: int,
+            setup: Callable[[], object] = None) -> float:
+    """Best wall time in seconds over at least `repeat` runs
+    
+    `setup` runs untimed before each run. As with timeit, the garbage
+    collector is paused while timing.
+    """
+    best = float("inf")
+    total = 0.0
+    runs = 0
+    gc.collect()
+    gc.disable()
+    try:
+        while runs < repeat or (total < MIN_MEASURE_SECONDS and runs < MAX_REPEAT):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed)
+            total += elapsed
+            runs += 1
+    finally:
+        gc.enable()
+    return best
+
+def bench_size(count: int, directory: str) -> Dict[str, float]:
+    """Run every case at one inventory size"""
+    repeat = 5 if count <= 10_000 else 3 if count <= 100_000 else 1
+    results = {}
+    
+    path = os.path.join(directory, f"inventory-{count}.json")
+    with open(path, "w") as file:
+        json.dump(generate_inventory(count), file, indent=4)
+    
+    # Snapshot mode: no journal, so save_products rewrites the whole file
+    controller = InventoryController(JsonRepository(path), autoload=False)
+    results["load_products"] = measure(controller.load_products, repeat)
+    results["save_products"] = measure(controller.save_products, repeat)
+    
+    names = list(controller.products)
+    rng = random.Random(7)
+    sample = [rng.choice(names) for _ in range(1_000)]
+    
+    def update_quantities():
+        for name in sample:
+            controller.update_quantity(name, 1)
+            controller.update_quantity(name, -1)
+    
+    # Per call: 2,000 updates per run
+    results["update_quantity"] = measure(update_quantities, repeat) / (2 * len(sample))
+    
+    results["get_low_stock_products (cold index)"] = measure(
+        controller.get_low_stock_products, repeat, setup=controller.index.invalidate
+    )
+    results["get_low_stock_products"] = measure(controller.get_low_stock_products, repeat)
+    results["get_total_value"] = measure(controller.get_total_value, repeat)
+    results["update_statistics"] = measure(
+        lambda: format_statistics(controller.get_statistics()), repeat
+    )
+    
+    model = ProductListModel()
+    for sort_by in ProductListModel.SORT_OPTIONS:
+        model.sort_by = sort_by
+        results[f"refresh_display (sort {sort_by}, cold)"] = measure(
+            lambda: model.rebuild_from(controller), repeat, setup=model.invalidate
+        )
+        # Cached ordering, as when switching back to a sort mode
+        results[f"refresh_display (sort {sort_by})"] = measure(
+            lambda: model.rebuild_from(controller), repeat
+        )
+    
+    # One quantity change patched into the cached orderings of every sort mode
+    product = controller.get_all_products()[sample[0]]
+    def reposition():
+        product.quantity += 1
+        model.reposition(product)
+    results["list_model.reposition"] = measure(reposition, repeat)
+    model.sort_by = "name"
+    model.search_text = "product 00"
+    # What a search costs while the background index build has not finished
+    results["search (scan, no index)"] = measure(
+        lambda: ProductSearchEngine.scan(controller.get_all_products(), model.search_text), repeat
+    )
+    results["search index build"] = measure(
+        lambda: controller.search_engine.build(controller.get_all_products()), repeat,
+        setup=controller.search_engine.invalidate
+    )
+    results["refresh_display (search)"] = measure(
+        lambda: model.rebuild_from(controller), repeat
+    )
+    
+    controller.autosave.stop()
+    return results
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            tolerance: float) -> List[str]:
+    """Describe every case that regressed beyond the tolerance"""
+    regressions = []
+    for case, seconds in results.items():
+        before = baseline.get(case)
+        if before is None or max(seconds, before) < MIN_COMPARABLE_SECONDS:
+            continue
+        if seconds > before * (1 + tolerance):
+            regressions.append(
+                f"{case}: {seconds * 1000:.3f} ms vs baseline {before * 1000:.3f} ms "
+                f"(+{(seconds / before - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inventory benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="inventory sizes to run (default: 1000 10000 100000)")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+    
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.sizes:
+            for case, seconds in bench_size(count, directory).items():
+                key = f"{case} @ {count}"
+                results[key] = seconds
+                print(f"{key:<50} {seconds * 1000:>12.3f} ms")
+    
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+    
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""Hammer one InventoryController from many threads and check its invariants
+
+Writer threads call the controller directly, others go through submit()
+(the single writer queue), and reader threads iterate snapshots and query
+statistics, indexes and search the whole time. Afterwards the script checks
+that every successful quantity delta is accounted for, that added and
+deleted products are where they should be, that the running statistics and
+indexes match a recomputation, that the movement history adds up to the
+same quantities, and that a reload from disk sees the same inventory.
+Exits with status 1 if any check fails; tests/test_stress.py runs a short
+version of the same checks.
+
+Run from the project root:
+    python -m benchmarks.stress_controller [seconds] [threads]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+from src.controllers.batch import BatchError
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository, MovementLog
+from src.utils.journal import InventoryJournal
+
+SEED_PRODUCTS = 500
+START_QUANTITY = 1_000_000  # Far from zero, so no delta is ever clamped
+
+class ThreadCheckingView:
+    """Stands in for MainWindow; counts events and the threads they arrive on"""
+    
+    def __init__(self):
+        self.events = 0
+        self.threads = Counter()
+        self._lock = threading.Lock()
+    
+    def on_inventory_changed(self, event):
+        with self._lock:
+            self.events += 1
+            self.threads[threading.current_thread().name] += 1
+
+class Worker(threading.Thread):
+    """Applies random changes and remembers the ones that succeeded"""
+    
+    def __init__(self, controller: InventoryController, seed: int, deadline: float,
+                 use_queue: bool):
+        super().__init__(name=f"{'submitter' if use_queue else 'writer'}-{seed}")
+        self.controller = controller
+        self.rng = random.Random(seed)
+        self.deadline = deadline
+        self.use_queue = use_queue
+        self.deltas: Counter = Counter()
+        self.alive: Dict[str, bool] = {}
+        self.operations = 0
+        self.rejected_batches = 0
+        self.error = None
+    
+    def call(self, function, *args):
+        if self.use_queue:
+            return self.controller.submit(function, *args).result()
+        return function(*args)
+    
+    def run(self):
+        try:
+            while time.perf_counter() < self.deadline:
+                self.step()
+                self.operations += 1
+        except Exception as e:
+            self.error = e
+    
+    def step(self):
+        controller, rng = self.controller, self.rng
+        roll = rng.random()
+        if roll < 0.6:
+            name = f"Seed {rng.randrange(SEED_PRODUCTS):04d}"
+            delta = rng.choice((-3, -2, -1, 1, 2, 3))
+            if self.call(controller.update_quantity, name, delta):
+                self.deltas[name] += delta
+        elif roll < 0.75:
+            name = f"{self.name} item {len(self.alive)}"
+            if self.call(controller.add_product, name, 5, "1.00", rng.choice("ABC")):
+                self.alive[name] = True
+        elif roll < 0.85:
+            added = [name for name, alive in self.alive.items() if alive]
+            if added:
+                name = rng.choice(added)
+                self.call(controller.delete_product, name)
+                self.alive[name] = False
+        else:
+            operations = [
+                ("adjust", f"Seed {rng.randrange(SEED_PRODUCTS):04d}", rng.choice((-1, 1)))
+                for _ in range(rng.randint(2, 20))
+            ]
+            if rng.random() < 0.3:
+                # Makes the whole batch fail and roll back
+                operations.append(("adjust", "No such product", 1))
+            try:
+                self.call(controller.apply_batch, operations)
+            except BatchError:
+                self.rejected_batches += 1
+                return
+            for _, name, delta in operations:
+                self.deltas[name] += delta
+
+class Reader(threading.Thread):
+    """Iterates snapshots and runs queries while the writers are busy"""
+    
+    def __init__(self, controller: InventoryController, seed: int, deadline: float):
+        super().__init__(name=f"reader-{seed}")
+        self.controller = controller
+        self.rng = random.Random(seed)
+        self.deadline = deadline
+        self.reads = 0
+        self.error = None
+    
+    def run(self):
+        controller = self.controller
+        try:
+            while time.perf_counter() < self.deadline:
+                snapshot = controller.get_all_products()
+                size = len(snapshot)
+                iterated = sum(1 for _ in snapshot.values())
+                if iterated != size:
+                    raise AssertionError(f"snapshot changed size during iteration: {size} -> {iterated}")
+                controller.get_statistics()
+                controller.get_low_stock_products()
+                controller.search(f"seed {self.rng.randrange(SEED_PRODUCTS):04d}")
+                self.reads += 1
+        except Exception as e:
+            self.error = e
+
+def check(controller: InventoryController, workers: List[Worker], failures: List[str]):
+    """Compare the final state with what the workers say they did"""
+    products = controller.get_all_products()
+    expected = Counter()
+    for worker in workers:
+        expected.update(worker.deltas)
+    for i in range(SEED_PRODUCTS):
+        name = f"Seed {i:04d}"
+        if products[name].quantity != START_QUANTITY + expected[name]:
+            failures.append(f"{name}: quantity {products[name].quantity}, "
+                            f"expected {START_QUANTITY + expected[name]}")
+    
+    for worker in workers:
+        for name, alive in worker.alive.items():
+            if (name in products) != alive:
+                failures.append(f"{name} should {'exist' if alive else 'be deleted'}")
+    
+    if not controller.verify_statistics():
+        failures.append("running statistics drifted from a full recomputation")
+    low_stock = {name for name, product in products.items() if product.is_low_stock()}
+    if set(controller.get_low_stock_products()) != low_stock:
+        failures.append("low stock index disagrees with the products")
+    for worker in workers:
+        for name, alive in worker.alive.items():
+            if alive and name not in controller.search(name.lower()):
+                failures.append(f"search does not find {name}")
+    
+    recorded = Counter()
+    for movement in controller.movements.iter_movements():
+        recorded[movement.name] += movement.delta
+    for i in range(SEED_PRODUCTS):
+        name = f"Seed {i:04d}"
+        if recorded[name] != products[name].quantity:
+            failures.append(f"{name}: movement history adds up to {recorded[name]}, "
+                            f"quantity is {products[name].quantity}")
+
+def stress(directory: str, seconds: float,
+           threads: int) -> Tuple[List[str], List[Worker], List[Reader], ThreadCheckingView]:
+    """Run the workers against a new inventory in `directory`; returns the failed checks"""
+    failures: List[str] = []
+    
+    def repository():
+        return JsonRepository(
+            os.path.join(directory, "inventory.json"),
+            journal=InventoryJournal(os.path.join(directory, "inventory.journal"))
+        )
+    
+    controller = InventoryController(
+        repository(), movements=MovementLog(os.path.join(directory, "movements"))
+    )
+    with controller.batch():
+        for i in range(SEED_PRODUCTS):
+            controller.add_product(f"Seed {i:04d}", START_QUANTITY, "2.50", "Seed")
+    view = ThreadCheckingView()
+    controller.set_view(view)
+    
+    deadline = time.perf_counter() + seconds
+    workers = [Worker(controller, seed, deadline, use_queue=seed % 2 == 1)
+               for seed in range(threads)]
+    readers = [Reader(controller, seed, deadline) for seed in range(max(2, threads // 2))]
+    for thread in workers + readers:
+        thread.start()
+    for thread in workers + readers:
+        thread.join()
+    
+    for thread in workers + readers:
+        if thread.error is not None:
+            failures.append(f"{thread.name} raised {thread.error!r}")
+    check(controller, workers, failures)
+    
+    final = {name: product.quantity for name, product in controller.get_all_products().items()}
+    controller.close()
+    reloaded = InventoryController(repository())
+    if {name: product.quantity for name, product in reloaded.get_all_products().items()} != final:
+        failures.append("reloading from disk gives a different inventory")
+    reloaded.close()
+    return failures, workers, readers, view
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    with tempfile.TemporaryDirectory() as directory:
+        failures, workers, readers, view = stress(directory, seconds, threads)
+    
+    operations = sum(worker.operations for worker in workers)
+    print(f"{len(workers)} writers ({sum(w.use_queue for w in workers)} via submit), "
+          f"{len(readers)} readers, {seconds:.0f} s")
+    print(f"Mutating calls:   {operations:,} ({operations / seconds:,.0f}/s), "
+          f"{sum(w.rejected_batches for w in workers)} batches rolled back")
+    print(f"Snapshot reads:   {sum(r.reads for r in readers):,}")
+    print(f"View events:      {view.events:,} from threads "
+          f"{', '.join(sorted({name.rstrip('0123456789-') for name in view.threads}))}")
+    if failures:
+        print(f"FAILED ({len(failures)} problems):")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All invariants hold")
+
+if __name__ == "__main__":
+    main()
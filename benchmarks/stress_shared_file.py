@@ -0,0 +1,129 @@
+"""Run several processes against one shared inventory file and check nothing is lost
+
+Each process opens the same inventory.json and journal, as two app
+instances or two workstations on a shared drive would. It applies random
+quantity deltas to the same products, adds products of its own and syncs
+now and then. A tiny journal limit makes the processes compact into fresh
+snapshots all the time. At the end, a fresh load must show every product
+each process added, and every seed product's quantity must equal its start
+plus the sum of all processes' deltas. In the shared movement history,
+every movement's resulting quantity must equal the running sum of the
+deltas before it, ending on the final quantity. Exits with status 1
+otherwise; tests/test_stress.py runs a short version of the same checks.
+
+Run from the project root:
+    python -m benchmarks.stress_shared_file [processes] [operations]
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository, MovementLog
+from src.utils.journal import InventoryJournal
+
+SEED_PRODUCTS = 20  # Few products, so processes keep touching the same ones
+START_QUANTITY = 1_000_000
+
+def open_controller(directory: str) -> InventoryController:
+    repository = JsonRepository(
+        os.path.join(directory, "inventory.json"),
+        journal=InventoryJournal(os.path.join(directory, "inventory.journal"), max_operations=50),
+        backups=1,
+        shared=True
+    )
+    movements = MovementLog(os.path.join(directory, "movements"), shared=True)
+    return InventoryController(repository, movements=movements)
+
+def worker(directory: str, index: int, operations: int, results):
+    controller = open_controller(directory)
+    rng = random.Random(index)
+    deltas = {}
+    added = []
+    for step in range(operations):
+        roll = rng.random()
+        if roll < 0.8:
+            name = f"Seed {rng.randrange(SEED_PRODUCTS):02d}"
+            delta = rng.choice((-2, -1, 1, 2))
+            if controller.update_quantity(name, delta):
+                deltas[name] = deltas.get(name, 0) + delta
+        elif roll < 0.9:
+            name = f"Process {index} item {len(added)}"
+            controller.add_product(name, 1, "1.00", "Stress")
+            added.append(name)
+        else:
+            controller.sync()
+        if step % 100 == 0:
+            controller.flush()
+    controller.close()
+    results.put((deltas, added))
+
+def stress(directory: str, processes: int, operations: int) -> Tuple[List[str], list, float]:
+    """Run the processes on a new inventory in `directory`; returns the failed checks"""
+    failures: List[str] = []
+    controller = open_controller(directory)
+    with controller.batch():
+        for i in range(SEED_PRODUCTS):
+            controller.add_product(f"Seed {i:02d}", START_QUANTITY, "2.50", "Seed")
+    controller.close()
+    
+    results = multiprocessing.Queue()
+    start = time.perf_counter()
+    workers = [
+        multiprocessing.Process(target=worker, args=(directory, index, operations, results))
+        for index in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    outcomes = [results.get() for _ in workers]
+    for process in workers:
+        process.join()
+    elapsed = time.perf_counter() - start
+    
+    reloaded = open_controller(directory)
+    products = reloaded.get_all_products()
+    expected = {f"Seed {i:02d}": START_QUANTITY for i in range(SEED_PRODUCTS)}
+    for deltas, added in outcomes:
+        for name, delta in deltas.items():
+            expected[name] += delta
+        failures.extend(f"{name} is missing" for name in added if name not in products)
+    for name, quantity in expected.items():
+        if products[name].quantity != quantity:
+            failures.append(f"{name}: quantity {products[name].quantity}, expected {quantity}")
+    
+    recorded = {}
+    for movement in reloaded.movements.iter_movements():
+        recorded[movement.name] = recorded.get(movement.name, 0) + movement.delta
+        if movement.quantity != recorded[movement.name]:
+            failures.append(f"{movement.name}: movement at {movement.timestamp:.6f} says "
+                            f"{movement.quantity}, deltas add up to {recorded[movement.name]}")
+    for name, quantity in expected.items():
+        if recorded.get(name) != quantity:
+            failures.append(f"{name}: movement history adds up to {recorded.get(name)}, "
+                            f"expected {quantity}")
+    reloaded.close()
+    return failures, outcomes, elapsed
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    with tempfile.TemporaryDirectory() as directory:
+        failures, outcomes, elapsed = stress(directory, processes, operations)
+    
+    changes = sum(len(deltas) for deltas, _ in outcomes)
+    print(f"{processes} processes x {operations} operations in {elapsed:.1f} s "
+          f"({processes * operations / elapsed:,.0f} operations/s)")
+    if failures:
+        print(f"FAILED ({len(failures)} problems):")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"No lost updates: {SEED_PRODUCTS} shared products, "
+          f"{sum(len(added) for _, added in outcomes)} products added")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Synthetic inventory generators shared by the benchmarks"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Any
+
+CATEGORIES = ["Electronics", "Hardware", "Office", "Grocery", "Apparel",
+              "Tools", "Garden", "Toys", "Health", "Automotive"]
+
+def generate_inventory(count: int, seed: int = 42) -> Dict[str, Dict[str, Any]]:
+    """Build inventory.json-shaped data for `count` products"""
+    rng = random.Random(seed)
+    base_time = datetime(2025, 1, 1)
+    data = {}
+    for i in range(count):
+        name = f"Product {i:07d}"
+        min_stock = rng.choice([0, 0, 5, 10, 20])
+        max_stock = rng.choice([None, None, 100, 500])
+        created = base_time + timedelta(seconds=rng.randint(0, 30_000_000))
+        data[name] = {
+            "name": name,
+            "quantity": rng.randint(0, 600),
+            "value": f"{rng.randint(0, 99_999) / 100:.2f}",
+            "category": rng.choice(CATEGORIES),
+            "description": f"Synthetic product number {i} for benchmarking",
+            "min_stock": min_stock,
+            "max_stock": max_stock,
+            "created_at": created.isoformat(),
+            "updated_at": (created + timedelta(seconds=rng.randint(0, 1_000_000))).isoformat(),
+            "sku": f"{rng.getrandbits(32):08X}"
+        }
+    return data
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Inventory Management System
+Headless command-line entry point (no GUI toolkit required)
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
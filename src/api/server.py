@@ -0,0 +1,319 @@
+"""Local HTTP/JSON API over InventoryController for scanners and POS terminals
+
+Start it from the project root:
+    python cli.py serve --port 8765
+
+Endpoints (request and response bodies are JSON):
+    GET  /products/<name>           one product, with its demand forecast
+    GET  /products?sku=&category=&status=&q=&limit=
+    POST /products/<name>/adjust    {"delta": -1, "reason": "sale"}  (reason optional)
+    POST /batch                     {"operations": [["adjust", "Widget", -2], ...]}
+    GET  /stats                     inventory totals
+    GET  /movements?product=&since=&until=&limit=&cursor=&order=oldest|newest
+    GET  /movements/summary?product=&since=&until=
+                                    units received and issued per product
+
+since/until are ISO dates or epoch seconds; a movements page carries a
+"cursor" to pass back for the next page (null on the last one).
+
+Reads run on worker threads, so a long batch or a wait for the shared store
+lock never stalls the event loop (and with it unrelated requests). They
+use the controller's read-only snapshots and indexes rather than holding
+its lock. Mutations are queued onto the controller's single writer thread
+(InventoryController.submit) and applied one after another. They go
+through the journal and autosave like any other change, so a request never
+writes a full snapshot itself.
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+from operator import attrgetter
+from urllib.parse import parse_qs, unquote, urlsplit
+from src.controllers.batch import BatchError
+from src.controllers.inventory_controller import InventoryController, STATUS_QUERIES
+from src.storage.movement_log import REASON_ADJUST, parse_time
+from src.utils import bulk_import
+from src.config.settings import (
+    API_HOST, API_PORT, API_MAX_BODY_BYTES, API_PAGE_LIMIT, MOVEMENT_PAGE_LIMIT, SHARED_POLL_MS
+)
+
+logger = logging.getLogger(__name__)
+
+Response = Tuple[int, Any]
+
+class ApiError(Exception):
+    """A request failed with an HTTP status and a message for the client"""
+    
+    def __init__(self, status: int, message: str, **details):
+        super().__init__(message)
+        self.status = status
+        self.details = details
+    
+    def payload(self) -> Dict[str, Any]:
+        return {"error": str(self), **self.details}
+
+class InventoryApiServer:
+    """Serves the HTTP API for one controller on an asyncio event loop"""
+    
+    def __init__(self, controller, host: str = API_HOST, port: int = API_PORT):
+        self.controller = controller
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def start(self):
+        """Start listening; with port 0 the chosen port is stored in self.port"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Inventory API listening on http://%s:%d", self.host, self.port)
+    
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+    
+    async def close(self):
+        """Stop accepting connections; queued mutations finish when the controller closes"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Serve requests on one keep-alive connection until the client is done"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body, keep_alive = request
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except ApiError as e:
+                    status, payload = e.status, e.payload()
+                except Exception:
+                    logger.exception("API request failed: %s %s", method, target)
+                    status, payload = 500, {"error": "internal server error"}
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ApiError as e:
+            # Malformed request: answer once and drop the connection
+            self._write_response(writer, e.status, e.payload(), False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Parse one request; None when the client closed the connection"""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise ApiError(400, "malformed request line")
+        
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            field, _, value = line.decode("latin-1").partition(":")
+            headers[field.strip().lower()] = value.strip()
+        
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise ApiError(400, "invalid Content-Length")
+        if length > API_MAX_BODY_BYTES:
+            raise ApiError(413, f"request body is larger than {API_MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length > 0 else b""
+        
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+        return method.upper(), target, headers, body, keep_alive
+    
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any,
+                        keep_alive: bool):
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+    
+    async def dispatch(self, method: str, target: str, body: bytes) -> Response:
+        """Route a request to its handler; raises ApiError for client errors"""
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        
+        if parts[0] == "products":
+            if len(parts) == 1 and method == "GET":
+                return await self._read(self.list_products, query)
+            if len(parts) == 2 and method == "GET":
+                return await self._read(self.get_product, parts[1])
+            if len(parts) == 3 and parts[2] == "adjust" and method == "POST":
+                data = self._parse_body(body)
+                delta, reason = data.get("delta"), data.get("reason", REASON_ADJUST)
+                if not isinstance(delta, int) or isinstance(delta, bool):
+                    raise ApiError(400, "delta must be an integer")
+                if not isinstance(reason, str) or not reason:
+                    raise ApiError(400, "reason must be a non-empty string")
+                return await self._write(self.adjust, parts[1], delta, reason)
+        elif parts == ["batch"] and method == "POST":
+            operations = self._parse_body(body).get("operations")
+            if not isinstance(operations, list):
+                raise ApiError(400, "operations must be a list")
+            return await self._write(self.apply_batch, self._check_operations(operations))
+        elif parts == ["stats"] and method == "GET":
+            return await self._read(lambda: (200, self.controller.get_statistics()))
+        elif parts == ["movements"] and method == "GET":
+            return await self._read(self.list_movements, query)
+        elif parts == ["movements", "summary"] and method == "GET":
+            return await self._read(self.summarize_movements, query)
+        raise ApiError(404, f"no route for {method} {url.path}")
+    
+    @staticmethod
+    def _parse_body(body: bytes) -> Dict[str, Any]:
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise ApiError(400, "request body is not valid JSON")
+        if not isinstance(data, dict):
+            raise ApiError(400, "request body must be a JSON object")
+        return data
+    
+    @staticmethod
+    def _check_operations(operations: list) -> list:
+        """Batch operations as tuples, rejecting malformed ones before they are queued"""
+        checked = []
+        for index, operation in enumerate(operations):
+            if isinstance(operation, list):
+                operation = tuple(operation)
+            error = InventoryController.check_operation(operation)
+            if error:
+                raise ApiError(400, f"Operation {index}: {error}", index=index)
+            checked.append(operation)
+        return checked
+    
+    async def _write(self, handler, *args) -> Response:
+        """Run a mutation on the controller's writer thread"""
+        return await asyncio.wrap_future(self.controller.submit(handler, *args))
+    
+    @staticmethod
+    async def _read(handler, *args) -> Response:
+        """Run a read on a worker thread, off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, handler, *args)
+    
+    @staticmethod
+    def _time_range(query: Dict[str, str]) -> Tuple[Optional[float], Optional[float]]:
+        try:
+            return tuple(parse_time(query[key]) if key in query else None
+                         for key in ("since", "until"))
+        except ValueError:
+            raise ApiError(400, "since and until must be ISO dates or epoch seconds")
+    
+    # Handlers; reads run on worker threads, writes on the writer thread
+    
+    def get_product(self, name: str) -> Response:
+        product = self.controller.get_product(name)
+        if product is None:
+            raise ApiError(404, f"no such product: {name}")
+        row = bulk_import.product_row(product)
+        forecast = self.controller.get_forecast(name)
+        return 200, {**row, "forecast": forecast._asdict() if forecast is not None else None}
+    
+    def list_products(self, query: Dict[str, str]) -> Response:
+        try:
+            limit = int(query.get("limit", API_PAGE_LIMIT))
+        except ValueError:
+            raise ApiError(400, "limit must be an integer")
+        status = query.get("status")
+        if status is not None and status not in STATUS_QUERIES:
+            raise ApiError(400, f"status must be one of: {', '.join(sorted(STATUS_QUERIES))}")
+        
+        controller = self.controller
+        if "sku" in query:
+            product = controller.get_by_sku(query["sku"])
+            products = [product] if product else []
+        elif "category" in query:
+            products = controller.get_products_by_category(query["category"]).values()
+        elif status:
+            products = controller.get_products_by_status(status).values()
+        else:
+            products = controller.get_all_products().values()
+        if query.get("q"):
+            matching = controller.search(query["q"])
+            products = [product for product in products if product.name in matching]
+        # Only the requested page is sorted, not every matching product
+        page = heapq.nsmallest(max(limit, 0), products, key=attrgetter("name"))
+        return 200, {
+            "total": len(products),
+            "products": [bulk_import.product_row(product) for product in page]
+        }
+    
+    def adjust(self, name: str, delta: int, reason: str = REASON_ADJUST) -> Response:
+        controller = self.controller
+        with controller.locked():
+            if not controller.update_quantity(name, delta, reason):
+                if controller.get_product(name) is None:
+                    raise ApiError(404, f"no such product: {name}")
+                raise ApiError(409, f"quantity change of {delta:+d} is outside the stock limits")
+            return 200, bulk_import.product_row(controller.get_product(name))
+    
+    def apply_batch(self, operations: list) -> Response:
+        try:
+            count = self.controller.apply_batch(operations)
+        except BatchError as e:
+            raise ApiError(409, str(e), index=e.index)
+        return 200, {"applied": count}
+    
+    def list_movements(self, query: Dict[str, str]) -> Response:
+        start, end = self._time_range(query)
+        try:
+            limit = int(query.get("limit", MOVEMENT_PAGE_LIMIT))
+        except ValueError:
+            raise ApiError(400, "limit must be an integer")
+        if query.get("order", "oldest") not in ("oldest", "newest"):
+            raise ApiError(400, "order must be oldest or newest")
+        try:
+            page = self.controller.get_movements(
+                query.get("product"), start, end, limit, query.get("cursor"),
+                newest_first=query.get("order") == "newest"
+            )
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return 200, {
+            "movements": [movement.to_dict() for movement in page.movements],
+            "cursor": page.cursor
+        }
+    
+    def summarize_movements(self, query: Dict[str, str]) -> Response:
+        start, end = self._time_range(query)
+        return 200, self.controller.summarize_movements(start, end, query.get("product"))
+
+def serve(controller, host: str = API_HOST, port: int = API_PORT):
+    """Run the API until interrupted (Ctrl+C)"""
+    # Keep up with the GUI or other servers writing the same inventory
+    controller.watch(SHARED_POLL_MS / 1000)
+    server = InventoryApiServer(controller, host, port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -5,7 +5,8 @@ class InventoryApp:
     """Main application class"""
     
     def __init__(self):
-        self.controller = InventoryController()
+        # The window loads the inventory itself so it can show progress
+        self.controller = InventoryController(autoload=False)
         self.view = MainWindow(self.controller)
     
     def run(self):
@@ -0,0 +1,355 @@
+"""Headless command-line interface for batch jobs and scripts
+
+Uses InventoryController directly, without importing any GUI toolkit.
+Run from the project root:
+    python cli.py add "USB Cable" --quantity 40 --value 4.99 --category Electronics
+    python cli.py adjust "USB Cable" -5 --reason sale
+    python cli.py query --status low --format json
+    python cli.py stats
+    python cli.py history "USB Cable" --since 2026-10-01
+    python cli.py history --summary --since 2026-10-12
+    python cli.py forecast
+    python cli.py export backup.json
+    python cli.py import delivery.csv --report delivery-errors.csv
+    python cli.py export low-stock.csv --status low --sort quantity
+    python cli.py serve --port 8765
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import List, Optional
+from src.models.product import Product
+from src.utils import bulk_import
+from src.utils.validators import Validators
+from src.config.settings import API_HOST, API_PORT, MOVEMENT_PAGE_LIMIT
+
+logger = logging.getLogger("src.cli")
+
+class CliError(Exception):
+    """A command failed; the message is reported on stderr"""
+
+def _is_bulk_file(file_path: str) -> bool:
+    return file_path.lower().endswith((".csv", ".jsonl", ".ndjson"))
+
+def _check(valid: bool, error: Optional[str]):
+    if not valid:
+        raise CliError(error)
+
+def cmd_add(controller, args):
+    _check(*Validators.validate_product_name(args.name))
+    valid, error, quantity = Validators.validate_quantity(str(args.quantity))
+    _check(valid, error)
+    valid, error, value = Validators.validate_value(args.value)
+    _check(valid, error)
+    _check(*Validators.validate_category(args.category))
+    _check(*Validators.validate_description(args.description))
+    
+    if not controller.add_product(
+        name=args.name.strip(),
+        quantity=quantity,
+        value=value,
+        category=args.category.strip() or "Uncategorized",
+        description=args.description.strip(),
+        min_stock=args.min_stock,
+        max_stock=args.max_stock
+    ):
+        raise CliError(f"Product already exists: {args.name}")
+    print(f"Added {args.name}")
+
+def cmd_adjust(controller, args):
+    product = controller.get_product(args.name)
+    if product is None:
+        raise CliError(f"No such product: {args.name}")
+    if not controller.update_quantity(args.name, args.delta, args.reason):
+        raise CliError(
+            f"Quantity change of {args.delta:+d} for {args.name} is outside its stock limits"
+        )
+    print(f"{args.name}: {product.quantity}")
+
+def cmd_delete(controller, args):
+    if controller.get_product(args.name) is None:
+        raise CliError(f"No such product: {args.name}")
+    controller.delete_product(args.name)
+    print(f"Deleted {args.name}")
+
+def _select(controller, args) -> List[Product]:
+    """Filter and sort products according to the query options"""
+    from src.views.product_list_model import ProductListModel
+    
+    if args.sku:
+        product = controller.get_by_sku(args.sku)
+        products = {product.name: product} if product else {}
+    elif args.category:
+        products = controller.get_products_by_category(args.category)
+    elif args.status:
+        products = controller.get_products_by_status(args.status)
+    else:
+        products = controller.get_all_products()
+    
+    model = ProductListModel()
+    model.sort_by = args.sort
+    matching = None
+    if args.text:
+        model.search_text = args.text.lower()
+        matching = controller.search(args.text)
+    rows = model.rebuild(products, matching)
+    if args.limit is not None:
+        rows = rows[:args.limit]
+    return rows
+
+def cmd_query(controller, args):
+    rows = _select(controller, args)
+    if args.format == "json":
+        json.dump([bulk_import.product_row(product) for product in rows], sys.stdout, indent=4)
+        print()
+    elif args.format == "csv":
+        bulk_import.write_csv(rows, sys.stdout)
+    else:
+        forecasts = controller.get_forecasts()
+        for product in rows:
+            forecast = forecasts.get(product.name)
+            print(f"{product.name:<30} {product.sku:<10} {product.quantity:>8} "
+                  f"{product.value_cents / 100:>11.2f}  {product.category:<16} "
+                  f"{product.get_stock_status():<13} {forecast.status if forecast else ''}")
+
+def cmd_stats(controller, args):
+    stats = controller.get_statistics()
+    if args.format == "json":
+        json.dump(stats, sys.stdout, indent=4)
+        print()
+        return
+    print(f"Products:      {stats['total_products']}")
+    print(f"Total value:   ${stats['total_value']:,.2f}")
+    print(f"Low stock:     {stats['low_stock']}")
+    print(f"Out of stock:  {stats['out_of_stock']}")
+    print(f"Overstocked:   {stats['overstocked']}")
+
+def cmd_history(controller, args):
+    from datetime import datetime
+    from src.storage.movement_log import parse_time
+    
+    start = parse_time(args.since) if args.since else None
+    end = parse_time(args.until) if args.until else None
+    if args.summary:
+        totals = controller.summarize_movements(start, end, args.name)
+        if args.format == "json":
+            json.dump(totals, sys.stdout, indent=4)
+            print()
+            return
+        for name in sorted(totals):
+            product = totals[name]
+            print(f"{name:<30} {product['received']:>8} in {product['issued']:>8} out "
+                  f"{product['movements']:>8} movements")
+        return
+    
+    page = controller.get_movements(args.name, start, end, args.limit, args.cursor,
+                                    newest_first=not args.oldest_first)
+    if args.format == "json":
+        json.dump({"movements": [movement.to_dict() for movement in page.movements],
+                   "cursor": page.cursor}, sys.stdout, indent=4)
+        print()
+        return
+    for movement in page.movements:
+        when = datetime.fromtimestamp(movement.timestamp).isoformat(" ", "seconds")
+        print(f"{when}  {movement.name:<30} {movement.delta:>+8} {movement.quantity:>8}  "
+              f"{movement.reason}")
+    if page.cursor:
+        print(f"More: --cursor {page.cursor}", file=sys.stderr)
+
+def cmd_forecast(controller, args):
+    from src.controllers.forecasting import NO_DEMAND, REORDER_NOW, REORDER_SOON
+    
+    forecasts = controller.get_forecasts()
+    if args.name:
+        if args.name not in forecasts:
+            raise CliError(f"No such product: {args.name}")
+        forecasts = {args.name: forecasts[args.name]}
+    elif not args.all:
+        forecasts = {name: forecast for name, forecast in forecasts.items()
+                     if forecast.status in (REORDER_NOW, REORDER_SOON)}
+    # Soonest stockout first; products without demand last
+    names = sorted(forecasts, key=lambda name: (
+        forecasts[name].status == NO_DEMAND, forecasts[name].days_until_stockout or 0, name
+    ))
+    if args.limit is not None:
+        names = names[:args.limit]
+    
+    if args.format == "json":
+        json.dump({name: forecasts[name]._asdict() for name in names}, sys.stdout, indent=4)
+        print()
+        return
+    print(f"{'product':<30} {'qty':>8} {'per day':>9} {'reorder at':>10} {'days left':>9}  status")
+    for name in names:
+        forecast = forecasts[name]
+        days_left = forecast.days_until_stockout
+        print(f"{name:<30} {controller.get_product(name).quantity:>8} "
+              f"{forecast.daily_demand:>9.2f} {forecast.reorder_point:>10} "
+              f"{days_left if days_left is not None else float('inf'):>9.1f}  {forecast.status}")
+
+def cmd_import(controller, args):
+    if _is_bulk_file(args.file):
+        result = bulk_import.import_file(
+            controller, args.file,
+            report_path=args.report,
+            replace=args.replace,
+            workers=args.workers
+        )
+        print(f"Imported {result.imported} products, rejected {result.rejected} rows")
+        if result.report_path:
+            print(f"Errors written to {result.report_path}")
+            raise CliError("Some rows were rejected")
+        return
+    
+    with open(args.file, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if not isinstance(data, dict):
+        raise CliError(f"{args.file} is not in the inventory.json layout")
+    count = controller.import_products(data, replace=args.replace)
+    print(f"Imported {count} of {len(data)} products")
+
+def cmd_export(controller, args):
+    from src.utils.file_handler import FileHandler
+    
+    if args.file.lower().endswith(".csv"):
+        count = bulk_import.export_csv(_select(controller, args), args.file)
+        print(f"Exported {count} products to {args.file}")
+        return
+    
+    data = {product.name: product.to_dict() for product in _select(controller, args)}
+    if not FileHandler.save_inventory(args.file, data):
+        raise CliError(f"Could not write {args.file}")
+    print(f"Exported {len(data)} products to {args.file}")
+
+def cmd_serve(controller, args):
+    from src.api.server import serve
+    
+    print(f"Serving the inventory API on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    serve(controller, args.host, args.port)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Inventory Management System (headless)"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log debug output")
+    parser.add_argument("--profile", metavar="FILE", help="write a cProfile dump of the command")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    add = commands.add_parser("add", help="add a product")
+    add.add_argument("name")
+    add.add_argument("-q", "--quantity", type=int, required=True)
+    add.add_argument("--value", default="0")
+    add.add_argument("--category", default="Uncategorized")
+    add.add_argument("--description", default="")
+    add.add_argument("--min-stock", type=int, default=0)
+    add.add_argument("--max-stock", type=int)
+    add.set_defaults(handler=cmd_add)
+    
+    adjust = commands.add_parser("adjust", help="change a product's quantity by a delta")
+    adjust.add_argument("name")
+    adjust.add_argument("delta", type=int)
+    adjust.add_argument("--reason", default="adjust", help="recorded in the movement history")
+    adjust.set_defaults(handler=cmd_adjust)
+    
+    delete = commands.add_parser("delete", help="delete a product")
+    delete.add_argument("name")
+    delete.set_defaults(handler=cmd_delete)
+    
+    query = commands.add_parser("query", help="list products")
+    _add_filters(query)
+    query.add_argument("--format", choices=["table", "json", "csv"], default="table")
+    query.set_defaults(handler=cmd_query)
+    
+    stats = commands.add_parser("stats", help="show inventory totals")
+    stats.add_argument("--format", choices=["text", "json"], default="text")
+    stats.set_defaults(handler=cmd_stats)
+    
+    history = commands.add_parser("history", help="show stock movements, newest first")
+    history.add_argument("name", nargs="?", help="only this product")
+    history.add_argument("--since", help="ISO date/time or epoch seconds (inclusive)")
+    history.add_argument("--until", help="ISO date/time or epoch seconds (exclusive)")
+    history.add_argument("--limit", type=int, default=MOVEMENT_PAGE_LIMIT)
+    history.add_argument("--cursor", help="continue where the previous page stopped")
+    history.add_argument("--oldest-first", action="store_true")
+    history.add_argument("--summary", action="store_true",
+                         help="units received and issued per product instead")
+    history.add_argument("--format", choices=["table", "json"], default="table")
+    history.set_defaults(handler=cmd_history)
+    
+    forecast = commands.add_parser(
+        "forecast", help="show demand, reorder points and days until stockout"
+    )
+    forecast.add_argument("name", nargs="?", help="only this product")
+    forecast.add_argument("--all", action="store_true",
+                          help="include products that do not need reordering")
+    forecast.add_argument("--limit", type=int)
+    forecast.add_argument("--format", choices=["table", "json"], default="table")
+    forecast.set_defaults(handler=cmd_forecast)
+    
+    import_ = commands.add_parser(
+        "import", help="add products from a .csv, .jsonl or inventory.json file"
+    )
+    import_.add_argument("file")
+    import_.add_argument("--replace", action="store_true", help="overwrite existing products")
+    import_.add_argument("--report", help="CSV/JSONL error report path (default: <file>.errors.csv)")
+    import_.add_argument("--workers", type=int,
+                         help="CSV/JSONL validation processes (default: CPU count, 0: none)")
+    import_.set_defaults(handler=cmd_import)
+    
+    export = commands.add_parser(
+        "export", help="write products as .csv (filtered, sorted) or inventory.json"
+    )
+    export.add_argument("file")
+    _add_filters(export)
+    export.set_defaults(handler=cmd_export)
+    
+    serve = commands.add_parser("serve", help="run the local HTTP/JSON API")
+    serve.add_argument("--host", default=API_HOST)
+    serve.add_argument("--port", type=int, default=API_PORT)
+    serve.set_defaults(handler=cmd_serve)
+    return parser
+
+def _add_filters(parser: argparse.ArgumentParser):
+    """Options shared by query and CSV export"""
+    # Every command loads the controller anyway; this only moves the import earlier
+    from src.controllers.inventory_controller import STATUS_QUERIES
+    
+    parser.add_argument("text", nargs="?", help="search name, category, SKU and description")
+    filters = parser.add_mutually_exclusive_group()
+    filters.add_argument("--category")
+    filters.add_argument("--status", choices=sorted(STATUS_QUERIES))
+    filters.add_argument("--sku")
+    parser.add_argument("--sort", choices=["name", "quantity", "value", "category"], default="name")
+    parser.add_argument("--limit", type=int)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(levelname)s: %(message)s"
+    )
+    
+    from src.controllers.inventory_controller import InventoryController
+    from src.utils.instrumentation import instrumentation
+    if args.profile:
+        instrumentation.start_profile()
+    controller = None
+    try:
+        # Loading can fail too (e.g. the shared store's lock times out)
+        controller = InventoryController()
+        args.handler(controller, args)
+    except (CliError, OSError, ValueError, OverflowError) as e:
+        logger.error("%s", e)
+        return 1
+    finally:
+        # Writes out any snapshot the mutations scheduled
+        if controller is not None:
+            controller.close()
+        if args.profile:
+            instrumentation.stop_profile(args.profile)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,61 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 INVENTORY_FILE = os.path.join(DATA_DIR, "inventory.json")
 ASSETS_DIR = os.path.join(BASE_DIR, "src", "assets")
 
+# Storage Settings
+STORAGE_BACKEND = "json"  # "json" (inventory.json) or "sqlite"
+SQLITE_FILE = os.path.join(DATA_DIR, "inventory.db")
+STORAGE_MODE = "journal"  # JSON backend: "journal" (append-only log + snapshot) or "snapshot"
+SNAPSHOT_FORMAT = "json"  # JSON backend snapshot file: "json" or "binary" (compact, memory-mapped)
+BINARY_SNAPSHOT_FILE = os.path.join(DATA_DIR, "inventory.snap")
+
+JOURNAL_FILE = os.path.join(DATA_DIR, "inventory.journal")
+JOURNAL_MAX_OPERATIONS = 1000  # Compact after this many journaled mutations
+JOURNAL_MAX_BYTES = 1024 * 1024  # ...or once the journal grows past this size
+BACKUP_COUNT = 3  # Rotated snapshot backups kept as inventory.json.1, .2, ...
+STREAMING_LOAD_MIN_BYTES = 8 * 1024 * 1024  # Parse larger snapshots incrementally (None: never)
+AUTOSAVE_DELAY_MS = 500  # Idle time after the last change before saving
+AUTOSAVE_MAX_DELAY_MS = 5000  # Never hold back a save longer than this
+
+# Let several app instances (or workstations on a shared drive) open the same
+# inventory. Needs STORAGE_MODE = "journal"; SQLite does its own locking.
+SHARED_INVENTORY = False
+SHARED_LOCK_TIMEOUT = 10.0  # Seconds to wait for another process's write
+SHARED_POLL_MS = 1000  # How often the window picks up changes from other processes
+
+# Stock movement history: every quantity change with its time and reason,
+# stored in monthly partitions (python cli.py history)
+MOVEMENT_LOG_ENABLED = True
+MOVEMENT_LOG_DIR = os.path.join(DATA_DIR, "movements")
+MOVEMENT_PAGE_LIMIT = 50  # Movements per page when no limit is given
+
+# Demand forecasting from the movement history (python cli.py forecast)
+FORECAST_WINDOW_DAYS = 90  # Days of history the consumption rate is based on
+FORECAST_HALF_LIFE_DAYS = 14  # A day's weight in the smoothed rate halves after this many days
+FORECAST_LEAD_TIME_DAYS = 7  # Days between ordering and receiving stock
+FORECAST_SERVICE_LEVEL_Z = 1.65  # Safety stock in standard deviations (1.65: ~95% no stockout)
+FORECAST_REVIEW_DAYS = 7  # "Reorder Soon" when stock runs out within lead time plus this
+
+# Local HTTP API (python cli.py serve)
+API_HOST = "127.0.0.1"  # Use "0.0.0.0" to accept scanners and terminals on the network
+API_PORT = 8765
+API_MAX_BODY_BYTES = 1024 * 1024  # Larger request bodies are rejected with 413
+API_PAGE_LIMIT = 100  # Products returned by GET /products when no limit is given
+
 # UI Settings
 APP_TITLE = "Inventory Management System"
 APP_GEOMETRY = "1400x900"
 FONT_FAMILY = "Segoe UI"  # or "Arial" as fallback
+STATS_VERIFY_INTERVAL_MS = 60000  # Full recompute of the running statistics
+SEARCH_DEBOUNCE_MS = 200  # Wait for a pause in typing before searching
+UI_DISPATCH_POLL_MS = 50  # How often changes made by background threads reach the window
+
+# Performance Instrumentation
+# Time hot paths (saving, loading, list rebuilds, cards, search); also on when
+# the INVENTORY_PERF environment variable is set to 1
+PERF_INSTRUMENTATION = os.environ.get("INVENTORY_PERF", "") == "1"
+PERF_SAMPLE_WINDOW = 500  # Latest samples per timer used for p50/p99
+PERF_OVERLAY_REFRESH_MS = 1000
+PROFILE_DIR = os.path.join(DATA_DIR, "profiles")  # cProfile dumps (F9 in the app)
 
 # Colors
 COLORS = {
@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Callable, Dict, Any
+
+class AutosaveScheduler:
+    """Coalesces bursts of mutations into a single background save"""
+    
+    def __init__(self, save_callback: Callable[[], Any], delay: float = 0.5,
+                 max_delay: float = 5.0):
+        self.save_callback = save_callback
+        self.delay = delay
+        self.max_delay = max_delay
+        
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._retry_pending = False
+        self._saving = False
+        self._stopped = False
+        self._first_mark = 0.0
+        self._last_mark = 0.0
+        self._pending_marks = 0
+        
+        # Monitoring counters
+        self.marks = 0
+        self.saves = 0
+        self.coalesced_writes = 0
+        self.failed_saves = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        
+        self._worker = threading.Thread(
+            target=self._run, name="inventory-autosave", daemon=True
+        )
+        self._worker.start()
+    
+    def mark_dirty(self):
+        """Record a mutation; the save runs once the store has been idle for `delay`"""
+        with self._cond:
+            now = time.monotonic()
+            if not self._dirty:
+                self._dirty = True
+                self._first_mark = now
+            self._last_mark = now
+            self._pending_marks += 1
+            self.marks += 1
+            self._cond.notify_all()
+    
+    def flush(self):
+        """Save any pending changes now, waiting for an in-flight save to finish"""
+        with self._cond:
+            while self._saving:
+                self._cond.wait()
+            if not self._dirty and not self._retry_pending:
+                return
+            marks = self._begin_save()
+        self._save(marks)
+    
+    def stop(self):
+        """Flush pending changes and stop the worker thread"""
+        self.flush()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._worker.join(timeout=5)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get save counters and latencies (in milliseconds) for monitoring"""
+        with self._cond:
+            average = self.total_latency / self.saves if self.saves else 0.0
+            return {
+                "dirty": self._dirty or self._retry_pending,
+                "mutations": self.marks,
+                "saves": self.saves,
+                "failed_saves": self.failed_saves,
+                "coalesced_writes": self.coalesced_writes,
+                "last_latency_ms": self.last_latency * 1000,
+                "avg_latency_ms": average * 1000,
+                "max_latency_ms": self.max_latency * 1000
+            }
+    
+    def _run(self):
+        """Worker loop: wait for an idle window after the last mutation, then save"""
+        while True:
+            with self._cond:
+                while not self._dirty and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                
+                while self._dirty and not self._stopped:
+                    deadline = min(self._last_mark + self.delay,
+                                   self._first_mark + self.max_delay)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                
+                # A flush may have beaten us to it
+                if not self._dirty or self._saving or self._stopped:
+                    continue
+                marks = self._begin_save()
+            self._save(marks)
+    
+    def _begin_save(self) -> int:
+        """Claim the pending changes for one save (caller holds the condition)"""
+        marks = self._pending_marks
+        self._dirty = False
+        self._retry_pending = False
+        self._saving = True
+        self._pending_marks = 0
+        return marks
+    
+    def _save(self, marks: int):
+        """Run the save callback and record its latency"""
+        start = time.perf_counter()
+        failed = False
+        try:
+            if self.save_callback() is False:
+                failed = True
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter() - start
+        
+        with self._cond:
+            self._saving = False
+            if failed:
+                # Keep the changes pending so the next mutation or flush retries them
+                self.failed_saves += 1
+                self._retry_pending = True
+                self._pending_marks += marks
+            else:
+                self.saves += 1
+                self.coalesced_writes += max(0, marks - 1)
+                self.last_latency = elapsed
+                self.max_latency = max(self.max_latency, elapsed)
+                self.total_latency += elapsed
+            self._cond.notify_all()
+
@@ -0,0 +1,39 @@
+from typing import Callable, List, Optional
+from src.controllers.events import InventoryEvent
+from src.storage.base import LoadRecord
+from src.storage.movement_log import StockMovement
+
+class BatchError(Exception):
+    """A batched operation failed; every change in the batch was rolled back"""
+    
+    def __init__(self, message: str, index: Optional[int] = None):
+        super().__init__(message)
+        # Position of the failing operation in apply_batch(), if known
+        self.index = index
+
+class InventoryBatch:
+    """Changes collected by InventoryController.batch() until it commits"""
+    
+    def __init__(self):
+        self.records: List[LoadRecord] = []
+        self.events: List[InventoryEvent] = []
+        self.movements: List[StockMovement] = []
+        self._undo: List[Callable[[], None]] = []
+    
+    def add(self, record: LoadRecord, event: InventoryEvent, undo: Callable[[], None],
+            movement: Optional[StockMovement] = None):
+        """Queue a change to persist, the event to send and how to revert it"""
+        self.records.append(record)
+        self.events.append(event)
+        self._undo.append(undo)
+        if movement is not None:
+            self.movements.append(movement)
+    
+    def rollback(self):
+        """Revert every queued change, newest first"""
+        for undo in reversed(self._undo):
+            undo()
+        self.records.clear()
+        self.events.clear()
+        self.movements.clear()
+        self._undo.clear()
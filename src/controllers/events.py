@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Tuple
+from src.models.product import Product
+
+@dataclass(frozen=True)
+class InventoryEvent:
+    """Base class for change notifications sent from the controller to the view"""
+
+@dataclass(frozen=True)
+class ProductAdded(InventoryEvent):
+    """A new product was added"""
+    product: Product
+
+@dataclass(frozen=True)
+class ProductRemoved(InventoryEvent):
+    """A product was deleted"""
+    product: Product
+
+@dataclass(frozen=True)
+class QuantityChanged(InventoryEvent):
+    """A product's quantity changed from old_quantity to new_quantity"""
+    product: Product
+    old_quantity: int
+    new_quantity: int
+
+@dataclass(frozen=True)
+class BatchApplied(InventoryEvent):
+    """Several changes were committed together; events are in the order applied"""
+    events: Tuple[InventoryEvent, ...]
+
+@dataclass(frozen=True)
+class InventoryReloaded(InventoryEvent):
+    """The whole inventory was replaced; views should rebuild from scratch"""
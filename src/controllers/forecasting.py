@@ -0,0 +1,229 @@
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from src.models.product import Product
+from src.storage.movement_log import (
+    MovementLog, StockMovement, REASON_DELETED, REASON_IMPORT, REASON_INITIAL
+)
+from src.utils.numpy_support import numpy
+from src.config.settings import (
+    FORECAST_WINDOW_DAYS, FORECAST_HALF_LIFE_DAYS, FORECAST_LEAD_TIME_DAYS,
+    FORECAST_SERVICE_LEVEL_Z, FORECAST_REVIEW_DAYS
+)
+
+DAY = 24 * 3600
+COMPUTE_CHUNK = 8192  # Products per vectorized pass, to bound temporary arrays
+# Stock entering the inventory or leaving with a deleted product is not demand
+NON_DEMAND_REASONS = frozenset((REASON_INITIAL, REASON_IMPORT, REASON_DELETED))
+_UNSET = object()
+
+# Forecast statuses, shown alongside Product.get_stock_status()
+REORDER_NOW = "Reorder Now"
+REORDER_SOON = "Reorder Soon"
+HEALTHY = "Healthy"
+NO_DEMAND = "No Demand"
+
+class Forecast(NamedTuple):
+    """Demand estimate and reorder advice for one product"""
+    daily_demand: float  # Smoothed units issued per day
+    demand_std: float  # Day-to-day standard deviation of that demand
+    reorder_point: int  # Reorder once stock falls to this level
+    days_until_stockout: Optional[float]  # None without demand
+    status: str
+
+class DemandForecaster:
+    """Per-product consumption rates from the movement history, kept up to date
+    
+    Units issued per product are bucketed by UTC day over the last
+    `window_days`, in a ring of columns (one NumPy row per product when
+    NumPy is available). The daily rate is an exponentially weighted average
+    of those buckets, computed for many products at once; today counts for
+    the hours elapsed so far. Reorder point = rate x lead time plus safety
+    stock of `service_z` standard deviations over the lead time.
+    
+    New movements are read from the log after the last one seen, so only
+    products that moved are recomputed. Every rate is recomputed once an
+    hour as the day's weights shift.
+    """
+    
+    def __init__(self, movements: MovementLog, window_days: int = FORECAST_WINDOW_DAYS,
+                 half_life_days: float = FORECAST_HALF_LIFE_DAYS,
+                 lead_time_days: float = FORECAST_LEAD_TIME_DAYS,
+                 service_z: float = FORECAST_SERVICE_LEVEL_Z,
+                 review_days: float = FORECAST_REVIEW_DAYS):
+        self.movements = movements
+        self.window_days = window_days
+        self.decay = 0.5 ** (1 / half_life_days)
+        self.lead_time_days = lead_time_days
+        self.service_z = service_z
+        self.review_days = review_days
+        self._lock = threading.RLock()
+        # Log position after the last movement read; None before the first read
+        self._cursor: Optional[str] = None
+        self._stale = True
+        self._hour: Optional[int] = None
+        self._today = 0
+        self._rows: Dict[str, int] = {}
+        # Units issued per product (row) and day (column day % window_days),
+        # created with the backend on first use
+        self._np = _UNSET
+        self._demand = None
+        self._age: List[int] = []
+        self._weights: List[float] = []
+        self._exposure: List[float] = []
+        # name -> (daily demand, standard deviation); dropped when the product moves
+        self._rates: Dict[str, Tuple[float, float]] = {}
+    
+    def _backend(self):
+        """NumPy, or None for per-product loops; chosen once, as _demand depends on it"""
+        if self._np is _UNSET:
+            self._np = numpy()
+            self._demand = self._np.zeros((0, self.window_days)) if self._np is not None else []
+        return self._np
+    
+    def mark_stale(self):
+        """New movements were recorded; the next forecast reads them first"""
+        self._stale = True
+    
+    def refresh(self, now: Optional[float] = None) -> int:
+        """Read movements recorded since the last refresh; returns how many"""
+        now = time.time() if now is None else now
+        with self._lock:
+            np = self._backend()
+            self._advance(int(now // 3600))
+            if not self._stale:
+                return 0
+            self._stale = False
+            count = 0
+            issued: Dict[Tuple[int, int], int] = {}
+            start = (self._today - self.window_days + 1) * DAY
+            for cursor, movement in self.movements.iter_since(self._cursor, start):
+                self._add(movement, issued)
+                self._cursor = cursor
+                count += 1
+            if issued:
+                cells, units = zip(*issued.items())
+                if np is not None:
+                    rows, columns = zip(*cells)
+                    np.add.at(self._demand, (list(rows), list(columns)), units)
+                else:
+                    for (row, column), amount in zip(cells, units):
+                        self._demand[row][column] += amount
+            return count
+    
+    def _advance(self, hour: int):
+        """Move the window to the current hour, clearing days that fell out of it"""
+        if hour == self._hour:
+            return
+        np = self._backend()
+        today = hour // 24
+        if self._hour is not None and today != self._today:
+            for day in range(self._today + 1, min(today, self._today + self.window_days) + 1):
+                column = day % self.window_days
+                if np is not None:
+                    self._demand[:, column] = 0.0
+                else:
+                    for row in self._demand:
+                        row[column] = 0.0
+        self._hour, self._today = hour, today
+        
+        window = self.window_days
+        self._age = [(today - column) % window for column in range(window)]
+        self._weights = [self.decay ** age for age in self._age]
+        self._exposure = [1.0] * window
+        self._exposure[today % window] = (hour % 24 + 1) / 24
+        if np is not None:
+            self._age = np.array(self._age)
+            self._weights = np.array(self._weights)
+            self._exposure = np.array(self._exposure)
+        self._rates.clear()
+    
+    def _add(self, movement: StockMovement, issued: Dict[Tuple[int, int], int]):
+        """Count one movement's issued units into `issued` by (row, column) (lock held)"""
+        if movement.delta >= 0 or movement.reason in NON_DEMAND_REASONS:
+            return
+        day = min(int(movement.timestamp // DAY), self._today)
+        if day <= self._today - self.window_days:
+            return
+        row = self._rows.get(movement.name)
+        if row is None:
+            np = self._backend()
+            row = self._rows[movement.name] = len(self._rows)
+            if np is not None:
+                if row == len(self._demand):
+                    grown = np.zeros((max(64, 2 * row), self.window_days))
+                    grown[:row] = self._demand
+                    self._demand = grown
+            else:
+                self._demand.append([0.0] * self.window_days)
+        cell = (row, day % self.window_days)
+        issued[cell] = issued.get(cell, 0) - movement.delta
+        self._rates.pop(movement.name, None)
+    
+    def forecast(self, product: Product, now: Optional[float] = None) -> Forecast:
+        """Forecast for one product at its current quantity"""
+        return self.forecast_all([product], now)[product.name]
+    
+    def forecast_all(self, products: Iterable[Product],
+                     now: Optional[float] = None) -> Dict[str, Forecast]:
+        """Forecasts for many products, recomputing stale rates in one pass"""
+        products = list(products)
+        with self._lock:
+            if self._stale or self._hour != int((time.time() if now is None else now) // 3600):
+                self.refresh(now)
+            missing = [product for product in products
+                       if product.name in self._rows and product.name not in self._rates]
+            if missing:
+                self._compute(missing)
+            rates = self._rates
+            return {
+                product.name: self._forecast(product, *rates.get(product.name, (0.0, 0.0)))
+                for product in products
+            }
+    
+    def _compute(self, products: List[Product]):
+        """Exponentially weighted daily demand and its deviation (lock held)
+        
+        Days before a product was created do not count, and the exposure is
+        at least one day so a new product's first sale does not read as a
+        huge rate.
+        """
+        ages = [self._today - int(product.created_ts // DAY) for product in products]
+        np = self._backend()
+        if np is not None:
+            for first in range(0, len(products), COMPUTE_CHUNK):
+                chunk = products[first:first + COMPUTE_CHUNK]
+                demand = self._demand[[self._rows[product.name] for product in chunk]]
+                chunk_ages = np.array(ages[first:first + COMPUTE_CHUNK])
+                weights = np.where(self._age[None, :] <= chunk_ages[:, None], self._weights, 0.0)
+                exposure = np.maximum((weights * self._exposure).sum(axis=1), 1.0)
+                rates = (weights * demand).sum(axis=1) / exposure
+                deviations = demand - rates[:, None] * self._exposure
+                stds = np.sqrt((weights * deviations ** 2).sum(axis=1) / exposure)
+                for product, rate, std in zip(chunk, rates.tolist(), stds.tolist()):
+                    self._rates[product.name] = (rate, std)
+            return
+        
+        for product, product_age in zip(products, ages):
+            demand = self._demand[self._rows[product.name]]
+            columns = [column for column, age in enumerate(self._age) if age <= product_age]
+            exposure = max(sum(self._weights[c] * self._exposure[c] for c in columns), 1.0)
+            rate = sum(self._weights[c] * demand[c] for c in columns) / exposure
+            variance = sum(self._weights[c] * (demand[c] - rate * self._exposure[c]) ** 2
+                           for c in columns) / exposure
+            self._rates[product.name] = (rate, math.sqrt(variance))
+    
+    def _forecast(self, product: Product, rate: float, std: float) -> Forecast:
+        if rate <= 0:
+            return Forecast(0.0, 0.0, 0, None, NO_DEMAND)
+        lead_time = self.lead_time_days
+        reorder_point = math.ceil(rate * lead_time + self.service_z * std * math.sqrt(lead_time))
+        days_left = product.quantity / rate
+        if product.quantity <= reorder_point:
+            status = REORDER_NOW
+        elif days_left <= lead_time + self.review_days:
+            status = REORDER_SOON
+        else:
+            status = HEALTHY
+        return Forecast(rate, std, reorder_point, days_left, status)
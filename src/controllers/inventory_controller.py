@@ -1,110 +1,759 @@
-from typing import Dict, Optional
+import logging
+import math
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Optional, Any, Set, Callable, Iterable, Iterator, List, Mapping
 from src.models.product import Product
-from src.utils.file_handler import FileHandler
-from src.config.settings import INVENTORY_FILE
+from src.storage import InventoryRepository, create_repository, create_movement_log
+from src.storage.base import LoadRecord
+from src.storage.movement_log import (
+    MovementLog, MovementPage, StockMovement, REASON_ADJUST, REASON_DELETED, REASON_IMPORT,
+    REASON_INITIAL
+)
+from src.controllers.batch import BatchError, InventoryBatch
+from src.controllers.autosave import AutosaveScheduler
+from src.controllers.write_queue import WriteQueue
+from src.controllers.store_watcher import StoreWatcher
+from src.controllers.inventory_stats import InventoryStatistics
+from src.controllers.inventory_index import InventoryIndex
+from src.controllers.search_engine import ProductSearchEngine
+from src.controllers.forecasting import DemandForecaster, Forecast, REORDER_NOW, REORDER_SOON
+from src.controllers.events import (
+    InventoryEvent, ProductAdded, ProductRemoved, QuantityChanged, BatchApplied,
+    InventoryReloaded
+)
+from src.config.settings import AUTOSAVE_DELAY_MS, AUTOSAVE_MAX_DELAY_MS
+from src.utils.instrumentation import instrumentation
+from src.utils.validators import Validators, MAX_QUANTITY
+
+logger = logging.getLogger(__name__)
+
+# Keyword arguments accepted by add_product, as used by ("add", name, fields) batch operations
+BATCH_ADD_FIELDS = frozenset(
+    ("quantity", "value", "category", "description", "min_stock", "max_stock")
+)
+
+# Status names accepted by get_products_by_status (the CLI and API --status/status=)
+STATUS_QUERIES = {
+    "low": "get_low_stock_products",
+    "out": "get_out_of_stock_products",
+    "over": "get_overstocked_products",
+    "reorder": "get_reorder_products",
+    "reorder-soon": "get_reorder_soon_products"
+}
 
 class InventoryController:
-    """Enhanced controller managing inventory operations"""
+    """Enhanced controller managing inventory operations
+    
+    Thread safety: every mutation and every multi-step read holds one
+    re-entrant lock, so changes are applied one at a time. Readers that
+    iterate over all products get an immutable snapshot of the name ->
+    Product mapping from get_all_products(). It is copied only after a
+    product was added or removed, so it never changes size under them.
+    Background threads should hand mutations to submit(), which runs them in
+    order on a single writer thread. Change events are sent from the thread
+    that made the change; the view marshals them onto its own loop.
+    
+    Every quantity change is also recorded as a StockMovement in
+    `movements`, after the change itself is persisted. Without an explicit
+    repository both come from settings; with one, history is only kept when
+    a MovementLog is passed as well. `forecaster` derives consumption
+    rates, reorder points and days until stockout from that history.
+    """
     
-    def __init__(self):
-        self.file_handler = FileHandler()
+    def __init__(self, repository: Optional[InventoryRepository] = None,
+                 autoload: bool = True, movements: Optional[MovementLog] = None):
+        if repository is None:
+            repository = create_repository()
+            movements = movements or create_movement_log()
+        self.repository = repository
+        self.movements = movements
+        self.forecaster = DemandForecaster(movements) if movements is not None else None
+        # Result of the last get_forecasts(), read by get_cached_forecast()
+        self._forecasts: Dict[str, Forecast] = {}
         self.products: Dict[str, Product] = {}
+        self.statistics = InventoryStatistics()
+        self.index = InventoryIndex()
         self.view = None
-        self.load_products()
+        # Guards self.products, its derived structures and the repository
+        self._lock = threading.RLock()
+        self.search_engine = ProductSearchEngine(self._lock)
+        # Open InventoryBatch while inside batch(), otherwise None
+        self._batch: Optional[InventoryBatch] = None
+        # Read-only copy of self.products handed to readers; None once stale
+        self._snapshot: Optional[Mapping[str, Product]] = None
+        # Bumped whenever self.products is replaced wholesale (a load)
+        self.generation = 0
+        self.writer = WriteQueue()
+        self.watcher: Optional[StoreWatcher] = None
+        self.autosave = AutosaveScheduler(
+            self.save_products,
+            delay=AUTOSAVE_DELAY_MS / 1000,
+            max_delay=AUTOSAVE_MAX_DELAY_MS / 1000
+        )
+        if autoload:
+            self.load_products()
     
     def set_view(self, view):
         """Set the view to update when data changes"""
         self.view = view
     
-    def load_products(self):
-        """Load products from file"""
-        data = self.file_handler.load_inventory(INVENTORY_FILE)
-        self.products = {
-            name: Product.from_dict(name, product_data)
-            for name, product_data in data.items()
-        }
-    
-    def save_products(self):
-        """Save products to file"""
-        data = {
-            name: product.to_dict()
-            for name, product in self.products.items()
-        }
-        self.file_handler.save_inventory(INVENTORY_FILE, data)
+    @instrumentation.timed("load_products")
+    def load_products(self, progress: Optional[Callable[[float], None]] = None):
+        """Load products from the storage backend
+        
+        Products are built one at a time from the repository's load stream,
+        so the raw stored data is never held in memory all at once.
+        `progress` receives the completed fraction from 0.0 to 1.0.
+        """
+        with self._lock, self.repository.exclusive():
+            # Bulk path: build products directly from the stored fields
+            hydrate = Product.hydrate
+            now = time.time()
+            products: Dict[str, Product] = {}
+            for op, name, data in self.repository.iter_load(progress):
+                if op == "put":
+                    products[name] = hydrate(name, data, now)
+                elif op == "product":
+                    products[name] = data
+                elif op == "patch":
+                    product = products.get(name)
+                    if product is not None:
+                        for field, value in data.items():
+                            setattr(product, field, value)
+                elif op == "del":
+                    products.pop(name, None)
+                elif op == "reset":
+                    products.clear()
+            self.products = products
+            self._snapshot = None
+            self.generation += 1
+            self.statistics.rebuild(self.products.values())
+            self.index.invalidate()
+            self.search_engine.invalidate()
+    
+    @instrumentation.timed("save_products")
+    def save_products(self) -> bool:
+        """Save a full snapshot through the storage backend"""
+        with self._lock, self.repository.exclusive():
+            # Other processes' changes must be in the snapshot that replaces theirs
+            self._apply_external(self.repository.poll_external())
+            data = self.repository.capture_snapshot(self.products)
+            self.repository.begin_snapshot()
+        
+        # The slow part runs outside the lock so the UI can keep mutating
+        return self.repository.save_snapshot(data)
+    
+    def compact(self):
+        """Fold any incremental log into a fresh snapshot"""
+        self.save_products()
+    
+    def flush(self):
+        """Write any pending changes to disk before returning"""
+        self.autosave.flush()
+    
+    def close(self):
+        """Finish queued mutations, flush pending changes and release the storage backend"""
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.writer.close()
+        self.autosave.stop()
+        self.repository.close()
+    
+    def submit(self, function: Callable[..., Any], *args, **kwargs) -> Future:
+        """Run a mutation on the writer thread, after everything already submitted
+            
+            future = controller.submit(controller.update_quantity, "Widget", -1)
+            future.result()  # True, or raises whatever the call raised
+        """
+        return self.writer.submit(function, *args, **kwargs)
+    
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold off mutations so several reads see one consistent state"""
+        with self._lock:
+            yield
+    
+    def get_persistence_metrics(self) -> Dict[str, Any]:
+        """Get autosave latency and coalescing counters"""
+        return self.autosave.get_metrics()
+    
+    def _schedule_snapshot(self, wanted: bool):
+        """Queue a background snapshot when the repository asks for one"""
+        if wanted:
+            self.autosave.mark_dirty()
+    
+    @contextmanager
+    def batch(self) -> Iterator[InventoryBatch]:
+        """Group mutations into one transaction
+            
+            with controller.batch():
+                controller.update_quantity("Widget", 5)
+                controller.delete_product("Gadget")
+        
+        Changes are persisted with a single repository call and announced
+        with a single BatchApplied event when the block exits. If the block
+        raises, every change made inside it is undone and nothing is
+        written. The same happens if writing the batch fails. Nested
+        batches join the outermost one.
+        """
+        with self._lock:
+            if self._batch is not None:
+                yield self._batch
+                return
+            batch = self._batch = InventoryBatch()
+            try:
+                yield batch
+            except BaseException:
+                batch.rollback()
+                raise
+            finally:
+                self._batch = None
+            if batch.records:
+                self._persist(batch.records, batch.movements, batch.rollback)
+        if batch.events:
+            self._notify_view(BatchApplied(tuple(batch.events)))
+    
+    def apply_batch(self, operations: Iterable[tuple]) -> int:
+        """Apply operations all-or-nothing; returns how many were applied
+        
+        Each operation is one of:
+            ("add", name, {"quantity": ..., "value": ..., ...})  add_product fields
+            ("adjust", name, delta)  or  ("adjust", name, delta, reason)
+            ("delete", name)
+        Raises BatchError (with the failing index) after rolling everything
+        back if an operation is malformed, refers to a missing or existing
+        product, or breaks a product's stock limits.
+        """
+        operations = list(operations)
+        for index, operation in enumerate(operations):
+            error = self.check_operation(operation)
+            if error:
+                raise BatchError(f"Operation {index}: {error}", index)
+        
+        with self.batch():
+            for index, operation in enumerate(operations):
+                kind, name = operation[0], operation[1]
+                if kind == "add":
+                    applied = self.add_product(name, **operation[2])
+                    error = "product already exists"
+                elif kind == "adjust":
+                    applied = self.update_quantity(name, *operation[2:])
+                    error = ("no such product" if name not in self.products
+                             else "quantity outside stock limits")
+                else:
+                    applied = name in self.products
+                    self.delete_product(name)
+                    error = "no such product"
+                if not applied:
+                    raise BatchError(f"Operation {index} ({kind} {name!r}): {error}", index)
+        return len(operations)
+    
+    @staticmethod
+    def check_operation(operation) -> Optional[str]:
+        """Describe what is wrong with a batch operation's shape or fields, if anything"""
+        if not isinstance(operation, (tuple, list)) or len(operation) < 2:
+            return "expected a (kind, name, ...) tuple"
+        kind, name = operation[0], operation[1]
+        if not isinstance(name, str) or not name:
+            return "product name must be a non-empty string"
+        if kind == "add":
+            if len(operation) != 3 or not isinstance(operation[2], dict):
+                return "add takes (\"add\", name, fields)"
+            unknown = set(operation[2]) - BATCH_ADD_FIELDS
+            if unknown:
+                return f"unknown product fields: {', '.join(sorted(unknown))}"
+            return InventoryController._check_add_fields(operation[2])
+        elif kind == "adjust":
+            if (len(operation) not in (3, 4) or not isinstance(operation[2], int)
+                    or (len(operation) == 4 and not isinstance(operation[3], str))):
+                return "adjust takes (\"adjust\", name, integer_delta[, reason])"
+        elif kind == "delete":
+            if len(operation) != 2:
+                return "delete takes (\"delete\", name)"
+        else:
+            return f"unknown operation {kind!r}"
+        return None
+    
+    @staticmethod
+    def _check_add_fields(fields: Dict[str, Any]) -> Optional[str]:
+        """Describe what is wrong with the fields of an add operation, by the Validators rules"""
+        def is_int(number) -> bool:
+            return isinstance(number, int) and not isinstance(number, bool)
+        
+        quantity = fields.get("quantity")
+        if not is_int(quantity):
+            return "add requires an integer quantity"
+        if not 0 <= quantity <= MAX_QUANTITY:
+            return f"quantity must be between 0 and {MAX_QUANTITY}"
+        
+        value = fields.get("value", "0")
+        if is_int(value) or isinstance(value, float):
+            value = str(value)
+        if not isinstance(value, str):
+            return "value must be a number or a numeric string"
+        valid, error, parsed = Validators.validate_value(value)
+        if not valid:
+            return error
+        if not math.isfinite(float(parsed)):
+            return "Value must be a valid number"
+        
+        for field, validate in (("category", Validators.validate_category),
+                                ("description", Validators.validate_description)):
+            text = fields.get(field, "")
+            if not isinstance(text, str):
+                return f"{field} must be a string"
+            valid, error = validate(text)
+            if not valid:
+                return error
+        
+        for field in ("min_stock", "max_stock"):
+            limit = fields.get(field, 0)
+            if limit is None and field == "max_stock":
+                continue
+            if not is_int(limit) or not 0 <= limit <= MAX_QUANTITY:
+                return (f"{field} must be an integer between 0 and {MAX_QUANTITY}"
+                        + (" or null" if field == "max_stock" else ""))
+        return None
     
     def add_product(self, name: str, quantity: int, value: str = "0",
                    category: str = "Uncategorized", description: str = "",
                    min_stock: int = 0, max_stock: Optional[int] = None) -> bool:
         """Add a new product"""
-        if not name or name in self.products:
-            return False
-        
-        self.products[name] = Product(
-            name=name,
-            quantity=quantity,
-            value=value,
-            category=category,
-            description=description,
-            min_stock=min_stock,
-            max_stock=max_stock
-        )
-        self.save_products()
-        self._notify_view()
+        with self._lock:
+            if not name or name in self.products:
+                return False
+            
+            product = Product(
+                name=name,
+                quantity=quantity,
+                value=value,
+                category=category,
+                description=description,
+                min_stock=min_stock,
+                max_stock=max_stock
+            )
+            record = ("put", name, product.to_dict())
+            movement = self._movement(product, product.quantity, REASON_INITIAL, product.created_ts)
+            self._insert(product)
+            event = self._commit(
+                record, ProductAdded(product), partial(self._restore, name, None), movement
+            )
+        if event:
+            self._notify_view(event)
         return True
     
-    def update_quantity(self, name: str, delta: int) -> bool:
-        """Update product quantity"""
-        if name in self.products:
-            success = self.products[name].update_quantity(delta)
-            if success:
-                self.save_products()
-                self._notify_view()
-            return success
-        return False
+    def update_quantity(self, name: str, delta: int, reason: str = REASON_ADJUST) -> bool:
+        """Update product quantity, recording the movement with `reason`"""
+        with self._lock:
+            if name not in self.products:
+                return False
+            product = self.products[name]
+            old_quantity, old_updated_ts = product.quantity, product.updated_ts
+            if not product.update_quantity(delta):
+                return False
+            self.statistics.update(product)
+            self.index.update(product)
+            event = self._commit(
+                ("patch", name, {
+                    "quantity": product.quantity,
+                    "updated_at": product.updated_at,
+                    # Lets a shared store re-base this change onto another process's
+                    "delta": product.quantity - old_quantity
+                }),
+                QuantityChanged(product, old_quantity, product.quantity),
+                partial(self._restore_quantity, product, old_quantity, old_updated_ts),
+                self._movement(product, product.quantity - old_quantity, reason)
+            )
+        if event:
+            self._notify_view(event)
+        return True
     
     def delete_product(self, name: str):
         """Delete a product"""
+        with self._lock:
+            if name not in self.products:
+                return
+            product = self._discard(name)
+            event = self._commit(
+                ("del", name, None),
+                ProductRemoved(product),
+                partial(self._restore, name, product),
+                self._movement(product, -product.quantity, REASON_DELETED, time.time(), 0)
+            )
+        if event:
+            self._notify_view(event)
+    
+    def import_products(self, data: Dict[str, Dict[str, Any]], replace: bool = False) -> int:
+        """Add products given as {name: product_dict} (the inventory.json layout)
+        
+        Existing products are skipped unless `replace` is set. Returns the
+        number of products written. The import is a single batch.
+        """
+        imported = 0
+        with self.batch():
+            now = time.time()
+            for name, fields in data.items():
+                if not name or (name in self.products and not replace):
+                    continue
+                product = Product.hydrate(name, fields, now)
+                record = ("put", name, product.to_dict())
+                previous = self._discard(name) if name in self.products else None
+                if previous is not None:
+                    self._commit(("del", name, None), ProductRemoved(previous),
+                                 partial(self._restore, name, previous))
+                delta = product.quantity - (previous.quantity if previous is not None else 0)
+                movement = self._movement(product, delta, REASON_IMPORT, now)
+                self._insert(product)
+                self._commit(record, ProductAdded(product), partial(self._restore, name, None),
+                             movement)
+                imported += 1
+        return imported
+    
+    def _insert(self, product: Product):
+        """Add a product to the store and every derived structure, or to none of them
+        
+        A product with malformed fields (e.g. a string min_stock) fails in
+        the statistics or the index; it is taken out again before the error
+        is raised, as no undo step has been recorded for it yet.
+        """
+        self.products[product.name] = product
+        self._snapshot = None
+        try:
+            self.statistics.add(product)
+            self.index.add(product)
+            self.search_engine.add(product)
+        except BaseException:
+            self._discard(product.name)
+            raise
+    
+    def _discard(self, name: str) -> Product:
+        """Remove a product from the store and every derived structure"""
+        product = self.products.pop(name)
+        self._snapshot = None
+        self.statistics.remove(name)
+        self.index.remove(name)
+        self.search_engine.remove(name)
+        return product
+    
+    def _restore(self, name: str, previous: Optional[Product]):
+        """Undo step: put back `previous` (or nothing) under `name`"""
         if name in self.products:
-            del self.products[name]
-            self.save_products()
-            self._notify_view()
+            self._discard(name)
+        if previous is not None:
+            self._insert(previous)
     
-    def get_all_products(self) -> Dict[str, Product]:
-        """Get all products"""
-        return self.products
+    def _restore_quantity(self, product: Product, quantity: int, updated_ts: float):
+        """Undo step: put back a product's quantity and timestamp"""
+        product.quantity = quantity
+        product.updated_ts = updated_ts
+        self.statistics.update(product)
+        self.index.update(product)
+    
+    def _commit(self, record: LoadRecord, event: InventoryEvent, undo: Callable[[], None],
+                movement: Optional[StockMovement] = None) -> Optional[InventoryEvent]:
+        """Persist one change now, or queue it on the open batch
+        
+        Returns the event to send once the lock is released, or None when
+        the batch will send it.
+        """
+        if self._batch is not None:
+            self._batch.add(record, event, undo, movement)
+            return None
+        self._persist([record], [movement] if movement is not None else [], undo)
+        return event
+    
+    def _persist(self, records: List[LoadRecord], movements: List[StockMovement],
+                 undo: Callable[[], None]):
+        """Write committed changes, then record their movements (lock held)
+        
+        Holding the store lock throughout keeps the history in the same order
+        as the changes when several processes share the inventory. If the
+        changes cannot be written (or the store lock times out), `undo`
+        reverts them in memory before the error is raised again.
+        """
+        written = False
+        try:
+            with self.repository.exclusive():
+                self._schedule_snapshot(self.repository.apply_changes(records))
+                written = True
+                rebased = self._apply_external(self.repository.poll_external(check=False))
+                self._record_movements(movements, rebased > 0)
+        except BaseException:
+            if not written:
+                undo()
+            raise
+    
+    def _movement(self, product: Product, delta: int, reason: str,
+                  timestamp: Optional[float] = None,
+                  quantity: Optional[int] = None) -> Optional[StockMovement]:
+        """The StockMovement for a change, or None if nothing moved or history is off"""
+        if self.movements is None or not delta:
+            return None
+        return StockMovement(
+            product.updated_ts if timestamp is None else timestamp,
+            product.name,
+            delta,
+            product.quantity if quantity is None else quantity,
+            reason
+        )
+    
+    def _record_movements(self, movements: List[StockMovement], rebased: bool = False):
+        """Append committed movements to the history (lock held)
+        
+        `rebased` means other processes' changes were stored just before
+        these, so the resulting quantities are shifted onto theirs. The
+        changes themselves are already persisted, so a failure here is logged
+        rather than raised.
+        """
+        if not movements:
+            return
+        if rebased:
+            shift = {}
+            for movement in movements:
+                product = self.products.get(movement.name)
+                if product is not None:
+                    shift[movement.name] = product.quantity - movement.quantity
+            movements = [movement._replace(quantity=movement.quantity + shift.get(movement.name, 0))
+                         for movement in movements]
+        try:
+            self.movements.record(movements)
+        except OSError:
+            logger.exception("Could not record %d stock movements", len(movements))
+        self.forecaster.mark_stale()
+    
+    def get_movements(self, name: Optional[str] = None, start: Optional[float] = None,
+                      end: Optional[float] = None, limit: int = 100,
+                      cursor: Optional[str] = None, newest_first: bool = False) -> MovementPage:
+        """One page of stock movements with start <= timestamp < end
+        
+        Pass the returned cursor back with the same arguments for the next
+        page. Reads stream from disk and do not block mutations.
+        """
+        if self.movements is None:
+            return MovementPage([], None)
+        return self.movements.page(name, start, end, limit, cursor, newest_first)
+    
+    def summarize_movements(self, start: Optional[float] = None, end: Optional[float] = None,
+                            name: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Units received and issued per product between start and end"""
+        if self.movements is None:
+            return {}
+        return self.movements.summarize(start, end, name)
+    
+    def watch(self, interval: float):
+        """Apply other processes' changes every `interval` seconds (shared stores only)"""
+        if self.repository.shared and self.watcher is None:
+            self.watcher = StoreWatcher(self, interval)
+    
+    def sync(self) -> int:
+        """Pick up changes other processes saved to a shared store; returns how many"""
+        with self._lock:
+            return self._apply_external(self.repository.poll_external())
+    
+    def _apply_external(self, records: List[LoadRecord]) -> int:
+        """Apply records written by other processes and tell the view (lock held)
+        
+        They are already stored, so nothing is journaled or autosaved.
+        """
+        if not records:
+            return 0
+        events: List[InventoryEvent] = []
+        now = time.time()
+        for op, name, data in records:
+            if op == "sync":
+                events.extend(self._apply_sync(data, now))
+            elif op == "put":
+                if name in self.products:
+                    events.append(ProductRemoved(self._discard(name)))
+                product = Product.hydrate(name, data, now)
+                self._insert(product)
+                events.append(ProductAdded(product))
+            elif op == "patch" and name in self.products:
+                product = self.products[name]
+                old_quantity = product.quantity
+                self._set_quantity(product, data["quantity"], data["updated_at"])
+                if product.quantity != old_quantity:
+                    events.append(QuantityChanged(product, old_quantity, product.quantity))
+            elif op == "del" and name in self.products:
+                events.append(ProductRemoved(self._discard(name)))
+        if events:
+            if self.forecaster is not None:
+                # The other process recorded movements along with its changes
+                self.forecaster.mark_stale()
+            self._notify_view(events[0] if len(events) == 1 else BatchApplied(tuple(events)))
+        return len(events)
+    
+    def _apply_sync(self, data: Dict[str, Dict[str, Any]], now: float) -> List[InventoryEvent]:
+        """Bring every product in line with a full copy of the store"""
+        events: List[InventoryEvent] = []
+        for name in [name for name in self.products if name not in data]:
+            events.append(ProductRemoved(self._discard(name)))
+        for name, fields in data.items():
+            product = self.products.get(name)
+            if product is not None:
+                stored = product.to_dict()
+                if stored == fields:
+                    continue
+                stored.update(quantity=fields.get("quantity"), updated_at=fields.get("updated_at"))
+                if stored == fields:
+                    # Only the quantity moved: keep the Product the view is showing
+                    old_quantity = product.quantity
+                    self._set_quantity(product, fields["quantity"], fields["updated_at"])
+                    events.append(QuantityChanged(product, old_quantity, product.quantity))
+                    continue
+                events.append(ProductRemoved(self._discard(name)))
+            product = Product.hydrate(name, fields, now)
+            self._insert(product)
+            events.append(ProductAdded(product))
+        return events
+    
+    def _set_quantity(self, product: Product, quantity: int, updated_at: str):
+        """Take over a stored quantity without journaling it"""
+        product.quantity = quantity
+        product.updated_at = updated_at
+        self.statistics.update(product)
+        self.index.update(product)
+    
+    def get_all_products(self) -> Mapping[str, Product]:
+        """Get a read-only snapshot of all products, safe to iterate from any thread
+        
+        Quantity changes show up in the (shared) Product objects; products
+        added or removed afterwards do not change the returned mapping.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = MappingProxyType(dict(self.products))
+            return self._snapshot
     
     def get_product(self, name: str) -> Optional[Product]:
         """Get a specific product"""
         return self.products.get(name)
     
+    def prepare_search(self):
+        """Start building the search index in the background (e.g. once the GUI has loaded)"""
+        with self._lock:
+            self.search_engine.start_build(self.get_all_products())
+    
+    @instrumentation.timed("search")
+    def search(self, query: str) -> Set[str]:
+        """Names of products whose name, category, SKU or description contain the query
+        
+        Until the index is ready (it is built in the background, started
+        here if need be) the products are scanned without holding the lock.
+        """
+        with self._lock:
+            if self.search_engine.ready:
+                return self.search_engine.search(query)
+            products = self.get_all_products()
+            self.search_engine.start_build(products)
+        return ProductSearchEngine.scan(products, query)
+    
+    def get_by_sku(self, sku: str) -> Optional[Product]:
+        """Get a product by its SKU"""
+        with self._lock:
+            self.index.ensure(self.products)
+            name = self.index.by_sku.get(sku.strip().upper())
+            return self.products.get(name) if name is not None else None
+    
+    def get_products_by_category(self, category: str) -> Dict[str, Product]:
+        """Get products in a category"""
+        with self._lock:
+            self.index.ensure(self.products)
+            names = self.index.by_category.get(category, ())
+            return {name: self.products[name] for name in names}
+    
+    def _get_status_bucket(self, bucket: str) -> Dict[str, Product]:
+        """Get products in a stock status bucket via the index"""
+        with self._lock:
+            self.index.ensure(self.products)
+            return {name: self.products[name] for name in self.index.by_status[bucket]}
+    
     def get_low_stock_products(self) -> Dict[str, Product]:
         """Get products with low stock"""
-        return {
-            name: product
-            for name, product in self.products.items()
-            if product.is_low_stock()
-        }
+        return self._get_status_bucket("low_stock")
     
     def get_out_of_stock_products(self) -> Dict[str, Product]:
         """Get out of stock products"""
-        return {
-            name: product
-            for name, product in self.products.items()
-            if product.quantity == 0
-        }
+        return self._get_status_bucket("out_of_stock")
+    
+    def get_overstocked_products(self) -> Dict[str, Product]:
+        """Get overstocked products"""
+        return self._get_status_bucket("overstocked")
+    
+    def get_products_by_status(self, status: str) -> Dict[str, Product]:
+        """Get products by a status name from STATUS_QUERIES; raises ValueError otherwise"""
+        if status not in STATUS_QUERIES:
+            raise ValueError(f"status must be one of: {', '.join(sorted(STATUS_QUERIES))}")
+        return getattr(self, STATUS_QUERIES[status])()
+    
+    def get_forecast(self, name: str) -> Optional[Forecast]:
+        """Demand forecast and reorder advice for a product (None if unknown or no history)
+        
+        Like the other forecast queries, this reads new movements from the
+        history without holding the controller lock, so mutations go on.
+        """
+        product = self.products.get(name)
+        if product is None or self.forecaster is None:
+            return None
+        return self.forecaster.forecast(product)
+    
+    def get_forecasts(self) -> Dict[str, Forecast]:
+        """Forecasts for every product, computed together and kept for get_cached_forecast()"""
+        if self.forecaster is None:
+            return {}
+        forecasts = self.forecaster.forecast_all(self.get_all_products().values())
+        self._forecasts = forecasts
+        return forecasts
+    
+    def get_cached_forecast(self, name: str) -> Optional[Forecast]:
+        """A product's forecast from the last get_forecasts(), without reading the history
+        
+        For the Tk thread: reading the history may wait for the movement
+        log's (cross-process) lock, so views refresh forecasts on a worker.
+        """
+        return self._forecasts.get(name)
+    
+    def _get_forecast_bucket(self, status: str) -> Dict[str, Product]:
+        """Get products whose forecast has the given status"""
+        if self.forecaster is None:
+            return {}
+        products = self.get_all_products()
+        forecasts = self.forecaster.forecast_all(products.values())
+        return {name: products[name] for name, forecast in forecasts.items()
+                if forecast.status == status}
+    
+    def get_reorder_products(self) -> Dict[str, Product]:
+        """Get products at or below their forecast reorder point"""
+        return self._get_forecast_bucket(REORDER_NOW)
+    
+    def get_reorder_soon_products(self) -> Dict[str, Product]:
+        """Get products expected to reach their reorder point within the review period"""
+        return self._get_forecast_bucket(REORDER_SOON)
     
     def get_total_value(self) -> float:
-        """Calculate total inventory value"""
-        total = 0
-        for product in self.products.values():
-            try:
-                value = float(product.value) if product.value else 0
-                total += value * product.quantity
-            except ValueError:
-                pass
-        return total
-    
-    def _notify_view(self):
-        """Notify view to update display"""
-        if self.view:
+        """Get total inventory value from the running aggregates"""
+        return self.statistics.totals["value_cents"] / 100
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get running totals and per-category breakdowns"""
+        with self._lock:
+            return self.statistics.snapshot()
+    
+    def verify_statistics(self) -> bool:
+        """Recompute aggregates from scratch; False means drift was found and repaired"""
+        with self._lock:
+            return self.statistics.verify(self.products.values())
+    
+    def _notify_view(self, event: Optional[InventoryEvent] = None):
+        """Send a change event to the view, falling back to a full refresh"""
+        if not self.view:
+            return
+        if hasattr(self.view, "on_inventory_changed"):
+            self.view.on_inventory_changed(event or InventoryReloaded())
+        else:
             self.view.refresh_display()
\ No newline at end of file
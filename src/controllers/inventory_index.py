@@ -0,0 +1,96 @@
+from typing import Dict, Set, Optional, Tuple
+from src.models.product import Product
+
+class InventoryIndex:
+    """Secondary indexes over the product dict: category, stock status and SKU
+    
+    Maintained on every mutation; after a bulk load the index is only marked
+    stale and rebuilt on the first query.
+    """
+    
+    STATUS_BUCKETS = ("low_stock", "out_of_stock", "overstocked")
+    
+    def __init__(self):
+        self.by_category: Dict[str, Set[str]] = {}
+        self.by_status: Dict[str, Set[str]] = {bucket: set() for bucket in self.STATUS_BUCKETS}
+        self.by_sku: Dict[str, str] = {}  # Upper-cased SKU -> name
+        self._entries: Dict[str, Tuple[str, Tuple[str, ...], Optional[str]]] = {}
+        self._stale = True
+    
+    @staticmethod
+    def status_buckets(product: Product) -> Tuple[str, ...]:
+        """Stock status buckets a product belongs to (they can overlap)"""
+        buckets = []
+        if product.is_low_stock():
+            buckets.append("low_stock")
+        if product.quantity == 0:
+            buckets.append("out_of_stock")
+        if product.is_overstocked():
+            buckets.append("overstocked")
+        return tuple(buckets)
+    
+    def invalidate(self):
+        """Mark the index for a lazy rebuild (e.g. after load_products)"""
+        self._stale = True
+    
+    def ensure(self, products: Dict[str, Product]):
+        """Rebuild from the product dict if the index is stale"""
+        if not self._stale:
+            return
+        self.by_category = {}
+        self.by_status = {bucket: set() for bucket in self.STATUS_BUCKETS}
+        self.by_sku = {}
+        self._entries = {}
+        self._stale = False
+        for product in products.values():
+            self.add(product)
+    
+    def add(self, product: Product):
+        """Index a new product"""
+        if self._stale:
+            return
+        name = product.name
+        buckets = self.status_buckets(product)
+        sku = product.sku.upper() if product.sku else None
+        self.by_category.setdefault(product.category, set()).add(name)
+        for bucket in buckets:
+            self.by_status[bucket].add(name)
+        if sku:
+            self.by_sku[sku] = name
+        self._entries[name] = (product.category, buckets, sku)
+    
+    def remove(self, name: str):
+        """Drop a product from every index"""
+        if self._stale:
+            return
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+        category, buckets, sku = entry
+        names = self.by_category.get(category)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self.by_category[category]
+        for bucket in buckets:
+            self.by_status[bucket].discard(name)
+        if sku and self.by_sku.get(sku) == name:
+            del self.by_sku[sku]
+    
+    def update(self, product: Product):
+        """Re-index a product whose quantity changed; only the status buckets can move"""
+        if self._stale:
+            return
+        entry = self._entries.get(product.name)
+        if entry is None:
+            self.add(product)
+            return
+        category, old_buckets, sku = entry
+        new_buckets = self.status_buckets(product)
+        if new_buckets == old_buckets:
+            return
+        for bucket in old_buckets:
+            self.by_status[bucket].discard(product.name)
+        for bucket in new_buckets:
+            self.by_status[bucket].add(product.name)
+        self._entries[product.name] = (category, new_buckets, sku)
@@ -0,0 +1,116 @@
+from typing import Dict, Any, Iterable, Tuple
+from src.models.product import Product
+
+class InventoryStatistics:
+    """Running inventory aggregates, updated in O(1) per mutation
+    
+    Each product's last contribution is remembered so a change can be applied
+    as "subtract old, add new" without rescanning the inventory. Values are
+    summed in integer cents so repeated updates cannot drift.
+    """
+    
+    FIELDS = ("total", "low_stock", "out_of_stock", "overstocked", "value_cents")
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear all aggregates"""
+        self.totals: Dict[str, int] = dict.fromkeys(self.FIELDS, 0)
+        self.by_category: Dict[str, Dict[str, int]] = {}
+        self._contributions: Dict[str, Tuple[str, tuple]] = {}
+    
+    @staticmethod
+    def contribution(product: Product) -> tuple:
+        """A product's share of each aggregate, in FIELDS order"""
+        return (
+            1,
+            1 if product.is_low_stock() else 0,
+            1 if product.quantity == 0 else 0,
+            1 if product.is_overstocked() else 0,
+            product.value_cents * product.quantity
+        )
+    
+    def _apply(self, category: str, contribution: tuple, sign: int):
+        """Add or subtract one contribution from the totals and its category"""
+        bucket = self.by_category.get(category)
+        if bucket is None:
+            bucket = self.by_category[category] = dict.fromkeys(self.FIELDS, 0)
+        for field, amount in zip(self.FIELDS, contribution):
+            self.totals[field] += sign * amount
+            bucket[field] += sign * amount
+        if bucket["total"] == 0:
+            del self.by_category[category]
+    
+    def add(self, product: Product):
+        """Account for a new product"""
+        contribution = self.contribution(product)
+        self._contributions[product.name] = (product.category, contribution)
+        self._apply(product.category, contribution, 1)
+    
+    def remove(self, name: str):
+        """Stop accounting for a product"""
+        previous = self._contributions.pop(name, None)
+        if previous is not None:
+            self._apply(previous[0], previous[1], -1)
+    
+    def update(self, product: Product):
+        """Re-account for a product whose fields changed"""
+        self.remove(product.name)
+        self.add(product)
+    
+    def rebuild(self, products: Iterable[Product]):
+        """Recompute everything from scratch (bulk path used after a load)"""
+        self.reset()
+        contribution = self.contribution
+        contributions = self._contributions
+        sums: Dict[str, list] = {}
+        for product in products:
+            category = product.category
+            amounts = contribution(product)
+            contributions[product.name] = (category, amounts)
+            bucket = sums.get(category)
+            if bucket is None:
+                sums[category] = list(amounts)
+            else:
+                bucket[0] += amounts[0]
+                bucket[1] += amounts[1]
+                bucket[2] += amounts[2]
+                bucket[3] += amounts[3]
+                bucket[4] += amounts[4]
+        
+        for category, amounts in sums.items():
+            self.by_category[category] = dict(zip(self.FIELDS, amounts))
+            for field, amount in zip(self.FIELDS, amounts):
+                self.totals[field] += amount
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Current aggregates, with value converted to dollars"""
+        return {
+            "total_products": self.totals["total"],
+            "low_stock": self.totals["low_stock"],
+            "out_of_stock": self.totals["out_of_stock"],
+            "overstocked": self.totals["overstocked"],
+            "total_value": self.totals["value_cents"] / 100,
+            "by_category": {
+                category: {
+                    "total_products": bucket["total"],
+                    "low_stock": bucket["low_stock"],
+                    "out_of_stock": bucket["out_of_stock"],
+                    "overstocked": bucket["overstocked"],
+                    "total_value": bucket["value_cents"] / 100
+                }
+                for category, bucket in self.by_category.items()
+            }
+        }
+    
+    def verify(self, products: Iterable[Product]) -> bool:
+        """Recompute from scratch; returns False (and repairs) if the running totals drifted"""
+        fresh = InventoryStatistics()
+        fresh.rebuild(products)
+        if fresh.totals == self.totals and fresh.by_category == self.by_category:
+            return True
+        self.totals = fresh.totals
+        self.by_category = fresh.by_category
+        self._contributions = fresh._contributions
+        return False
@@ -0,0 +1,176 @@
+import threading
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+from src.models.product import Product
+
+class ProductSearchEngine:
+    """Substring search over name, category, SKU and description
+    
+    Each product's name, category and SKU form one short lowercase key that
+    is posted under every trigram. A query of three or more characters
+    intersects the postings of its trigrams before confirming candidates
+    with a substring check; a query that extends the previous one only
+    re-checks the previous result set. Descriptions are free text whose
+    trigrams would each post most of the catalogue, so they are kept
+    lowercased and scanned directly instead.
+    
+    The index is built on a background thread (start_build). Until it is
+    ready, scan() filters the products linearly. Changes made while it is
+    being built are replayed onto it before it is used.
+    """
+    
+    GRAM = 3
+    SEPARATOR = "\x00"  # Never typed, so no query matches across fields
+    
+    def __init__(self, lock: Optional[threading.RLock] = None):
+        # Held by the owner around add/remove/search, and here to install a build
+        self.lock = lock or threading.RLock()
+        self.keys: Dict[str, str] = {}
+        self.descriptions: Dict[str, str] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        self._last_query: Optional[str] = None
+        self._last_result: Set[str] = set()
+        self._stale = True
+        # Changes seen while a build runs, replayed once it is installed
+        self._pending: Optional[List[Tuple[str, object]]] = None
+        self._build_id = 0
+    
+    @classmethod
+    def search_key(cls, product: Product) -> str:
+        """Lowercase text a query is matched against"""
+        return cls.SEPARATOR.join((
+            product.name.lower(),
+            product.category.lower(),
+            (product.sku or "").lower(),
+            product.description.lower()
+        ))
+    
+    @classmethod
+    def _index_key(cls, product: Product) -> str:
+        """The trigram-indexed part of the search key (everything but the description)"""
+        return cls.SEPARATOR.join((
+            product.name.lower(),
+            product.category.lower(),
+            (product.sku or "").lower()
+        ))
+    
+    @classmethod
+    def _grams(cls, text: str) -> Set[str]:
+        """Distinct n-grams of a string"""
+        return {text[i:i + cls.GRAM] for i in range(len(text) - cls.GRAM + 1)}
+    
+    @property
+    def ready(self) -> bool:
+        return not self._stale
+    
+    @classmethod
+    def scan(cls, products: Mapping[str, Product], query: str) -> Set[str]:
+        """Linear search, used while the index is not ready"""
+        query = query.lower()
+        search_key = cls.search_key
+        return {name for name, product in products.items() if query in search_key(product)}
+    
+    def invalidate(self):
+        """Drop the index (e.g. after load_products); the next start_build rebuilds it"""
+        with self.lock:
+            self._stale = True
+            self._pending = None
+            self._build_id += 1
+    
+    def start_build(self, products: Mapping[str, Product]):
+        """Build the index from a snapshot on a background thread, unless one is running"""
+        with self.lock:
+            if not self._stale or self._pending is not None:
+                return
+            self._pending = []
+            build_id = self._build_id
+        threading.Thread(target=self.build, args=(products, build_id),
+                         name="search-index", daemon=True).start()
+    
+    def build(self, products: Mapping[str, Product], build_id: Optional[int] = None):
+        """Index a snapshot and install it; synchronous when called directly"""
+        with self.lock:
+            if build_id is None:
+                self._pending = []
+                build_id = self._build_id
+        keys: Dict[str, str] = {}
+        descriptions: Dict[str, str] = {}
+        postings: Dict[str, Set[str]] = {}
+        for product in products.values():
+            self._index(product, keys, descriptions, postings)
+        
+        with self.lock:
+            if build_id != self._build_id:
+                # Invalidated meanwhile; the snapshot is out of date
+                return
+            self.keys, self.descriptions, self.postings = keys, descriptions, postings
+            self._last_query = None
+            self._stale = False
+            pending, self._pending = self._pending or [], None
+            for op, item in pending:
+                if op == "add":
+                    self.add(item)
+                else:
+                    self.remove(item)
+    
+    @classmethod
+    def _index(cls, product: Product, keys: Dict[str, str], descriptions: Dict[str, str],
+               postings: Dict[str, Set[str]]):
+        key = keys[product.name] = cls._index_key(product)
+        if product.description:
+            descriptions[product.name] = product.description.lower()
+        for gram in cls._grams(key):
+            postings.setdefault(gram, set()).add(product.name)
+    
+    def add(self, product: Product):
+        """Index a product"""
+        if self._stale:
+            if self._pending is not None:
+                self._pending.append(("add", product))
+            return
+        self._index(product, self.keys, self.descriptions, self.postings)
+        if self._last_query is not None and self._matches(product.name, self._last_query):
+            self._last_result.add(product.name)
+    
+    def remove(self, name: str):
+        """Drop a product from the index"""
+        if self._stale:
+            if self._pending is not None:
+                self._pending.append(("remove", name))
+            return
+        key = self.keys.pop(name, None)
+        if key is None:
+            return
+        self.descriptions.pop(name, None)
+        for gram in self._grams(key):
+            names = self.postings.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self.postings[gram]
+        self._last_result.discard(name)
+    
+    def _matches(self, name: str, query: str) -> bool:
+        return query in self.keys[name] or query in self.descriptions.get(name, "")
+    
+    def search(self, query: str) -> Set[str]:
+        """Names of products whose search key contains the query (index must be ready)"""
+        query = query.lower()
+        if self._last_query is not None and self._last_query in query:
+            # Typing more characters can only narrow the previous result
+            result = {name for name in self._last_result if self._matches(name, query)}
+        else:
+            if len(query) >= self.GRAM:
+                grams = sorted(
+                    (self.postings.get(gram, set()) for gram in self._grams(query)),
+                    key=len
+                )
+                candidates = set.intersection(*grams) if grams else set()
+            else:
+                candidates = self.keys.keys()
+            keys = self.keys
+            result = {name for name in candidates if query in keys[name]}
+            # Descriptions are not in the trigram index
+            result.update(name for name, text in self.descriptions.items() if query in text)
+        self._last_query = query
+        self._last_result = result
+        return result
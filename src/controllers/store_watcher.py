@@ -0,0 +1,30 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class StoreWatcher:
+    """Polls a shared store for other processes' changes and applies them
+    
+    Each poll costs a stat of the journal and a read of the small .meta
+    file. Only changed products are applied and announced, so open windows
+    update without a restart.
+    """
+    
+    def __init__(self, controller, interval: float = 1.0):
+        self.controller = controller
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="inventory-watcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stopped.set()
+        self._thread.join(timeout=5)
+    
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.controller.sync()
+            except Exception as e:
+                logger.debug("Polling the shared inventory failed: %s", e)
@@ -0,0 +1,56 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+class WriteQueue:
+    """Runs submitted mutations one at a time, in order, on a single writer thread
+    
+    Background producers (the HTTP API, imports, scripts) submit work here
+    instead of calling the controller from their own threads, so at most one
+    of them writes at a time and callers can wait on the returned Future.
+    The thread starts with the first submission.
+    """
+    
+    def __init__(self, name: str = "inventory-writer"):
+        self.name = name
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+    
+    def submit(self, function: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue function(*args, **kwargs); the Future gets its result or exception"""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The write queue is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._queue.put((future, function, args, kwargs))
+        return future
+    
+    def close(self):
+        """Finish everything already queued, then stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, function, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
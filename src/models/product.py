@@ -1,8 +1,29 @@
+import math
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 class Product:
-    """Enhanced product model with additional fields"""
+    """Enhanced product model with additional fields
+    
+    Stored compactly: __slots__ instead of a per-instance __dict__, the price
+    as integer cents and timestamps as epoch seconds. The string forms used by
+    inventory.json are produced only at the serialization boundary. Stored
+    values those forms would not reproduce (legacy prices, timezone offsets,
+    date-only or non-existent local times, a null value) are kept as read, so
+    to_dict writes them back unchanged.
+    """
+    
+    __slots__ = (
+        "name", "quantity", "value_cents", "_value_text", "category",
+        "description", "min_stock", "max_stock", "created_ts", "updated_ts", "sku",
+        "_created_raw", "_updated_raw"
+    )
+    
+    # _value_text for a stored null value; never typed, like the search separator
+    NULL_VALUE = "\x00"
+    # Local "YYYY-MM-DDTHH" hours whose times format back unchanged (not a DST gap)
+    _local_hours: Dict[str, bool] = {}
     
     def __init__(self, name: str, quantity: int, value: str = "0", 
                  category: str = "Uncategorized", description: str = "",
@@ -14,8 +35,8 @@ class Product:
         self.description = description
         self.min_stock = min_stock
         self.max_stock = max_stock
-        self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.created_ts = self.updated_ts = time.time()
+        self._created_raw = self._updated_raw = None
         self.sku = self._generate_sku()
     
     def _generate_sku(self) -> str:
@@ -24,12 +45,109 @@ class Product:
         unique_string = f"{self.name}{datetime.now().timestamp()}"
         return hashlib.md5(unique_string.encode()).hexdigest()[:8].upper()
     
+    @staticmethod
+    def parse_cents(value) -> Optional[int]:
+        """Convert a price string such as "199.00" or "$1,299" to cents; None if not numeric"""
+        if value is None or value == "":
+            return 0
+        try:
+            cents = float(str(value).replace("$", "").replace(",", "")) * 100
+        except (ValueError, OverflowError):
+            return None
+        # "inf", "nan", "1e999" and amounts beyond the int64 column are not prices
+        if not math.isfinite(cents) or abs(cents) >= 2 ** 63:
+            return None
+        return round(cents)
+    
+    @property
+    def value(self) -> str:
+        """Unit price as the string stored in inventory.json ("" for a stored null)"""
+        if self._value_text is not None:
+            return "" if self._value_text == self.NULL_VALUE else self._value_text
+        return f"{self.value_cents / 100:.2f}"
+    
+    @value.setter
+    def value(self, value):
+        cents = self.parse_cents(value)
+        self.value_cents = cents if cents is not None else 0
+        if value is None:
+            self._value_text = self.NULL_VALUE
+            return
+        text = str(value)
+        # Keep the original text only when it isn't the canonical "12.34" form
+        # (legacy "597", non-numeric values), so to_dict round-trips exactly
+        if cents is not None and text == f"{cents / 100:.2f}":
+            self._value_text = None
+        else:
+            self._value_text = text
+    
+    @staticmethod
+    def parse_timestamp(value) -> float:
+        """Convert an ISO string (or epoch number) to epoch seconds"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            return time.time()
+    
+    @classmethod
+    def _read_timestamp(cls, value) -> Tuple[float, Optional[Tuple[float, Any]]]:
+        """Epoch seconds for a stored timestamp, and (seconds, value) to keep
+        when the local ISO form would not write `value` back unchanged"""
+        if not isinstance(value, str):
+            ts = cls.parse_timestamp(value)
+            return ts, (ts, value)
+        try:
+            ts = datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            ts = time.time()
+            return ts, (ts, value)
+        # Formatting every value to compare is slow. The date and hour are checked
+        # by formatting once per distinct prefix (which also catches DST gaps), the
+        # rest by shape: ":MM:SS" with no offset, and microseconds only if non-zero.
+        length = len(value)
+        if ((length == 19 or (length == 26 and value[19] == "." and value[20:] != "000000"))
+                and value[13] == ":" and value[16] == ":"):
+            hour = value[:13]
+            exact = cls._local_hours.get(hour)
+            if exact is None:
+                exact = cls._local_hours[hour] = datetime.fromtimestamp(ts).isoformat() == value
+            if exact:
+                return ts, None
+        return ts, (ts, value)
+    
+    @staticmethod
+    def _format_timestamp(ts: float, raw: Optional[Tuple[float, Any]]):
+        """The value read for `ts` if it is still current, otherwise the local ISO form"""
+        if raw is not None and raw[0] == ts:
+            return raw[1]
+        return datetime.fromtimestamp(ts).isoformat()
+    
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO string"""
+        return self._format_timestamp(self.created_ts, self._created_raw)
+    
+    @created_at.setter
+    def created_at(self, value):
+        self.created_ts, self._created_raw = self._read_timestamp(value)
+    
+    @property
+    def updated_at(self) -> str:
+        """Last update time as an ISO string"""
+        return self._format_timestamp(self.updated_ts, self._updated_raw)
+    
+    @updated_at.setter
+    def updated_at(self, value):
+        self.updated_ts, self._updated_raw = self._read_timestamp(value)
+    
     def to_dict(self) -> dict:
         """Convert product to dictionary for JSON storage"""
         return {
             "name": self.name,
             "quantity": self.quantity,
-            "value": self.value,
+            "value": None if self._value_text == self.NULL_VALUE else self.value,
             "category": self.category,
             "description": self.description,
             "min_stock": self.min_stock,
@@ -39,21 +157,88 @@ class Product:
             "sku": self.sku
         }
     
+    # Raw field order used by to_fields/from_fields (columnar snapshots).
+    # created_text/updated_text are the kept timestamp strings, usually None.
+    FIELDS = (
+        "name", "quantity", "value_cents", "value_text", "category", "description",
+        "min_stock", "max_stock", "created_ts", "updated_ts", "sku",
+        "created_text", "updated_text"
+    )
+    
+    @staticmethod
+    def _kept_text(ts: float, raw: Optional[Tuple[float, Any]]) -> Optional[str]:
+        if raw is not None and raw[0] == ts and isinstance(raw[1], str):
+            return raw[1]
+        return None
+    
+    def to_fields(self) -> tuple:
+        """Raw field values in FIELDS order, without any string formatting"""
+        return (
+            self.name, self.quantity, self.value_cents, self._value_text,
+            self.category, self.description, self.min_stock, self.max_stock,
+            self.created_ts, self.updated_ts, self.sku,
+            self._kept_text(self.created_ts, self._created_raw),
+            self._kept_text(self.updated_ts, self._updated_raw)
+        )
+    
+    @classmethod
+    def from_fields(cls, name, quantity, value_cents, value_text, category,
+                    description, min_stock, max_stock, created_ts, updated_ts, sku,
+                    created_text=None, updated_text=None):
+        """Rebuild a product from raw field values in FIELDS order"""
+        product = cls.__new__(cls)
+        product.name = name
+        product.quantity = quantity
+        product.value_cents = value_cents
+        product._value_text = value_text
+        product.category = category
+        product.description = description
+        product.min_stock = min_stock
+        product.max_stock = max_stock
+        product.created_ts = created_ts
+        product.updated_ts = updated_ts
+        product.sku = sku
+        product._created_raw = None if created_text is None else (created_ts, created_text)
+        product._updated_raw = None if updated_text is None else (updated_ts, updated_text)
+        return product
+    
     @classmethod
     def from_dict(cls, name: str, data: dict):
         """Create product from dictionary data"""
-        product = cls(
-            name=name,
-            quantity=data.get("quantity", 0),
-            value=data.get("value", "0"),
-            category=data.get("category", "Uncategorized"),
-            description=data.get("description", ""),
-            min_stock=data.get("min_stock", 0),
-            max_stock=data.get("max_stock")
-        )
-        product.created_at = data.get("created_at", datetime.now().isoformat())
-        product.updated_at = data.get("updated_at", datetime.now().isoformat())
-        product.sku = data.get("sku", product._generate_sku())
+        return cls.hydrate(name, data)
+    
+    @classmethod
+    def hydrate(cls, name: str, data: dict, now: Optional[float] = None):
+        """Build a product straight from stored fields, for bulk loads
+        
+        Bypasses __init__, so no SKU hash or clock read happens unless the
+        stored data lacks them. Pass `now` to share one clock read across a
+        whole load.
+        """
+        product = cls.__new__(cls)
+        product.name = name
+        product.quantity = data.get("quantity", 0)
+        product.value = data.get("value", "0")
+        product.category = data.get("category", "Uncategorized")
+        product.description = data.get("description", "")
+        product.min_stock = data.get("min_stock", 0)
+        product.max_stock = data.get("max_stock")
+        
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
+        if created_at is None or updated_at is None:
+            now = time.time() if now is None else now
+        if created_at is None:
+            product.created_ts, product._created_raw = now, None
+        else:
+            product.created_ts, product._created_raw = cls._read_timestamp(created_at)
+        if updated_at is None:
+            product.updated_ts, product._updated_raw = now, None
+        else:
+            product.updated_ts, product._updated_raw = cls._read_timestamp(updated_at)
+        
+        sku = data.get("sku")
+        product.sku = sku if sku is not None else product._generate_sku()
         return product
     
     def update_quantity(self, delta: int) -> bool:
@@ -67,7 +252,7 @@ class Product:
             return False
         
         self.quantity = new_quantity
-        self.updated_at = datetime.now().isoformat()
+        self.updated_ts = time.time()
         return True
     
     def is_low_stock(self) -> bool:
@@ -78,17 +263,23 @@ class Product:
         """Check if product is overstocked"""
         return self.max_stock and self.quantity >= self.max_stock
     
-    def get_stock_status(self) -> str:
-        """Get stock status string"""
-        if self.is_low_stock():
+    @staticmethod
+    def classify_stock(quantity: int, min_stock: int = 0,
+                       max_stock: Optional[int] = None) -> str:
+        """Get the stock status string for raw field values"""
+        if min_stock and min_stock > 0 and quantity <= min_stock:
             return "Low Stock"
-        elif self.is_overstocked():
+        elif max_stock and quantity >= max_stock:
             return "Overstocked"
-        elif self.quantity == 0:
+        elif quantity == 0:
             return "Out of Stock"
         else:
             return "In Stock"
     
+    def get_stock_status(self) -> str:
+        """Get stock status string"""
+        return self.classify_stock(self.quantity, self.min_stock, self.max_stock)
+    
     def get_status_color(self) -> str:
         """Get status color based on stock level"""
         if self.is_low_stock() or self.quantity == 0:
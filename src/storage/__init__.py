@@ -0,0 +1,83 @@
+import os
+from typing import Optional
+from src.models.product import Product
+from src.storage.base import InventoryRepository
+from src.storage.binary_repository import BinarySnapshotRepository
+from src.storage.binary_snapshot import capture_rows, write_snapshot
+from src.storage.json_repository import JsonRepository
+from src.storage.movement_log import MovementLog
+from src.storage.sqlite_repository import SqliteRepository
+from src.utils.file_handler import FileHandler
+from src.utils.journal import InventoryJournal
+from src.config import settings
+
+def create_repository() -> InventoryRepository:
+    """Build the storage backend selected by STORAGE_BACKEND in settings"""
+    journal = InventoryJournal(
+        settings.JOURNAL_FILE,
+        max_operations=settings.JOURNAL_MAX_OPERATIONS,
+        max_bytes=settings.JOURNAL_MAX_BYTES
+    ) if settings.STORAGE_MODE == "journal" else None
+    json_repository = JsonRepository(
+        settings.INVENTORY_FILE,
+        journal=journal,
+        backups=settings.BACKUP_COUNT,
+        streaming_min_bytes=settings.STREAMING_LOAD_MIN_BYTES,
+        shared=settings.SHARED_INVENTORY,
+        lock_timeout=settings.SHARED_LOCK_TIMEOUT
+    )
+    
+    if settings.SNAPSHOT_FORMAT == "json":
+        snapshot_repository = json_repository
+    elif settings.SNAPSHOT_FORMAT == "binary":
+        is_new = not os.path.exists(settings.BINARY_SNAPSHOT_FILE)
+        snapshot_repository = BinarySnapshotRepository(
+            settings.BINARY_SNAPSHOT_FILE,
+            journal=journal,
+            backups=settings.BACKUP_COUNT,
+            shared=settings.SHARED_INVENTORY,
+            lock_timeout=settings.SHARED_LOCK_TIMEOUT
+        )
+        if is_new and os.path.exists(settings.INVENTORY_FILE):
+            # First run on the binary format: convert the existing inventory.json.
+            # The journal is left in place; replaying it again is harmless.
+            products = {
+                name: Product.hydrate(name, data)
+                for name, data in json_repository.load().items()
+            }
+            FileHandler.atomic_write(
+                settings.BINARY_SNAPSHOT_FILE,
+                lambda file: write_snapshot(file, capture_rows(products.values()))
+            )
+    else:
+        raise ValueError(f"Unknown snapshot format: {settings.SNAPSHOT_FORMAT}")
+    
+    if settings.STORAGE_BACKEND == "json":
+        return snapshot_repository
+    
+    if settings.STORAGE_BACKEND == "sqlite":
+        is_new = not os.path.exists(settings.SQLITE_FILE)
+        repository = SqliteRepository(settings.SQLITE_FILE)
+        if is_new:
+            # First run on SQLite: carry over whatever the file store holds
+            data = snapshot_repository.load()
+            if data:
+                repository.save_snapshot(data)
+        return repository
+    
+    raise ValueError(f"Unknown storage backend: {settings.STORAGE_BACKEND}")
+
+def create_movement_log() -> Optional[MovementLog]:
+    """Build the stock movement history store, or None when it is disabled"""
+    if not settings.MOVEMENT_LOG_ENABLED:
+        return None
+    return MovementLog(
+        settings.MOVEMENT_LOG_DIR,
+        shared=settings.SHARED_INVENTORY,
+        lock_timeout=settings.SHARED_LOCK_TIMEOUT
+    )
+
+__all__ = [
+    'InventoryRepository', 'JsonRepository', 'BinarySnapshotRepository',
+    'SqliteRepository', 'MovementLog', 'create_repository', 'create_movement_log'
+]
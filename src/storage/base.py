@@ -0,0 +1,92 @@
+from contextlib import nullcontext
+from typing import Dict, Any, Iterator, List, Tuple, Optional, Callable, Union, ContextManager
+from src.models.product import Product
+
+# A load record: ("put", name, product_dict), ("product", name, Product),
+# ("patch", name, changed_fields), ("del", name, None) or ("reset", None, None)
+# to discard everything yielded so far
+LoadRecord = Tuple[str, Optional[str], Union[Dict[str, Any], Product, None]]
+
+class InventoryRepository:
+    """Storage interface used by InventoryController
+    
+    Mutation hooks persist a single change and return True when the
+    repository wants a full snapshot written soon (e.g. to compact a journal).
+    """
+    
+    # True when other processes may write the same store (see poll_external)
+    shared = False
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load all products as {name: product_dict}"""
+        raise NotImplementedError
+    
+    def iter_load(self, progress: Optional[Callable[[float], None]] = None
+                  ) -> Iterator[LoadRecord]:
+        """Stream the stored products as load records, reporting progress from 0.0 to 1.0"""
+        for name, data in self.load().items():
+            yield "put", name, data
+        if progress:
+            progress(1.0)
+    
+    def put(self, name: str, data: Dict[str, Any]) -> bool:
+        """Persist a new or replaced product"""
+        raise NotImplementedError
+    
+    def set_quantity(self, name: str, quantity: int, updated_at: str) -> bool:
+        """Persist a quantity change for an existing product"""
+        raise NotImplementedError
+    
+    def delete(self, name: str) -> bool:
+        """Persist a product removal"""
+        raise NotImplementedError
+    
+    def apply_changes(self, changes: List[LoadRecord]) -> bool:
+        """Persist a group of "put", "patch" and "del" records in order
+        
+        Backends override this to write the whole group at once.
+        """
+        wanted = False
+        for op, name, data in changes:
+            if op == "put":
+                wanted = self.put(name, data) or wanted
+            elif op == "patch":
+                wanted = self.set_quantity(name, data["quantity"], data["updated_at"]) or wanted
+            elif op == "del":
+                wanted = self.delete(name) or wanted
+        return wanted
+    
+    def capture_snapshot(self, products: Dict[str, Product]) -> Any:
+        """Copy what save_snapshot needs; runs under the controller lock
+        
+        The default captures {name: product_dict}.
+        """
+        return {name: product.to_dict() for name, product in products.items()}
+    
+    def begin_snapshot(self):
+        """Called under the controller lock right after the snapshot data is captured"""
+    
+    def save_snapshot(self, data: Any) -> bool:
+        """Write the data from capture_snapshot; may run on a background thread"""
+        raise NotImplementedError
+    
+    def exclusive(self) -> ContextManager:
+        """Keep other processes from writing the store while the block runs
+        
+        The controller holds this around loads, snapshot captures and syncs.
+        Backends without a shared store return a no-op context.
+        """
+        return nullcontext()
+    
+    def poll_external(self, check: bool = True) -> List[LoadRecord]:
+        """Changes other processes made to the store since the last call
+        
+        Returns "put", "patch" and "del" records, or a single
+        ("sync", None, {name: product_dict}) with the whole store when it
+        cannot say what changed. With check=False, only changes already
+        found while writing are returned, without reading the store.
+        """
+        return []
+    
+    def close(self):
+        """Release any open resources"""
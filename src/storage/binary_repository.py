@@ -0,0 +1,85 @@
+import logging
+import os
+from typing import Dict, Any, Optional, Iterator, Callable, List, ContextManager
+from src.models.product import Product
+from src.storage.base import LoadRecord
+from src.storage.binary_snapshot import (
+    SnapshotFormatError, capture_rows, iter_products, write_snapshot
+)
+from src.storage.json_repository import JsonRepository, SnapshotSuperseded
+from src.utils.file_handler import FileHandler
+from src.utils.journal import InventoryJournal
+
+logger = logging.getLogger(__name__)
+
+class BinarySnapshotRepository(JsonRepository):
+    """Binary columnar snapshot store; journaling and backups work as for JSON"""
+    
+    def __init__(self, file_path: str, journal: Optional[InventoryJournal] = None,
+                 backups: int = 0, shared: bool = False, lock_timeout: float = 10.0):
+        super().__init__(file_path, journal=journal, backups=backups,
+                         shared=shared, lock_timeout=lock_timeout)
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the snapshot as {name: product_dict}, replaying any journaled changes"""
+        self._mark_synced()
+        data = {}
+        for op, name, product in self._iter_snapshot():
+            if op == "reset":
+                data.clear()
+            else:
+                data[name] = product.to_dict()
+        if self.journal:
+            data = self.journal.replay(data)
+        return data
+    
+    def iter_load(self, progress: Optional[Callable[[float], None]] = None
+                  ) -> Iterator[LoadRecord]:
+        """Yield ready-made products from the snapshot, then the journaled changes"""
+        yield from self._iter_snapshot()
+        yield from self._iter_journal()
+        if progress:
+            progress(1.0)
+    
+    def _iter_snapshot(self) -> Iterator[LoadRecord]:
+        """Read the snapshot, falling back to the newest readable backup"""
+        paths = [self.file_path] + [
+            FileHandler.backup_path(self.file_path, index)
+            for index in range(1, self.backups + 1)
+        ]
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                for product in iter_products(path):
+                    yield "product", product.name, product
+            except (OSError, SnapshotFormatError, UnicodeDecodeError):
+                yield "reset", None, None
+                continue
+            if path != self.file_path:
+                logger.warning(
+                    "Inventory snapshot was unreadable. Restored from backup %s.",
+                    os.path.basename(path), extra={"title": "Recovered"}
+                )
+            return
+        
+        if os.path.exists(self.file_path):
+            logger.error("Inventory snapshot is corrupted. Starting with empty inventory.")
+    
+    def capture_snapshot(self, products: Dict[str, Product]) -> List[tuple]:
+        return capture_rows(products.values())
+    
+    def _write_snapshot(self, rows: List[tuple], guard: Optional[ContextManager]) -> bool:
+        try:
+            FileHandler.atomic_write(
+                self.file_path,
+                lambda file: write_snapshot(file, rows),
+                backups=self.backups,
+                replace_guard=guard
+            )
+            return True
+        except SnapshotSuperseded:
+            raise
+        except Exception as e:
+            logger.error("Failed to save inventory: %s", e)
+            return False
@@ -0,0 +1,229 @@
+"""Compact, versioned, memory-mappable columnar snapshot format
+
+Layout (all integers little-endian, every section padded to 8 bytes):
+    
+    header   magic b"INVSNAP\\0", version u16, flags u16, reserved u32, count u64
+    int64    quantity, value_cents, min_stock, max_stock      (count values each)
+    float64  created_ts, updated_ts                           (count values each)
+    uint8    row flags: bit 0 = value_text present, bit 1 = max_stock is None,
+             bit 2 = created_text present, bit 3 = updated_text present
+    strings  name, category, description, sku, value_text,
+             created_text, updated_text                       (each: count + 1
+             uint64 offsets followed by the concatenated UTF-8 bytes)
+
+created_text/updated_text (version 2) hold timestamps exactly as they were
+read when the ISO form of the epoch seconds would not reproduce them.
+Version 1 files, which lack them, are still read.
+
+Numeric columns are read straight out of the mapped file through
+memoryview casts; only the strings are decoded per product.
+
+Convert to and from the JSON layout from the project root (as with
+cli.py, export writes the inventory out to JSON and import reads JSON in):
+    python -m src.storage.binary_snapshot export data/inventory.snap data/inventory.json
+    python -m src.storage.binary_snapshot import data/inventory.json data/inventory.snap
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, Iterable, Iterator, List
+from src.models.product import Product
+
+MAGIC = b"INVSNAP\0"
+VERSION = 2
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<8sHHIQ")
+
+INT_COLUMNS = ("quantity", "value_cents", "min_stock", "max_stock")
+FLOAT_COLUMNS = ("created_ts", "updated_ts")
+STRING_COLUMNS = ("name", "category", "description", "sku", "value_text",
+                  "created_text", "updated_text")
+# String columns added after version 1
+V2_STRING_COLUMNS = ("created_text", "updated_text")
+
+HAS_VALUE_TEXT = 1
+NO_MAX_STOCK = 2
+HAS_CREATED_TEXT = 4
+HAS_UPDATED_TEXT = 8
+# Optional string column -> the row flag saying it holds a value rather than None
+OPTIONAL_TEXT_FLAGS = {
+    "value_text": HAS_VALUE_TEXT,
+    "created_text": HAS_CREATED_TEXT,
+    "updated_text": HAS_UPDATED_TEXT
+}
+
+_FIELD_INDEX = {field: index for index, field in enumerate(Product.FIELDS)}
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a readable binary snapshot"""
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % 8)
+
+def _little_endian(values: array) -> array:
+    """Return the array in little-endian byte order"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+def capture_rows(products: Iterable[Product]) -> List[tuple]:
+    """Copy raw product fields; cheap enough to run under the controller lock"""
+    return [product.to_fields() for product in products]
+
+def write_snapshot(file: BinaryIO, rows: List[tuple]):
+    """Write rows captured by capture_rows to an open binary file"""
+    count = len(rows)
+    columns = list(zip(*rows)) if rows else [()] * len(Product.FIELDS)
+    
+    def column(field):
+        return columns[_FIELD_INDEX[field]]
+    
+    file.write(HEADER.pack(MAGIC, VERSION, 0, 0, count))
+    
+    flags = array("B", bytes(count))
+    for field, flag in OPTIONAL_TEXT_FLAGS.items():
+        for i, text in enumerate(column(field)):
+            if text is not None:
+                flags[i] |= flag
+    for i, max_stock in enumerate(column("max_stock")):
+        if max_stock is None:
+            flags[i] |= NO_MAX_STOCK
+    
+    for field in INT_COLUMNS:
+        values = column(field)
+        if field == "max_stock":
+            values = (0 if value is None else value for value in values)
+        file.write(_little_endian(array("q", values)).tobytes())
+    for field in FLOAT_COLUMNS:
+        file.write(_little_endian(array("d", column(field))).tobytes())
+    file.write(flags.tobytes())
+    file.write(_padding(count))
+    
+    for field in STRING_COLUMNS:
+        encoded = [(text or "").encode("utf-8") for text in column(field)]
+        offsets = array("Q", accumulate((len(data) for data in encoded), initial=0))
+        blob = b"".join(encoded)
+        file.write(_little_endian(offsets).tobytes())
+        file.write(blob)
+        file.write(_padding(len(blob)))
+
+def iter_products(file_path: str) -> Iterator[Product]:
+    """Yield products from a snapshot file, reading numeric columns zero-copy"""
+    with open(file_path, "rb") as file:
+        if not file.seek(0, 2):
+            raise SnapshotFormatError("Snapshot file is empty")
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    with mapped:
+        views = []
+        try:
+            yield from _read(memoryview(mapped), views)
+        finally:
+            # Every view into the map must be released before it can close
+            for view in reversed(views):
+                view.release()
+
+def _read(buffer: memoryview, views: list) -> Iterator[Product]:
+    views.append(buffer)
+    if len(buffer) < HEADER.size:
+        raise SnapshotFormatError("File is too short to be a snapshot")
+    magic, version, _, _, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise SnapshotFormatError("Not an inventory snapshot")
+    if version not in READABLE_VERSIONS:
+        raise SnapshotFormatError(f"Unsupported snapshot version {version}")
+    
+    pos = HEADER.size
+    
+    def take(length: int) -> memoryview:
+        nonlocal pos
+        if pos + length > len(buffer):
+            raise SnapshotFormatError("Snapshot is truncated")
+        view = buffer[pos:pos + length]
+        views.append(view)
+        pos += length + (-length % 8)
+        return view
+    
+    def numbers(length: int, typecode: str):
+        view = take(length * 8)
+        if sys.byteorder == "little":
+            cast = view.cast(typecode)
+            views.append(cast)
+            return cast
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+    
+    ints = {field: numbers(count, "q") for field in INT_COLUMNS}
+    floats = {field: numbers(count, "d") for field in FLOAT_COLUMNS}
+    flags = take(count)
+    strings = {}
+    for field in STRING_COLUMNS:
+        if version < 2 and field in V2_STRING_COLUMNS:
+            strings[field] = [None] * count
+            continue
+        offsets = numbers(count + 1, "Q")
+        strings[field] = _split_strings(offsets, take(offsets[count]))
+    
+    optional = {
+        field: [text if row_flags & flag else None
+                for text, row_flags in zip(strings[field], flags)]
+        for field, flag in OPTIONAL_TEXT_FLAGS.items()
+    }
+    max_stock = [
+        None if row_flags & NO_MAX_STOCK else value
+        for value, row_flags in zip(ints["max_stock"], flags)
+    ]
+    yield from map(
+        Product.from_fields,
+        strings["name"], ints["quantity"], ints["value_cents"], optional["value_text"],
+        strings["category"], strings["description"], ints["min_stock"], max_stock,
+        floats["created_ts"], floats["updated_ts"], strings["sku"],
+        optional["created_text"], optional["updated_text"]
+    )
+
+def _split_strings(offsets, blob: memoryview) -> List[str]:
+    """Decode one string column"""
+    text = str(blob, "utf-8")
+    if len(text) != len(blob):
+        # Multi-byte characters: byte offsets no longer line up with the text
+        return [str(blob[offsets[i]:offsets[i + 1]], "utf-8") for i in range(len(offsets) - 1)]
+    return [text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+def json_to_snapshot(json_path: str, snapshot_path: str) -> int:
+    """Convert an inventory.json file to a binary snapshot; returns the product count"""
+    from src.utils.file_handler import FileHandler
+    rows = [
+        Product.hydrate(name, data).to_fields()
+        for name, data in FileHandler.iter_inventory(json_path)
+    ]
+    FileHandler.atomic_write(snapshot_path, lambda file: write_snapshot(file, rows))
+    return len(rows)
+
+def snapshot_to_json(snapshot_path: str, json_path: str) -> int:
+    """Convert a binary snapshot to the inventory.json layout; returns the product count"""
+    from src.utils.file_handler import FileHandler
+    data = {product.name: product.to_dict() for product in iter_products(snapshot_path)}
+    FileHandler.atomic_write(json_path, FileHandler.json_writer(data))
+    return len(data)
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["export", "import"],
+                        help="export: snapshot -> JSON, import: JSON -> snapshot")
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args(argv)
+    
+    if args.command == "export":
+        count = snapshot_to_json(args.source, args.target)
+    else:
+        count = json_to_snapshot(args.source, args.target)
+    print(f"Converted {count} products: {args.source} -> {args.target}")
+
+if __name__ == "__main__":
+    main()
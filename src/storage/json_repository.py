@@ -0,0 +1,291 @@
+import json
+import logging
+import os
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Optional, Iterator, Callable, List, ContextManager
+from src.storage.base import InventoryRepository, LoadRecord
+from src.utils.file_handler import FileHandler
+from src.utils.file_lock import FileLock
+from src.utils.journal import InventoryJournal
+
+logger = logging.getLogger(__name__)
+
+class SnapshotSuperseded(Exception):
+    """Another process compacted the journal after us; its snapshot is newer"""
+
+class JsonRepository(InventoryRepository):
+    """inventory.json snapshot store with an optional append-only journal
+    
+    With `shared` set (and a journal), several processes can use the same
+    files. Every journal append and snapshot replace happens under an
+    advisory lock file. The store's version is the compaction generation
+    kept in a .meta sidecar plus the live journal's length. Before
+    appending, a writer reads any records other processes appended since
+    its last look. If some of them touched the same products, it re-bases
+    its own quantity changes on theirs by applying its deltas, instead of
+    overwriting them. The records read are handed to the controller
+    through poll_external().
+    """
+    
+    def __init__(self, file_path: str, journal: Optional[InventoryJournal] = None,
+                 backups: int = 0, streaming_min_bytes: Optional[int] = None,
+                 shared: bool = False, lock_timeout: float = 10.0):
+        self.file_path = file_path
+        self.journal = journal
+        self.backups = backups
+        # Snapshots at least this large are parsed incrementally; None disables streaming
+        self.streaming_min_bytes = streaming_min_bytes
+        self.file_handler = FileHandler()
+        
+        self.shared = shared and journal is not None
+        self.lock = FileLock(file_path + ".lock", timeout=lock_timeout) if self.shared else None
+        self.meta_path = file_path + ".meta"
+        # Version of the store this process has applied: generation + journal offset
+        self._generation = 0
+        self._offset = 0
+        # Generation our in-flight snapshot was started under
+        self._snapshot_generation = 0
+        # Records from other processes found while writing, not yet polled
+        self._incoming: List[LoadRecord] = []
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the snapshot, replaying any journaled changes"""
+        self._mark_synced()
+        data = self.file_handler.load_inventory(self.file_path, backups=self.backups)
+        if self.journal:
+            data = self.journal.replay(data)
+        return data
+    
+    def iter_load(self, progress: Optional[Callable[[float], None]] = None
+                  ) -> Iterator[LoadRecord]:
+        """Stream the snapshot product by product, then the journaled changes"""
+        size = os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
+        if self.streaming_min_bytes is None or size < self.streaming_min_bytes:
+            yield from super().iter_load(progress)
+            return
+        
+        try:
+            for name, data in self.file_handler.iter_inventory(self.file_path, progress=progress):
+                yield "put", name, data
+        except json.JSONDecodeError:
+            # Corrupt snapshot: start over from the newest valid backup
+            yield "reset", None, None
+            data = self.file_handler.load_inventory(self.file_path, backups=self.backups)
+            for name, product in data.items():
+                yield "put", name, product
+        
+        yield from self._iter_journal()
+        if progress:
+            progress(1.0)
+    
+    def _iter_journal(self) -> Iterator[LoadRecord]:
+        """Turn journaled changes into load records"""
+        if not self.journal:
+            return
+        self._mark_synced()
+        for record in self.journal.iter_records():
+            load_record = self._load_record(record)
+            if load_record:
+                yield load_record
+    
+    @staticmethod
+    def _load_record(record: Dict[str, Any]) -> Optional[LoadRecord]:
+        """Turn one journal record into a load record"""
+        op = record.get("op")
+        if op == "put":
+            return "put", record["name"], record["product"]
+        if op == "qty":
+            return "patch", record["name"], {
+                "quantity": record["quantity"],
+                "updated_at": record["updated_at"]
+            }
+        if op == "del":
+            return "del", record["name"], None
+        return None
+    
+    def _record(self, record: Dict[str, Any]) -> bool:
+        """Journal a mutation, or ask for a full snapshot when journaling is off"""
+        if not self.journal:
+            return True
+        self._append([record])
+        return self.journal.needs_compaction()
+    
+    def put(self, name: str, data: Dict[str, Any]) -> bool:
+        return self._record({"op": "put", "name": name, "product": data})
+    
+    def set_quantity(self, name: str, quantity: int, updated_at: str) -> bool:
+        return self._record({
+            "op": "qty",
+            "name": name,
+            "quantity": quantity,
+            "updated_at": updated_at
+        })
+    
+    def delete(self, name: str) -> bool:
+        return self._record({"op": "del", "name": name})
+    
+    def apply_changes(self, changes: List[LoadRecord]) -> bool:
+        """Journal the whole group in one append"""
+        if not self.journal:
+            return True
+        records = []
+        for op, name, data in changes:
+            if op == "put":
+                records.append({"op": "put", "name": name, "product": data})
+            elif op == "patch":
+                record = {
+                    "op": "qty",
+                    "name": name,
+                    "quantity": data["quantity"],
+                    "updated_at": data["updated_at"]
+                }
+                if "delta" in data:
+                    record["delta"] = data["delta"]
+                records.append(record)
+            elif op == "del":
+                records.append({"op": "del", "name": name})
+        self._append(records)
+        return self.journal.needs_compaction()
+    
+    def _append(self, records: List[Dict[str, Any]]):
+        """Append records, first catching up on (and re-basing onto) other writers"""
+        if not self.shared:
+            self.journal.append_many(records)
+            return
+        with self.lock:
+            external = self._catch_up()
+            if external:
+                patches = self._rebase(records, external)
+                for op, _, data in external:
+                    if op == "sync":
+                        # The full copy predates our records; without them the
+                        # controller would drop what we are about to write
+                        for record in records:
+                            InventoryJournal.apply_record(data, record)
+                self._incoming.extend(external)
+                self._incoming.extend(patches)
+            self.journal.append_many(records)
+            self._offset = self.journal.live_size()
+    
+    @staticmethod
+    def _rebase(records: List[Dict[str, Any]], external: List[LoadRecord]) -> List[LoadRecord]:
+        """Apply our quantity deltas on top of quantities other processes wrote
+        
+        Rewrites the absolute quantity of our "qty" records in place, so the
+        journal stays replayable, and returns patches that bring this
+        process's products up to date.
+        """
+        latest: Dict[str, Optional[int]] = {}
+        complete = False
+        for op, name, data in external:
+            if op == "sync":
+                latest = {name: fields.get("quantity", 0) for name, fields in data.items()}
+                complete = True
+            elif op in ("put", "patch"):
+                latest[name] = data.get("quantity", 0)
+            elif op == "del":
+                latest[name] = None
+        
+        patches = []
+        for record in records:
+            op, name = record["op"], record["name"]
+            if op == "put":
+                latest[name] = record["product"].get("quantity", 0)
+            elif op == "del":
+                latest[name] = None
+            elif op == "qty" and (complete or name in latest):
+                base = latest.get(name)
+                if base is None or "delta" not in record:
+                    # Deleted by another process (replay ignores the change), or no delta to apply
+                    continue
+                record["quantity"] = latest[name] = max(0, base + record["delta"])
+                patches.append(("patch", name, {
+                    "quantity": record["quantity"],
+                    "updated_at": record["updated_at"]
+                }))
+        return patches
+    
+    def _catch_up(self) -> List[LoadRecord]:
+        """Records other processes wrote since we last looked (caller holds the lock)"""
+        if self._read_generation() != self._generation:
+            # Another process compacted the journal; re-read the whole store
+            return [("sync", None, self.load())]
+        records, self._offset = self.journal.read_from(self._offset)
+        return [load_record for load_record in map(self._load_record, records) if load_record]
+    
+    def _mark_synced(self):
+        """Remember the store version being loaded (caller holds the lock)"""
+        if self.shared:
+            self._generation = self._read_generation()
+            self._offset = self.journal.live_size()
+    
+    def _read_generation(self) -> int:
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as file:
+                return int(json.load(file).get("generation", 0))
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, AttributeError):
+            logger.warning("Unreadable %s; treating the store as changed", self.meta_path)
+            return -1
+    
+    def exclusive(self) -> ContextManager:
+        return self.lock if self.shared else nullcontext()
+    
+    def poll_external(self, check: bool = True) -> List[LoadRecord]:
+        if not self.shared:
+            return []
+        with self.lock:
+            if check:
+                self._incoming.extend(self._catch_up())
+            incoming, self._incoming = self._incoming, []
+        return incoming
+    
+    def begin_snapshot(self):
+        if not self.journal:
+            return
+        with self.exclusive():
+            self.journal.begin_compaction()
+            if self.shared:
+                # A new generation tells other processes to re-read the store
+                self._generation = max(self._generation, self._read_generation()) + 1
+                FileHandler.atomic_write(
+                    self.meta_path,
+                    FileHandler.json_writer({"generation": self._generation})
+                )
+                self._offset = 0
+            self._snapshot_generation = self._generation
+    
+    @contextmanager
+    def _replace_guard(self) -> Iterator[None]:
+        """Hold the lock for the rename, unless a newer snapshot got there first"""
+        with self.lock:
+            if self._read_generation() != self._snapshot_generation:
+                raise SnapshotSuperseded()
+            yield
+    
+    def save_snapshot(self, data: Any) -> bool:
+        guard = self._replace_guard() if self.shared else None
+        try:
+            saved = self._write_snapshot(data, guard)
+        except SnapshotSuperseded:
+            # That process read our journal before compacting, so nothing is lost
+            return True
+        if self.journal:
+            self.journal.end_compaction(saved)
+        return saved
+    
+    def _write_snapshot(self, data: Dict[str, Dict[str, Any]],
+                        guard: Optional[ContextManager]) -> bool:
+        """Atomically replace the snapshot file; False (logged) on failure"""
+        try:
+            FileHandler.atomic_write(
+                self.file_path, FileHandler.json_writer(data),
+                backups=self.backups, replace_guard=guard
+            )
+            return True
+        except SnapshotSuperseded:
+            raise
+        except Exception as e:
+            logger.error("Failed to save inventory: %s", e)
+            return False
@@ -0,0 +1,365 @@
+"""Append-only history of stock movements, partitioned by month
+
+Every quantity change is one line of JSON in <directory>/<YYYY-MM>.jsonl,
+named after the UTC month of its timestamp. Next to each partition,
+<YYYY-MM>.idx holds one fixed-size entry per line: timestamp, byte offset,
+byte length and a CRC32 of the product name. Entries are in timestamp order,
+so a time range is a binary search in the index, and a per-product query
+scans the small index entries instead of parsing JSON. Queries stream from
+disk a page at a time; a history of millions of movements is never loaded
+into memory.
+"""
+
+import functools
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from src.utils.file_lock import FileLock
+from src.utils.numpy_support import numpy
+
+# timestamp, byte offset and length of the line, CRC32 of the product name
+ENTRY = struct.Struct("<dQII")
+SCAN_ENTRIES = 8192  # Index entries read at a time by a per-product scan
+_decode = json.JSONDecoder().decode
+
+# Reasons recorded by InventoryController; callers may pass their own
+REASON_ADJUST = "adjust"
+REASON_INITIAL = "initial"
+REASON_IMPORT = "import"
+REASON_DELETED = "deleted"
+
+@functools.lru_cache(maxsize=None)
+def _entry_dtype(np):
+    """NumPy dtype of an index entry, matching ENTRY"""
+    return np.dtype([
+        ("timestamp", "<f8"), ("offset", "<u8"), ("length", "<u4"), ("crc", "<u4")
+    ])
+
+class StockMovement(NamedTuple):
+    """One quantity change of one product"""
+    timestamp: float  # epoch seconds
+    name: str
+    delta: int
+    quantity: int  # quantity after the change
+    reason: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ts": self.timestamp,
+            "name": self.name,
+            "delta": self.delta,
+            "quantity": self.quantity,
+            "reason": self.reason
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StockMovement":
+        return cls(data["ts"], data["name"], data["delta"], data["quantity"], data["reason"])
+    
+    @classmethod
+    def from_line(cls, line: bytes) -> "StockMovement":
+        return cls.from_dict(_decode(line.decode("utf-8")))
+
+class MovementPage(NamedTuple):
+    """One page of a history query"""
+    movements: List[StockMovement]
+    # Pass to the same query to get the next page; None on the last page
+    cursor: Optional[str]
+
+def parse_time(value) -> float:
+    """Epoch seconds from a number or an ISO date/datetime; raises ValueError"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+class MovementLog:
+    """Time-partitioned, indexed store of StockMovement records
+    
+    Records are only ever appended. Timestamps are kept non-decreasing, so
+    a clock that steps backwards stamps movements with the latest time
+    already stored. With `shared` set, appends take a lock file so several
+    processes can record into the same directory.
+    """
+    
+    def __init__(self, directory: str, shared: bool = False, lock_timeout: float = 10.0):
+        self.directory = directory
+        self.shared = shared
+        if shared:
+            self._lock = FileLock(os.path.join(directory, "movements.lock"), lock_timeout)
+        else:
+            self._lock = threading.RLock()
+        # Partition -> (data bytes, index bytes, last timestamp) when last checked
+        self._tails: Dict[str, Tuple[int, int, float]] = {}
+    
+    @staticmethod
+    def partition_of(timestamp: float) -> str:
+        """Partition key (UTC "YYYY-MM") a timestamp is stored under"""
+        moment = time.gmtime(timestamp)
+        return f"{moment.tm_year:04d}-{moment.tm_mon:02d}"
+    
+    def partitions(self) -> List[str]:
+        """Keys of every partition, oldest first"""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-6] for name in names if name.endswith(".jsonl"))
+    
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + ".jsonl", base + ".idx"
+    
+    def record(self, movements: Sequence[StockMovement]):
+        """Append movements, oldest first, with one write per partition"""
+        if not movements:
+            return
+        with self._lock:
+            if self._tails and not self.shared:
+                newest = max(self._tails)
+            else:
+                # Another process may have started a newer partition
+                partitions = self.partitions()
+                newest = partitions[-1] if partitions else None
+            if newest is None:
+                os.makedirs(self.directory, exist_ok=True)
+            last = self._tail(newest)[2] if newest is not None else 0.0
+            groups: Dict[str, List[StockMovement]] = {}
+            for movement in movements:
+                if movement.timestamp < last:
+                    movement = movement._replace(timestamp=last)
+                last = movement.timestamp
+                groups.setdefault(self.partition_of(last), []).append(movement)
+            for key, group in groups.items():
+                self._append(key, group)
+    
+    def _append(self, key: str, movements: List[StockMovement]):
+        data_path, index_path = self._paths(key)
+        offset, indexed, _ = self._tail(key)
+        lines, entries = [], []
+        for movement in movements:
+            line = (json.dumps(movement.to_dict(), separators=(",", ":")) + "\n").encode("utf-8")
+            entries.append(ENTRY.pack(
+                movement.timestamp, offset, len(line), zlib.crc32(movement.name.encode("utf-8"))
+            ))
+            lines.append(line)
+            offset += len(line)
+        # Data first: an index entry never points past the data
+        with open(data_path, "ab") as file:
+            file.write(b"".join(lines))
+        with open(index_path, "ab") as file:
+            file.write(b"".join(entries))
+        self._tails[key] = (offset, indexed + len(entries) * ENTRY.size, movements[-1].timestamp)
+    
+    def _tail(self, key: str, verify: bool = False) -> Tuple[int, int, float]:
+        """Data bytes covered by the index, index bytes and the last timestamp (lock held)
+        
+        Brings the index up to date first: lines a crash left unindexed are
+        indexed, and a torn trailing line or index entry is cut off. Appends to
+        an unshared log trust the sizes this process saw last; otherwise the
+        files are only re-read once either one changed size.
+        """
+        data_path, index_path = self._paths(key)
+        cached = self._tails.get(key)
+        if cached is not None and not (self.shared or verify):
+            return cached
+        try:
+            data_size = os.path.getsize(data_path)
+        except OSError:
+            data_size = 0
+        if cached is not None and cached[0] == data_size:
+            try:
+                if os.path.getsize(index_path) == cached[1]:
+                    return cached
+            except OSError:
+                pass
+        
+        end, last = 0, 0.0
+        with open(index_path, "a+b") as index:
+            index_size = index.seek(0, os.SEEK_END)
+            count = index_size // ENTRY.size
+            indexed = count * ENTRY.size
+            if indexed != index_size:
+                index.truncate(indexed)
+            if count:
+                index.seek((count - 1) * ENTRY.size)
+                last, offset, length, _ = ENTRY.unpack(index.read(ENTRY.size))
+                end = offset + length
+            if end > data_size:
+                # The data was replaced under the index; index it from scratch
+                index.truncate(0)
+                end, last, indexed = 0, 0.0, 0
+            if end == data_size:
+                self._tails[key] = (end, indexed, last)
+                return self._tails[key]
+            
+            entries = []
+            with open(data_path, "r+b") as data:
+                data.seek(end)
+                for line in data:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("torn line")
+                        movement = json.loads(line)
+                        timestamp, name = float(movement["ts"]), movement["name"]
+                    except (ValueError, KeyError, TypeError):
+                        break
+                    entries.append(ENTRY.pack(
+                        timestamp, end, len(line), zlib.crc32(name.encode("utf-8"))
+                    ))
+                    end += len(line)
+                    last = timestamp
+                data.truncate(end)
+            index.seek(0, os.SEEK_END)
+            index.write(b"".join(entries))
+            self._tails[key] = (end, index.tell(), last)
+        return self._tails[key]
+    
+    def iter_movements(self, name: Optional[str] = None, start: Optional[float] = None,
+                       end: Optional[float] = None,
+                       newest_first: bool = False) -> Iterator[StockMovement]:
+        """Stream movements of one product (or all) with start <= timestamp < end"""
+        for _, _, movement in self._scan(name, start, end, newest_first, None):
+            yield movement
+    
+    def page(self, name: Optional[str] = None, start: Optional[float] = None,
+             end: Optional[float] = None, limit: int = 100, cursor: Optional[str] = None,
+             newest_first: bool = False) -> MovementPage:
+        """One page of iter_movements(); raises ValueError for a malformed cursor"""
+        position = self._parse_cursor(cursor) if cursor else None
+        movements: List[StockMovement] = []
+        for key, index, movement in self._scan(name, start, end, newest_first, position):
+            if len(movements) >= limit:
+                return MovementPage(movements, f"{key}:{index}")
+            movements.append(movement)
+        return MovementPage(movements, None)
+    
+    def iter_since(self, cursor: Optional[str] = None,
+                   start: Optional[float] = None) -> Iterator[Tuple[str, StockMovement]]:
+        """Stream movements stored after `cursor` (or from `start`), oldest first
+        
+        Each comes with the cursor just past it. Keep the last one and pass it
+        back later to follow the log, reading only what was appended since.
+        """
+        position = self._parse_cursor(cursor) if cursor else None
+        for key, entry, movement in self._scan(None, None if position else start, None,
+                                               False, position):
+            yield f"{key}:{entry + 1}", movement
+    
+    def summarize(self, start: Optional[float] = None, end: Optional[float] = None,
+                  name: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Units received and issued per product over a time range"""
+        totals: Dict[str, Dict[str, int]] = {}
+        for movement in self.iter_movements(name, start, end):
+            product = totals.get(movement.name)
+            if product is None:
+                product = totals[movement.name] = {"received": 0, "issued": 0, "movements": 0}
+            if movement.delta > 0:
+                product["received"] += movement.delta
+            else:
+                product["issued"] -= movement.delta
+            product["movements"] += 1
+        return totals
+    
+    @staticmethod
+    def _parse_cursor(cursor: str) -> Tuple[str, int]:
+        key, _, index = cursor.partition(":")
+        if len(key) != 7 or not index.isdigit():
+            raise ValueError(f"Invalid history cursor: {cursor!r}")
+        return key, int(index)
+    
+    def _scan(self, name: Optional[str], start: Optional[float], end: Optional[float],
+              newest_first: bool,
+              position: Optional[Tuple[str, int]]) -> Iterator[Tuple[str, int, StockMovement]]:
+        """Yield (partition, index entry, movement) in time order, from `position` on"""
+        keys = self.partitions()
+        if start is not None:
+            keys = [key for key in keys if key >= self.partition_of(start)]
+        if end is not None:
+            keys = [key for key in keys if key <= self.partition_of(end)]
+        if position is not None:
+            if newest_first:
+                keys = [key for key in keys if key <= position[0]]
+            else:
+                keys = [key for key in keys if key >= position[0]]
+        if newest_first:
+            keys.reverse()
+        crc = zlib.crc32(name.encode("utf-8")) if name is not None else None
+        
+        for key in keys:
+            with self._lock:
+                # Indexes any lines a crashed writer left behind
+                self._tail(key, verify=True)
+            data_path, index_path = self._paths(key)
+            with open(index_path, "rb") as index_file, open(data_path, "rb") as data:
+                if os.fstat(index_file.fileno()).st_size < ENTRY.size:
+                    continue
+                with mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ) as index:
+                    count = len(index) // ENTRY.size
+                    low = self._bisect(index, count, start) if start is not None else 0
+                    high = self._bisect(index, count, end) if end is not None else count
+                    if position is not None and position[0] == key:
+                        if newest_first:
+                            high = min(high, position[1] + 1)
+                        else:
+                            low = max(low, position[1])
+                    if crc is None and not newest_first:
+                        # Consecutive entries are consecutive lines: read straight through
+                        if low < high:
+                            data.seek(ENTRY.unpack_from(index, low * ENTRY.size)[1])
+                            for entry in range(low, high):
+                                yield key, entry, StockMovement.from_line(data.readline())
+                        continue
+                    for entry, offset, length in self._entries(index, low, high, crc, newest_first):
+                        data.seek(offset)
+                        movement = StockMovement.from_line(data.read(length))
+                        if name is None or movement.name == name:
+                            yield key, entry, movement
+    
+    @staticmethod
+    def _bisect(index: mmap.mmap, count: int, timestamp: float) -> int:
+        """First entry with a timestamp >= `timestamp`"""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if ENTRY.unpack_from(index, middle * ENTRY.size)[0] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    @staticmethod
+    def _entries(index: mmap.mmap, low: int, high: int, crc: Optional[int],
+                 newest_first: bool) -> Iterator[Tuple[int, int, int]]:
+        """Yield (entry, offset, length) for entries in [low, high), matching `crc` if given"""
+        if crc is None:
+            entries = range(high - 1, low - 1, -1) if newest_first else range(low, high)
+            for entry in entries:
+                _, offset, length, _ = ENTRY.unpack_from(index, entry * ENTRY.size)
+                yield entry, offset, length
+            return
+        
+        # NumPy is optional; without it the scan falls back to struct
+        np = numpy()
+        chunks = range(low, high, SCAN_ENTRIES)
+        for first in (reversed(chunks) if newest_first else chunks):
+            last = min(first + SCAN_ENTRIES, high)
+            chunk = index[first * ENTRY.size:last * ENTRY.size]
+            if np is not None:
+                rows = np.frombuffer(chunk, dtype=_entry_dtype(np))
+                hits = np.flatnonzero(rows["crc"] == crc)
+                matches = [(first + int(hit), int(rows["offset"][hit]), int(rows["length"][hit]))
+                           for hit in hits]
+            else:
+                matches = [(first + i, offset, length)
+                           for i, (_, offset, length, entry_crc) in enumerate(ENTRY.iter_unpack(chunk))
+                           if entry_crc == crc]
+            yield from (reversed(matches) if newest_first else matches)
@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, Any, Callable, Iterator, List, Optional
+from src.storage.base import InventoryRepository, LoadRecord
+from src.models.product import Product
+
+# Column order shared by every statement below
+COLUMNS = (
+    "name", "sku", "category", "description", "quantity", "value",
+    "min_stock", "max_stock", "stock_status", "created_at", "updated_at"
+)
+# Columns read back into the inventory.json product layout
+LOAD_COLUMNS = tuple(column for column in COLUMNS if column != "stock_status")
+LOAD_BATCH_ROWS = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    name TEXT PRIMARY KEY,
+    sku TEXT,
+    category TEXT NOT NULL DEFAULT 'Uncategorized',
+    description TEXT NOT NULL DEFAULT '',
+    quantity INTEGER NOT NULL DEFAULT 0,
+    value TEXT NOT NULL DEFAULT '0',
+    min_stock INTEGER NOT NULL DEFAULT 0,
+    max_stock INTEGER,
+    stock_status TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_products_sku ON products(sku);
+CREATE INDEX IF NOT EXISTS idx_products_category ON products(category);
+CREATE INDEX IF NOT EXISTS idx_products_stock_status ON products(stock_status);
+"""
+
+UPSERT = (
+    f"INSERT INTO products ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    "ON CONFLICT(name) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:])
+)
+
+class SqliteRepository(InventoryRepository):
+    """SQLite store with per-row writes and indexed lookups"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # The autosave worker may call in from another thread; writes are serialized here
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+    
+    @staticmethod
+    def _row_values(name: str, data: Dict[str, Any]) -> tuple:
+        """Flatten a product dict into COLUMNS order"""
+        quantity = data.get("quantity", 0)
+        min_stock = data.get("min_stock", 0)
+        max_stock = data.get("max_stock")
+        return (
+            name,
+            data.get("sku"),
+            data.get("category", "Uncategorized"),
+            data.get("description", ""),
+            quantity,
+            data.get("value", "0"),
+            min_stock,
+            max_stock,
+            Product.classify_stock(quantity, min_stock, max_stock),
+            data.get("created_at"),
+            data.get("updated_at")
+        )
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        return {name: data for _, name, data in self.iter_load()}
+    
+    def iter_load(self, progress: Optional[Callable[[float], None]] = None
+                  ) -> Iterator[LoadRecord]:
+        """Stream rows from a cursor, so only one batch of raw rows is held at a time"""
+        # The lock is held until the stream is exhausted, as the controller does
+        with self._lock:
+            total = self.count()
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(f"SELECT {', '.join(LOAD_COLUMNS)} FROM products")
+            done = 0
+            while True:
+                rows = cursor.fetchmany(LOAD_BATCH_ROWS)
+                if not rows:
+                    break
+                for row in rows:
+                    yield "put", row[0], dict(zip(LOAD_COLUMNS, row))
+                done += len(rows)
+                if progress and total:
+                    progress(min(done / total, 1.0))
+        if progress:
+            progress(1.0)
+    
+    def put(self, name: str, data: Dict[str, Any]) -> bool:
+        with self._lock, self.conn:
+            self.conn.execute(UPSERT, self._row_values(name, data))
+        return False
+    
+    def set_quantity(self, name: str, quantity: int, updated_at: str) -> bool:
+        with self._lock, self.conn:
+            self._update_quantity(name, quantity, updated_at)
+        return False
+    
+    def _update_quantity(self, name: str, quantity: int, updated_at: str):
+        """Write a quantity and its derived stock status; the caller owns the transaction"""
+        row = self.conn.execute(
+            "SELECT min_stock, max_stock FROM products WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return
+        status = Product.classify_stock(quantity, row["min_stock"], row["max_stock"])
+        self.conn.execute(
+            "UPDATE products SET quantity = ?, updated_at = ?, stock_status = ? "
+            "WHERE name = ?",
+            (quantity, updated_at, status, name)
+        )
+    
+    def delete(self, name: str) -> bool:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM products WHERE name = ?", (name,))
+        return False
+    
+    def apply_changes(self, changes: List[LoadRecord]) -> bool:
+        """Write the whole group in a single transaction"""
+        with self._lock, self.conn:
+            for op, name, data in changes:
+                if op == "put":
+                    self.conn.execute(UPSERT, self._row_values(name, data))
+                elif op == "patch":
+                    self._update_quantity(name, data["quantity"], data["updated_at"])
+                elif op == "del":
+                    self.conn.execute("DELETE FROM products WHERE name = ?", (name,))
+        return False
+    
+    def save_snapshot(self, data: Dict[str, Dict[str, Any]]) -> bool:
+        """Replace the whole table in one transaction (used for imports)"""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM products")
+            self.conn.executemany(
+                UPSERT,
+                (self._row_values(name, product) for name, product in data.items())
+            )
+        return True
+    
+    def count(self) -> int:
+        """Count stored products without loading them (for load progress)"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
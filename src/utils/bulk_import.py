@@ -0,0 +1,236 @@
+"""Bulk CSV/JSONL import and streaming CSV export
+
+Rows are streamed from the input file and validated in chunks with
+Validators.validate_bulk (the same rules as the add-product form), across
+a process pool for large files. Every rejected row is listed in a single CSV error report,
+and all valid rows are committed through one controller batch.
+"""
+
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from src.models.product import Product
+from src.utils.validators import Validators
+
+# Columns read on import; "name" and "quantity" are required
+IMPORT_FIELDS = ("name", "quantity", "value", "category", "description",
+                 "min_stock", "max_stock", "sku")
+EXPORT_COLUMNS = ("name", "sku", "quantity", "value", "category", "min_stock", "max_stock",
+                  "status", "description")
+REPORT_COLUMNS = ("line", "name", "error")
+
+# (line number, raw row) as read from the input file
+SourceRow = Tuple[int, Dict[str, Any]]
+# (line number, name, product fields or None, error messages)
+CheckedRow = Tuple[int, str, Optional[Dict[str, Any]], List[str]]
+
+@dataclass
+class ImportResult:
+    """Outcome of a bulk import"""
+    imported: int
+    rejected: int
+    report_path: Optional[str]
+
+def iter_rows(file_path: str) -> Iterator[SourceRow]:
+    """Stream rows from a .csv or .jsonl file without reading it all at once"""
+    if file_path.lower().endswith((".jsonl", ".ndjson")):
+        with open(file_path, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    row = {"_error": f"Invalid JSON: {e.msg}"}
+                if not isinstance(row, dict):
+                    row = {"_error": "Expected a JSON object"}
+                yield line_number, row
+    else:
+        with open(file_path, "r", encoding="utf-8-sig", newline="") as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+def _stock_limit(value: Any, label: str, errors: List[str]) -> Optional[int]:
+    """Parse an optional min/max stock value the way the add-product form does"""
+    text = _text(value)
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        errors.append(f"{label} must be a number")
+        return None
+
+def _other_fields(row: Dict[str, Any], errors: List[str]) -> Dict[str, Any]:
+    """Check the fields validate_bulk does not cover, adding to `errors`"""
+    category = _text(row.get("category"))
+    valid, error = Validators.validate_category(category)
+    if not valid:
+        errors.append(error)
+    description = _text(row.get("description"))
+    valid, error = Validators.validate_description(description)
+    if not valid:
+        errors.append(error)
+    min_stock = _stock_limit(row.get("min_stock"), "Min stock", errors)
+    max_stock = _stock_limit(row.get("max_stock"), "Max stock", errors)
+    
+    data = {
+        "category": category or "Uncategorized",
+        "description": description,
+        "min_stock": min_stock or 0,
+        "max_stock": max_stock
+    }
+    sku = _text(row.get("sku"))
+    if sku:
+        data["sku"] = sku
+    return data
+
+def validate_chunk(chunk: List[SourceRow]) -> List[CheckedRow]:
+    """Validate a chunk of rows; runs in a worker process"""
+    names = [_text(row.get("name")) for _, row in chunk]
+    result = Validators.validate_bulk(
+        names,
+        [_text(row.get("quantity")) for _, row in chunk],
+        [_text(row.get("value")) for _, row in chunk]
+    )
+    
+    checked = []
+    for i, (line, row) in enumerate(chunk):
+        if "_error" in row:
+            checked.append((line, "", None, [row["_error"]]))
+            continue
+        errors = result.errors(i)
+        data = _other_fields(row, errors)
+        if errors:
+            checked.append((line, names[i], None, errors))
+        else:
+            checked.append((line, names[i], {
+                "quantity": result.quantities[i],
+                "value": result.values[i],
+                **data
+            }, []))
+    return checked
+
+def _chunks(rows: Iterable[SourceRow], size: int) -> Iterator[List[SourceRow]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def validate_rows(rows: Iterable[SourceRow], chunk_size: int = 2000,
+                  workers: Optional[int] = None) -> Iterator[CheckedRow]:
+    """Validate rows in chunks, in order, across up to `workers` processes
+    
+    workers=0 validates in this process. Only a few chunks are in flight at
+    a time, so the input is never fully buffered.
+    """
+    chunks = _chunks(rows, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            yield from validate_chunk(chunk)
+        return
+    
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None:
+        # Too small to be worth starting a pool
+        yield from validate_chunk(first)
+        return
+    
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        limit = 2 * workers
+        pending = deque([executor.submit(validate_chunk, first),
+                         executor.submit(validate_chunk, second)])
+        for chunk in chunks:
+            if len(pending) >= limit:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(validate_chunk, chunk))
+        while pending:
+            yield from pending.popleft().result()
+
+def default_report_path(file_path: str) -> str:
+    """Where the error report for an input file goes unless told otherwise"""
+    return file_path + ".errors.csv"
+
+def import_file(controller, file_path: str, report_path: Optional[str] = None,
+                replace: bool = False, chunk_size: int = 2000,
+                workers: Optional[int] = None) -> ImportResult:
+    """Import products from a CSV or JSONL file
+    
+    Valid rows are committed with a single InventoryController batch.
+    Rejected rows (failed validation, repeated names, or existing products
+    when `replace` is off) are written to one CSV report, by default
+    next to the input as <file>.errors.csv.
+    """
+    report_path = report_path or default_report_path(file_path)
+    valid: Dict[str, Dict[str, Any]] = {}
+    rejected_lines = set()
+    report = None
+    writer = None
+    
+    try:
+        for line, name, data, errors in validate_rows(iter_rows(file_path), chunk_size, workers):
+            if not errors:
+                if name in valid:
+                    errors = ["Product name appears more than once in the file"]
+                elif not replace and controller.get_product(name) is not None:
+                    errors = ["Product already exists"]
+            if errors:
+                if writer is None:
+                    report = open(report_path, "w", encoding="utf-8", newline="")
+                    writer = csv.writer(report)
+                    writer.writerow(REPORT_COLUMNS)
+                writer.writerows((line, name, error) for error in errors)
+                rejected_lines.add(line)
+                continue
+            valid[name] = data
+    finally:
+        if report is not None:
+            report.close()
+    
+    imported = controller.import_products(valid, replace=replace) if valid else 0
+    return ImportResult(imported, len(rejected_lines), report_path if writer else None)
+
+def product_row(product: Product) -> Dict[str, Any]:
+    """A product as an EXPORT_COLUMNS row"""
+    return {
+        "name": product.name,
+        "sku": product.sku,
+        "quantity": product.quantity,
+        "value": product.value,
+        "category": product.category,
+        "min_stock": product.min_stock,
+        "max_stock": product.max_stock,
+        "status": product.get_stock_status(),
+        "description": product.description
+    }
+
+def write_csv(products: Iterable[Product], file: TextIO) -> int:
+    """Stream products to an open text file as CSV; returns the row count"""
+    writer = csv.DictWriter(file, fieldnames=EXPORT_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    count = 0
+    for product in products:
+        writer.writerow(product_row(product))
+        count += 1
+    return count
+
+def export_csv(products: Iterable[Product], file_path: str) -> int:
+    """Write products to a CSV file in the order given; returns the row count"""
+    with open(file_path, "w", encoding="utf-8", newline="") as file:
+        return write_csv(products, file)
@@ -1,33 +1,223 @@
+import io
 import json
+import logging
 import os
-from typing import Dict, Any
-from tkinter import messagebox
+import re
+import tempfile
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, Iterator, Tuple, Callable, BinaryIO, ContextManager
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = re.compile(r"[ \t\r\n]*")
 
 class FileHandler:
     """Handles file operations for inventory data"""
     
     @staticmethod
-    def load_inventory(file_path: str) -> Dict[str, Any]:
-        """Load inventory data from JSON file"""
+    def backup_path(file_path: str, index: int) -> str:
+        """Get the path of the n-th rotated backup (1 is the newest)"""
+        return f"{file_path}.{index}"
+    
+    @staticmethod
+    def _read_json(file_path: str) -> Dict[str, Any]:
+        """Read and parse a single JSON file"""
+        with open(file_path, "r") as file:
+            return json.load(file)
+    
+    @staticmethod
+    def load_inventory(file_path: str, backups: int = 0) -> Dict[str, Any]:
+        """Load inventory data from JSON file, falling back to the newest valid backup"""
         if os.path.exists(file_path):
             try:
-                with open(file_path, "r") as file:
-                    return json.load(file)
+                return FileHandler._read_json(file_path)
             except json.JSONDecodeError:
-                messagebox.showerror("Error", "Inventory file is corrupted. Starting with empty inventory.")
+                recovered = FileHandler._load_backup(file_path, backups)
+                if recovered is not None:
+                    return recovered
+                logger.error("Inventory file is corrupted. Starting with empty inventory.")
                 return {}
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load inventory: {str(e)}")
+                logger.error("Failed to load inventory: %s", e)
                 return {}
-        return {}
+        
+        # A crash between rotating and renaming can leave only the backups behind
+        recovered = FileHandler._load_backup(file_path, backups)
+        return recovered if recovered is not None else {}
+    
+    @staticmethod
+    def iter_inventory(file_path: str, chunk_size: int = 64 * 1024,
+                       progress: Optional[Callable[[float], None]] = None
+                       ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream (name, product_dict) pairs out of an inventory JSON object
+        
+        Only one chunk of text and one product are held at a time, so peak
+        memory stays close to the size of the products being built from it.
+        Raises json.JSONDecodeError on malformed input.
+        """
+        decoder = json.JSONDecoder()
+        total = os.path.getsize(file_path) or 1
+        
+        with open(file_path, "r", encoding="utf-8") as file:
+            buffer = ""
+            pos = 0
+            consumed = 0  # Characters dropped from the front of the buffer
+            eof = False
+            
+            def fill() -> bool:
+                """Read another chunk; False at end of file"""
+                nonlocal buffer, pos, consumed, eof
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + chunk
+                consumed += pos
+                pos = 0
+                if progress:
+                    progress(min(1.0, file.tell() / total))
+                return True
+            
+            def skip_whitespace():
+                nonlocal pos
+                while True:
+                    pos = WHITESPACE.match(buffer, pos).end()
+                    if pos < len(buffer) or not fill():
+                        return
+            
+            def expect(char: str):
+                nonlocal pos
+                skip_whitespace()
+                if pos >= len(buffer) or buffer[pos] != char:
+                    raise json.JSONDecodeError(f"Expecting '{char}'", buffer, pos)
+                pos += 1
+            
+            def decode():
+                nonlocal pos
+                skip_whitespace()
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        if eof or not fill():
+                            raise
+                        continue
+                    # A token that runs to the end of the buffer may be cut short
+                    if end == len(buffer) and not eof and fill():
+                        continue
+                    pos = end
+                    return value
+            
+            expect("{")
+            skip_whitespace()
+            if pos < len(buffer) and buffer[pos] == "}":
+                return
+            while True:
+                name = decode()
+                expect(":")
+                yield name, decode()
+                skip_whitespace()
+                if pos >= len(buffer):
+                    raise json.JSONDecodeError("Unterminated object", buffer, pos)
+                if buffer[pos] == "}":
+                    return
+                expect(",")
+    
+    @staticmethod
+    def _load_backup(file_path: str, backups: int) -> Optional[Dict[str, Any]]:
+        """Load the newest backup that parses cleanly"""
+        for index in range(1, backups + 1):
+            path = FileHandler.backup_path(file_path, index)
+            if not os.path.exists(path):
+                continue
+            try:
+                data = FileHandler._read_json(path)
+            except (OSError, json.JSONDecodeError):
+                continue
+            logger.warning(
+                "Inventory file was unreadable. Restored from backup %s.",
+                os.path.basename(path), extra={"title": "Recovered"}
+            )
+            return data
+        return None
     
     @staticmethod
-    def save_inventory(file_path: str, data: Dict[str, Any]):
-        """Save inventory data to JSON file"""
+    def _rotate_backups(file_path: str, backups: int):
+        """Shift existing backups down by one and move the current file into slot 1"""
+        if backups <= 0 or not os.path.exists(file_path):
+            return
+        for index in range(backups - 1, 0, -1):
+            older = FileHandler.backup_path(file_path, index)
+            if os.path.exists(older):
+                os.replace(older, FileHandler.backup_path(file_path, index + 1))
+        os.replace(file_path, FileHandler.backup_path(file_path, 1))
+    
+    @staticmethod
+    def _fsync_directory(directory: str):
+        """Persist a rename by syncing the containing directory (POSIX only)"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def atomic_write(file_path: str, write: Callable[[BinaryIO], None], backups: int = 0,
+                     replace_guard: Optional[ContextManager] = None):
+        """Write a file via temp file + fsync + rename, keeping rotated backups
+        
+        `write` receives the open binary temp file. Raises on failure; the
+        existing file is left untouched in that case. `replace_guard` (e.g. a
+        file lock) is held only around the backup rotation and rename, and
+        may raise to abandon the write.
+        """
+        temp_path = None
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w") as file:
-                json.dump(data, file, indent=4)
+            directory = os.path.dirname(os.path.abspath(file_path))
+            os.makedirs(directory, exist_ok=True)
+            
+            # Write the full snapshot next to the target so the rename stays atomic
+            fd, temp_path = tempfile.mkstemp(
+                prefix=os.path.basename(file_path) + ".",
+                suffix=".tmp",
+                dir=directory
+            )
+            # mkstemp creates owner-only files; keep the permissions of the file we replace
+            mode = os.stat(file_path).st_mode & 0o777 if os.path.exists(file_path) else 0o644
+            os.chmod(temp_path, mode)
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+                file.flush()
+                os.fsync(file.fileno())
+            
+            with replace_guard if replace_guard is not None else nullcontext():
+                FileHandler._rotate_backups(file_path, backups)
+                os.replace(temp_path, file_path)
+                temp_path = None
+            FileHandler._fsync_directory(directory)
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    @staticmethod
+    def json_writer(data: Dict[str, Any]) -> Callable[[BinaryIO], None]:
+        """An atomic_write callback that writes data as indented JSON"""
+        def write(file):
+            text = io.TextIOWrapper(file, encoding="utf-8")
+            json.dump(data, text, indent=4)
+            text.flush()
+            text.detach()
+        return write
+    
+    @staticmethod
+    def save_inventory(file_path: str, data: Dict[str, Any], backups: int = 0) -> bool:
+        """Atomically save inventory data to JSON file, keeping rotated backups"""
+        try:
+            FileHandler.atomic_write(file_path, FileHandler.json_writer(data), backups)
+            return True
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save inventory: {str(e)}")
\ No newline at end of file
+            logger.error("Failed to save inventory: %s", e)
+            return False
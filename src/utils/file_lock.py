@@ -0,0 +1,79 @@
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+class FileLockTimeout(OSError):
+    """The lock file stayed locked by another process for too long"""
+
+class FileLock:
+    """Advisory exclusive lock shared by every process using the same lock file
+    
+    Re-entrant within a process: threads queue on an in-process lock and
+    only the outermost acquire touches the file, so nested `with` blocks on
+    the same FileLock are cheap. Uses flock on POSIX and msvcrt.locking on
+    Windows; both are released by the OS if the process dies.
+    """
+    
+    def __init__(self, file_path: str, timeout: float = 10.0, poll_interval: float = 0.01):
+        self.file_path = file_path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+    
+    def acquire(self):
+        """Block until this process holds the lock; raises FileLockTimeout"""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._fd = self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+    
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+    
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.release()
+    
+    def _lock_file(self) -> int:
+        os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+        fd = os.open(self.file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return fd
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise FileLockTimeout(f"Timed out waiting for {self.file_path}")
+                time.sleep(self.poll_interval)
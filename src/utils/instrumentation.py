@@ -0,0 +1,157 @@
+"""Lightweight timers and counters for hot paths
+
+Enabled by PERF_INSTRUMENTATION in settings (or INVENTORY_PERF=1). When
+disabled, @instrumentation.timed returns the function unchanged and
+instrumentation.time() is a shared no-op context, so instrumented code
+pays nothing.
+
+    @instrumentation.timed("save_products")
+    def save_products(self): ...
+
+    with instrumentation.time("product_card.create"):
+        card = ProductCard(...)
+
+    instrumentation.count("product_card.bind")
+"""
+
+import cProfile
+import functools
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Deque, Dict, Iterator, Optional
+from src.config.settings import PERF_INSTRUMENTATION, PERF_SAMPLE_WINDOW
+
+class Instrumentation:
+    """Rolling latency samples per timer plus plain event counters"""
+    
+    def __init__(self, enabled: bool = False, window: int = 500):
+        self.enabled = enabled
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._calls: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+        # Timers fire from the autosave worker as well as the Tk thread
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+        self._noop = nullcontext()
+    
+    def record(self, name: str, seconds: float):
+        """Add one latency sample"""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._calls[name] = self._calls.get(name, 0) + 1
+    
+    def count(self, name: str, amount: int = 1):
+        """Bump a counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+    
+    def time(self, name: str):
+        """Context manager timing its block under `name`"""
+        if not self.enabled:
+            return self._noop
+        return self._timer(name)
+    
+    @contextmanager
+    def _timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    def timed(self, name: str) -> Callable[[Callable], Callable]:
+        """Decorator timing every call of a function under `name`"""
+        def decorate(function: Callable) -> Callable:
+            if not self.enabled:
+                return function
+            
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorate
+    
+    @staticmethod
+    def _percentile(ordered: list, fraction: float) -> float:
+        """Nearest-rank percentile of an ascending list"""
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-timer call count and p50/p99/max latency in ms over the rolling window"""
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            calls = dict(self._calls)
+        return {
+            name: {
+                "calls": calls[name],
+                "p50_ms": self._percentile(ordered, 0.50) * 1000,
+                "p99_ms": self._percentile(ordered, 0.99) * 1000,
+                "max_ms": ordered[-1] * 1000
+            }
+            for name, ordered in sorted(samples.items())
+        }
+    
+    def counters(self) -> Dict[str, int]:
+        """Current counter values"""
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+    
+    def report(self) -> str:
+        """Timers and counters as an aligned text table"""
+        lines = [f"{'timer':<26}{'calls':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for name, stats in self.snapshot().items():
+            lines.append(f"{name:<26}{stats['calls']:>8}{stats['p50_ms']:>10.2f}"
+                         f"{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}")
+        for name, value in self.counters().items():
+            lines.append(f"{name:<26}{value:>8}")
+        return "\n".join(lines)
+    
+    def reset(self):
+        """Drop all samples and counters"""
+        with self._lock:
+            self._samples.clear()
+            self._calls.clear()
+            self._counters.clear()
+    
+    @property
+    def profiling(self) -> bool:
+        return self._profiler is not None
+    
+    def start_profile(self):
+        """Start a cProfile session (works whether or not timers are enabled)"""
+        if self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+    
+    def stop_profile(self, file_path: str) -> str:
+        """Stop the cProfile session and dump it for pstats/snakeviz; returns the path"""
+        profiler, self._profiler = self._profiler, None
+        if profiler is None:
+            raise RuntimeError("No profile is running")
+        profiler.disable()
+        profiler.dump_stats(file_path)
+        return file_path
+    
+    @contextmanager
+    def profile(self, file_path: str) -> Iterator[None]:
+        """Profile the block and dump the result to `file_path`"""
+        self.start_profile()
+        try:
+            yield
+        finally:
+            self.stop_profile(file_path)
+
+instrumentation = Instrumentation(PERF_INSTRUMENTATION, PERF_SAMPLE_WINDOW)
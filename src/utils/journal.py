@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+from typing import Dict, Any, Iterator, List, Tuple
+
+class InventoryJournal:
+    """Append-only log of inventory mutations applied on top of the last snapshot"""
+    
+    def __init__(self, file_path: str, max_operations: int = 1000,
+                 max_bytes: int = 1024 * 1024):
+        self.file_path = file_path
+        self.compacting_path = file_path + ".compacting"
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.operation_count = 0
+        self.size_bytes = 0
+    
+    def append(self, record: Dict[str, Any]):
+        """Append a single compact mutation record"""
+        self.append_many([record])
+    
+    def append_many(self, records: List[Dict[str, Any]]):
+        """Append several records with a single write, synced to disk"""
+        text = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        data = text.encode("utf-8")
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with open(self.file_path, "ab+") as file:
+            self.size_bytes -= self._trim_torn_tail(file)
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        self.operation_count += len(records)
+        self.size_bytes += len(data)
+    
+    @staticmethod
+    def _trim_torn_tail(file) -> int:
+        """Cut an unfinished last line left by a crash; returns the bytes removed
+        
+        Without this the next record would be glued onto it, and replay (which
+        stops at the first unreadable line) would drop everything after it.
+        """
+        size = file.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0
+        file.seek(size - 1)
+        if file.read(1) == b"\n":
+            return 0
+        keep = 0
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            file.seek(start)
+            newline = file.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                keep = start + newline + 1
+                break
+            end = start
+        file.truncate(keep)
+        return size - keep
+    
+    def replay(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply journaled records on top of snapshot data"""
+        for record in self.iter_records():
+            self.apply_record(data, record)
+        return data
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield journaled records oldest first"""
+        self.operation_count = 0
+        self.size_bytes = 0
+        # Records from an unfinished compaction are older than the live journal
+        for path in (self.compacting_path, self.file_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    self.size_bytes += len(line.encode("utf-8"))
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn trailing write from a crash; everything before it is valid
+                        break
+                    self.operation_count += 1
+                    yield record
+    
+    def live_size(self) -> int:
+        """Bytes in the live journal (not counting a compaction in progress)"""
+        try:
+            return os.path.getsize(self.file_path)
+        except OSError:
+            return 0
+    
+    def read_from(self, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Records appended to the live journal after `offset`, and the new offset
+        
+        Used to pick up records other processes appended. A torn trailing
+        line is left for the next call.
+        """
+        if self.live_size() <= offset:
+            return [], offset
+        records = []
+        start = offset
+        with open(self.file_path, "rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+                offset += len(line)
+        self.operation_count += len(records)
+        self.size_bytes += offset - start
+        return records, offset
+    
+    @staticmethod
+    def apply_record(data: Dict[str, Any], record: Dict[str, Any]):
+        """Apply one record; records carry absolute values so replay is idempotent"""
+        op = record.get("op")
+        name = record.get("name")
+        if op == "put":
+            data[name] = record["product"]
+        elif op == "qty" and name in data:
+            data[name]["quantity"] = record["quantity"]
+            data[name]["updated_at"] = record["updated_at"]
+        elif op == "del":
+            data.pop(name, None)
+    
+    def needs_compaction(self) -> bool:
+        """Check whether the journal should be folded into a fresh snapshot"""
+        return (self.operation_count >= self.max_operations or
+                self.size_bytes >= self.max_bytes)
+    
+    def begin_compaction(self):
+        """Set the current records aside so new mutations go to a fresh journal"""
+        if os.path.exists(self.file_path):
+            if os.path.exists(self.compacting_path):
+                # A previous compaction failed; keep its records ahead of ours
+                with open(self.file_path, "rb") as source, \
+                        open(self.compacting_path, "ab+") as target:
+                    self._trim_torn_tail(target)
+                    shutil.copyfileobj(source, target)
+                os.remove(self.file_path)
+            else:
+                os.replace(self.file_path, self.compacting_path)
+        self.operation_count = 0
+        self.size_bytes = 0
+    
+    def end_compaction(self, success: bool):
+        """Drop the set-aside records once the snapshot containing them is written"""
+        if success and os.path.exists(self.compacting_path):
+            os.remove(self.compacting_path)
+    
+    def reset(self):
+        """Discard journaled records once they are part of a snapshot"""
+        for path in (self.compacting_path, self.file_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.operation_count = 0
+        self.size_bytes = 0
+
@@ -0,0 +1,31 @@
+"""NumPy as an optional dependency, imported on first use
+
+Importing NumPy takes around 100 ms, so modules that only need it on bulk
+paths call numpy() there rather than importing it at module level; the GUI
+and CLI then start without it.
+    
+    np = numpy()
+    if np is not None:
+        ...vectorized path...
+"""
+
+from types import ModuleType
+from typing import Optional
+
+# Benchmarks set this to False to time the pure-Python fallbacks
+enabled = True
+_module: Optional[ModuleType] = None
+_imported = False
+
+def numpy() -> Optional[ModuleType]:
+    """The numpy module, or None when it is not installed or disabled"""
+    global _module, _imported
+    if not enabled:
+        return None
+    if not _imported:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        _module, _imported = module, True
+    return _module
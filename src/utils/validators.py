@@ -1,5 +1,75 @@
 import re
-from typing import Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
+from src.utils.numpy_support import numpy
+
+NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_]+$')
+CURRENCY_SYMBOLS = re.compile(r'[$,]')
+# Bulk fast paths check a whole column joined by newlines: names made of
+# allowed characters (newlines are allowed anyway) and prices with no sign,
+# exponent or spaces
+NAME_CHARACTERS = re.compile(r'[a-zA-Z0-9\s\-_]*')
+PLAIN_VALUE_CHARACTERS = re.compile(r'[0-9.$,\n]*')
+# Digits int() reads without leaving int64
+MAX_PLAIN_DIGITS = 18
+
+MAX_NAME_LENGTH = 100
+MAX_QUANTITY = 999999
+MAX_VALUE = 999999.99
+
+# Error codes returned by Validators.validate_bulk; 0 means the field is valid
+OK = 0
+NAME_REQUIRED = 1
+NAME_TOO_LONG = 2
+NAME_INVALID = 3
+QUANTITY_REQUIRED = 4
+QUANTITY_NEGATIVE = 5
+QUANTITY_TOO_LARGE = 6
+QUANTITY_INVALID = 7
+VALUE_NEGATIVE = 8
+VALUE_TOO_LARGE = 9
+VALUE_INVALID = 10
+
+# Messages indexed by error code, identical to the single-field validators
+ERROR_MESSAGES = (
+    None,
+    "Product name is required",
+    "Product name must be less than 100 characters",
+    "Product name can only contain letters, numbers, spaces, hyphens and underscores",
+    "Quantity is required",
+    "Quantity must be a positive number",
+    "Quantity exceeds maximum limit",
+    "Quantity must be a valid number",
+    "Value must be a positive number",
+    "Value exceeds maximum limit",
+    "Value must be a valid number"
+)
+
+class BulkValidation:
+    """Column-wise result of Validators.validate_bulk
+    
+    `valid` is the per-row mask, `name_errors`, `quantity_errors` and
+    `value_errors` hold error codes (OK where the field is fine), and
+    `quantities` / `values` hold the parsed quantity and normalized price
+    (None where invalid). Masks and codes are NumPy arrays when NumPy is
+    installed and lists otherwise.
+    """
+    
+    def __init__(self, valid, name_errors, quantity_errors, value_errors,
+                 quantities: List[Optional[int]], values: List[Optional[str]]):
+        self.valid = valid
+        self.name_errors = name_errors
+        self.quantity_errors = quantity_errors
+        self.value_errors = value_errors
+        self.quantities = quantities
+        self.values = values
+    
+    def __len__(self) -> int:
+        return len(self.quantities)
+    
+    def errors(self, row: int) -> List[str]:
+        """Error messages for one row, in field order"""
+        codes = (self.name_errors[row], self.quantity_errors[row], self.value_errors[row])
+        return [ERROR_MESSAGES[code] for code in codes if code]
 
 class Validators:
     """Input validation utilities"""
@@ -11,7 +81,7 @@ class Validators:
             return False, "Product name is required"
         if len(name) > 100:
             return False, "Product name must be less than 100 characters"
-        if not re.match(r'^[a-zA-Z0-9\s\-_]+$', name):
+        if not NAME_PATTERN.match(name):
             return False, "Product name can only contain letters, numbers, spaces, hyphens and underscores"
         return True, None
     
@@ -39,7 +109,7 @@ class Validators:
         
         try:
             # Remove currency symbols and commas
-            cleaned = re.sub(r'[$,]', '', value)
+            cleaned = CURRENCY_SYMBOLS.sub('', value)
             float_val = float(cleaned)
             if float_val < 0:
                 return False, "Value must be a positive number", None
@@ -61,4 +131,154 @@ class Validators:
         """Validate description"""
         if description and len(description) > 500:
             return False, "Description must be less than 500 characters"
-        return True, None
\ No newline at end of file
+        return True, None
+    
+    @staticmethod
+    def validate_bulk(names: Sequence[str], quantities: Sequence[str],
+                      values: Sequence[str]) -> BulkValidation:
+        """Validate name, quantity and value columns a column at a time
+        
+        Takes equal-length columns of raw strings and gives exactly the
+        verdicts of validate_product_name, validate_quantity and
+        validate_value, as error codes instead of one tuple per field.
+        
+        A column in the common clean form (name characters only, plain
+        digits, plain prices) is checked with one regex or str method over
+        the whole column and parsed with map(); the range checks and the
+        combined mask are then vectorized with NumPy when it is installed.
+        Any other column falls back to checking each row.
+        """
+        np = numpy()
+        names, quantities, values = list(names), list(quantities), list(values)
+        name_errors = _name_errors(names, np)
+        quantity_errors, parsed_quantities = _quantity_errors(quantities, np)
+        value_errors, parsed_values = _value_errors(values, np)
+        
+        if np is not None:
+            valid = (name_errors | quantity_errors | value_errors) == OK
+        else:
+            valid = [
+                not (a or b or c) for a, b, c in zip(name_errors, quantity_errors, value_errors)
+            ]
+        
+        return BulkValidation(
+            valid, name_errors, quantity_errors, value_errors, parsed_quantities, parsed_values
+        )
+
+def _codes(np, codes):
+    return np.asarray(codes, dtype=np.uint8) if np is not None else codes
+
+def _name_errors(names: List[str], np):
+    if not NAME_CHARACTERS.fullmatch("\n".join(names)):
+        match = NAME_PATTERN.match
+        return _codes(np, [
+            NAME_REQUIRED if not name or not name.strip() else
+            NAME_TOO_LONG if len(name) > MAX_NAME_LENGTH else
+            OK if match(name) else NAME_INVALID
+            for name in names
+        ])
+    # Every character is allowed, so only emptiness and length can fail
+    if np is None:
+        return [
+            NAME_REQUIRED if not name.strip() else
+            NAME_TOO_LONG if len(name) > MAX_NAME_LENGTH else OK
+            for name in names
+        ]
+    count = len(names)
+    lengths = np.fromiter(map(len, names), dtype=np.int64, count=count)
+    stripped = np.fromiter(map(len, map(str.strip, names)), dtype=np.int64, count=count)
+    return np.select(
+        [stripped == 0, lengths > MAX_NAME_LENGTH], [NAME_REQUIRED, NAME_TOO_LONG], OK
+    ).astype(np.uint8)
+
+def _quantity_errors(quantities: List[str], np):
+    # Decimal digits only (no sign or spaces): int() cannot fail or go negative
+    if (quantities and all(map(str.isdecimal, quantities))
+            and max(map(len, quantities)) <= MAX_PLAIN_DIGITS):
+        parsed = list(map(int, quantities))
+        if np is None:
+            codes = [QUANTITY_TOO_LARGE if qty > MAX_QUANTITY else OK for qty in parsed]
+        else:
+            numbers = np.fromiter(parsed, dtype=np.int64, count=len(parsed))
+            codes = np.where(numbers > MAX_QUANTITY, QUANTITY_TOO_LARGE, OK).astype(np.uint8)
+        return codes, _drop_invalid(parsed, codes, np)
+    
+    codes = []
+    parsed = []
+    for quantity in quantities:
+        if not quantity or not quantity.strip():
+            codes.append(QUANTITY_REQUIRED)
+            parsed.append(None)
+            continue
+        try:
+            qty = int(quantity)
+        except ValueError:
+            codes.append(QUANTITY_INVALID)
+            parsed.append(None)
+            continue
+        code = QUANTITY_NEGATIVE if qty < 0 else QUANTITY_TOO_LARGE if qty > MAX_QUANTITY else OK
+        codes.append(code)
+        parsed.append(None if code else qty)
+    return _codes(np, codes), parsed
+
+def _value_errors(values: List[str], np):
+    numbers = _plain_values(values)
+    if numbers is not None:
+        if np is None:
+            codes = [VALUE_TOO_LARGE if number > MAX_VALUE else OK for number in numbers]
+        else:
+            array = np.fromiter(numbers, dtype=np.float64, count=len(numbers))
+            codes = np.where(array > MAX_VALUE, VALUE_TOO_LARGE, OK).astype(np.uint8)
+        parsed = list(map("{:.2f}".format, numbers))
+        if "" in values:
+            for row, value in enumerate(values):
+                if not value:
+                    parsed[row] = "0"
+        return codes, _drop_invalid(parsed, codes, np)
+    
+    codes = []
+    parsed = []
+    for value in values:
+        if not value or not value.strip():
+            codes.append(OK)
+            parsed.append("0")
+            continue
+        try:
+            float_val = float(value.replace("$", "").replace(",", ""))
+        except ValueError:
+            codes.append(VALUE_INVALID)
+            parsed.append(None)
+            continue
+        code = VALUE_NEGATIVE if float_val < 0 else VALUE_TOO_LARGE if float_val > MAX_VALUE else OK
+        codes.append(code)
+        parsed.append(None if code else f"{float_val:.2f}")
+    return _codes(np, codes), parsed
+
+def _plain_values(values: List[str]) -> Optional[List[float]]:
+    """Parse a column of unsigned prices at C speed, or None if any row needs checking alone"""
+    blob = "\n".join(values)
+    if not PLAIN_VALUE_CHARACTERS.fullmatch(blob):
+        return None
+    cleaned = blob.replace("$", "").replace(",", "").split("\n")
+    if len(cleaned) != len(values):  # A row held a newline
+        return None
+    if "" in cleaned:
+        # Blank rows count as zero, but "$" or "," alone is invalid
+        for row, text in enumerate(cleaned):
+            if not text:
+                if values[row]:
+                    return None
+                cleaned[row] = "0"
+    try:
+        return list(map(float, cleaned))
+    except ValueError:  # e.g. "." or "1.2.3"
+        return None
+
+def _drop_invalid(parsed: list, codes, np) -> list:
+    """Replace parsed values with None where the code is an error"""
+    rows = np.flatnonzero(codes).tolist() if np is not None else [
+        row for row, code in enumerate(codes) if code
+    ]
+    for row in rows:
+        parsed[row] = None
+    return parsed
@@ -4,7 +4,8 @@ from src.assets.styles import AppStyles
 class SearchBar(ctk.CTkFrame):
     """Modern search bar component"""
     
-    def __init__(self, parent, on_search=None, placeholder="Search products...", **kwargs):
+    def __init__(self, parent, on_search=None, placeholder="Search products...",
+                 debounce_ms=0, **kwargs):
         super().__init__(
             parent,
             fg_color=AppStyles.WHITE,
@@ -15,6 +16,8 @@ class SearchBar(ctk.CTkFrame):
         )
         
         self.on_search = on_search
+        self.debounce_ms = debounce_ms
+        self._pending_search = None
         self.search_var = ctk.StringVar()
         self.search_var.trace('w', self._on_search_change)
         
@@ -66,9 +69,20 @@ class SearchBar(ctk.CTkFrame):
         else:
             self.clear_button.pack_forget()
         
-        # Trigger search callback
+        # Trigger search callback once typing pauses
+        if self._pending_search is not None:
+            self.after_cancel(self._pending_search)
+            self._pending_search = None
+        if self.debounce_ms:
+            self._pending_search = self.after(self.debounce_ms, self._fire_search)
+        else:
+            self._fire_search()
+    
+    def _fire_search(self):
+        """Run the search callback with the current text"""
+        self._pending_search = None
         if self.on_search:
-            self.on_search(search_text)
+            self.on_search(self.search_var.get())
     
     def clear_search(self):
         """Clear search input"""
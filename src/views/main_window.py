@@ -1,17 +1,31 @@
-import tkinter as tk
+import logging
+import threading
 import customtkinter as ctk
 from tkinter import messagebox
 from src.assets.styles import AppStyles
 from src.views.add_product_panel import AddProductPanel
 from src.views.statistics_panel import StatisticsPanel
-from src.views.product_card import ProductCard
+from src.views.virtual_product_list import VirtualProductList
+from src.views.product_list_model import ProductListModel
 from src.views.components.search_bar import SearchBar
 from src.views.components.modern_button import ModernButton
-from src.config.settings import APP_TITLE
+from src.views.message_box_handler import MessageBoxHandler
+from src.views.ui_dispatcher import UiDispatcher
+from src.views.perf_overlay import PerfOverlay
+from src.utils.instrumentation import instrumentation
+from src.controllers.events import ProductAdded, ProductRemoved, QuantityChanged, BatchApplied
+from src.config.settings import (
+    APP_TITLE, STATS_VERIFY_INTERVAL_MS, SEARCH_DEBOUNCE_MS, SHARED_POLL_MS
+)
+
+logger = logging.getLogger(__name__)
 
 class MainWindow:
     """Enhanced main application window"""
     
+    # Batches with more changes than this rebuild the list instead of patching it
+    BATCH_PATCH_LIMIT = 50
+    
     def __init__(self, controller):
         self.controller = controller
         self.controller.set_view(self)
@@ -34,10 +48,19 @@ class MainWindow:
         self.app.geometry(f"{window_width}x{window_height}+{int(screen_width*0.05)}+{int(screen_height*0.05)}")
         self.app.configure(fg_color=AppStyles.LIGHT)
         
-        # Variables
-        self.filtered_products = {}
-        self.search_text = ""
-        self.sort_by = "name"
+        # Changes and log records from background threads reach Tk through here
+        self.dispatcher = UiDispatcher(self.app)
+        
+        # Storage problems are logged; surface them to the user as dialogs
+        self.message_handler = MessageBoxHandler(self.dispatcher)
+        logging.getLogger("src").addHandler(self.message_handler)
+        
+        # Filtered, sorted row order shown in the product list
+        self.list_model = ProductListModel()
+        
+        # A forecast refresh is running on a worker / another one is wanted after it
+        self._forecasting = False
+        self._forecast_again = False
         
         self._setup_ui()
         self._setup_bindings()
@@ -85,7 +108,8 @@ class MainWindow:
         self.search_bar = SearchBar(
             top_bar,
             on_search=self._on_search,
-            placeholder="Search products..."
+            placeholder="Search products...",
+            debounce_ms=SEARCH_DEBOUNCE_MS
         )
         self.search_bar.pack(side="left", padx=20, fill="x", expand=True)
         
@@ -188,161 +212,231 @@ class MainWindow:
         sort_menu.pack(side="left")
     
     def _create_product_list(self, parent):
-        """Create the scrollable product list"""
-        # Canvas and scrollbar
+        """Create the virtualized product list"""
         canvas_frame = ctk.CTkFrame(parent, fg_color="transparent")
         canvas_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
         
-        self.canvas = tk.Canvas(
-            canvas_frame,
-            bg=AppStyles.WHITE,
-            highlightthickness=0
-        )
+        self.product_list = VirtualProductList(canvas_frame, self.controller)
+        self.product_list.pack(fill="both", expand=True)
         
-        scrollbar = tk.Scrollbar(
-            canvas_frame,
-            orient="vertical",
-            command=self.canvas.yview
-        )
-        
-        self.scrollable_frame = tk.Frame(self.canvas, bg=AppStyles.WHITE)
+        # Empty state, overlaid on the list when nothing matches
+        self.empty_frame = ctk.CTkFrame(canvas_frame, fg_color="transparent")
         
-        # Create window reference
-        self.scrollable_window = self.canvas.create_window(
-            (0, 0),
-            window=self.scrollable_frame,
-            anchor="nw"
+        icon_label = ctk.CTkLabel(
+            self.empty_frame,
+            text="📦",
+            font=("Segoe UI", 48)
         )
+        icon_label.pack()
         
-        # Bindings
-        def configure_canvas(event):
-            self.canvas.itemconfig(self.scrollable_window, width=event.width)
-        
-        self.canvas.bind("<Configure>", configure_canvas)
-        
-        def configure_scrollable_frame(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        
-        self.scrollable_frame.bind("<Configure>", configure_scrollable_frame)
-        
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas and scrollbar
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.empty_label = ctk.CTkLabel(
+            self.empty_frame,
+            text="No products found",
+            font=("Segoe UI", 16),
+            text_color=AppStyles.GRAY
+        )
+        self.empty_label.pack(pady=10)
+        
+        self.clear_search_button = ModernButton(
+            self.empty_frame,
+            text="Clear Search",
+            variant="outline",
+            size="md",
+            command=lambda: self.search_bar.clear_search()
+        )
     
     def _setup_bindings(self):
         """Setup event bindings"""
         # Scroll bindings
         def on_mouse_wheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            self.product_list.scroll_units(int(-1*(event.delta/120)))
         
-        self.canvas.bind_all("<MouseWheel>", on_mouse_wheel)
+        self.product_list.bind_all("<MouseWheel>", on_mouse_wheel)
+        
+        # Route the window close button through the same flush-and-exit path
+        self.app.protocol("WM_DELETE_WINDOW", self._confirm_exit)
+        
+        # Performance overlay and profiling, only when instrumentation is on
+        if instrumentation.enabled:
+            self.perf_overlay = PerfOverlay(self.app)
+            self.app.bind("<F12>", lambda event: self.perf_overlay.toggle())
+            self.app.bind("<F9>", lambda event: self.perf_overlay.toggle_profile())
     
     def _on_search(self, search_text):
         """Handle search"""
-        self.search_text = search_text.lower()
+        self.list_model.search_text = search_text.lower()
         self.refresh_display()
     
     def _on_sort(self, sort_by):
         """Handle sort"""
-        self.sort_by = sort_by.lower()
+        self.list_model.sort_by = sort_by.lower()
         self.refresh_display()
     
     def _confirm_exit(self):
         """Confirm exit dialog"""
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
+            # Pending autosaves must hit the disk before the process goes away
+            self.controller.close()
+            logging.getLogger("src").removeHandler(self.message_handler)
             self.app.quit()
             self.app.destroy()
     
+    @instrumentation.timed("refresh_display")
     def refresh_display(self):
-        """Refresh the product display"""
-        # Get all products
-        all_products = self.controller.get_all_products()
+        """Rebuild the product display from scratch"""
+        # Filter through the search index, then sort
+        rows = self.list_model.rebuild_from(self.controller)
         
-        # Filter products based on search
-        filtered = {}
-        if self.search_text:
-            for name, product in all_products.items():
-                if (self.search_text in name.lower() or
-                    self.search_text in product.category.lower()):
-                    filtered[name] = product
+        # Only the rows in view get (recycled) cards
+        self.product_list.set_products(rows)
+        self._update_summary()
+    
+    def on_inventory_changed(self, event):
+        """Patch the display for a controller change event, from any thread"""
+        self.dispatcher.call(self._handle_change, event)
+    
+    def _handle_change(self, event):
+        """Patch the display for a change event (main loop only)"""
+        if isinstance(event, BatchApplied):
+            # Patching row by row only pays off for small batches
+            if len(event.events) > self.BATCH_PATCH_LIMIT:
+                self.list_model.invalidate()
+                self.refresh_display()
+                return
+            for change in event.events:
+                self._apply_change(change)
+        elif not self._apply_change(event):
+            # Anything else (e.g. a reload) may have replaced every product
+            self.list_model.invalidate()
+            self.refresh_display()
+            self._refresh_forecasts()
+            return
+        
+        self._update_summary()
+        self._refresh_forecasts()
+    
+    def _apply_change(self, event) -> bool:
+        """Patch the product list for one event; False if it needs a full refresh"""
+        if isinstance(event, QuantityChanged):
+            moved = self.list_model.reposition(event.product)
+            if moved is not None:
+                old_index, new_index = moved
+                self.product_list.refresh_rows(
+                    min(old_index, new_index), max(old_index, new_index) + 1
+                )
+        elif isinstance(event, ProductAdded):
+            index = self.list_model.insert(event.product)
+            if index is not None:
+                self.product_list.refresh_rows(index, len(self.list_model.rows))
+        elif isinstance(event, ProductRemoved):
+            index = self.list_model.remove(event.product.name)
+            if index is not None:
+                self.product_list.refresh_rows(index, len(self.list_model.rows))
         else:
-            filtered = all_products
-        
-        # Sort products
-        if self.sort_by == "name":
-            filtered = dict(sorted(filtered.items()))
-        elif self.sort_by == "quantity":
-            filtered = dict(sorted(filtered.items(), key=lambda x: x[1].quantity, reverse=True))
-        elif self.sort_by == "value":
-            filtered = dict(sorted(filtered.items(), 
-                                 key=lambda x: float(x[1].value or 0), reverse=True))
-        elif self.sort_by == "category":
-            filtered = dict(sorted(filtered.items(), key=lambda x: x[1].category))
-        
-        self.filtered_products = filtered
-        
-        # Update statistics
-        self.stats_panel.update_statistics(all_products)
+            return False
+        return True
+    
+    def _update_summary(self):
+        """Update statistics, the count label and the empty state"""
+        all_products = self.controller.get_all_products()
+        self.stats_panel.update_statistics()
         
         # Update count label
         total = len(all_products)
-        shown = len(filtered)
+        shown = len(self.list_model.rows)
         self.count_label.configure(text=f"({shown} of {total})")
         
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
         # Show message if no products
-        if not filtered:
-            no_products_frame = ctk.CTkFrame(
-                self.scrollable_frame,
-                fg_color="transparent"
-            )
-            no_products_frame.pack(expand=True, fill="both", pady=50)
-            
-            icon_label = ctk.CTkLabel(
-                no_products_frame,
-                text="📦",
-                font=("Segoe UI", 48)
-            )
-            icon_label.pack()
-            
+        search_text = self.list_model.search_text
+        if not shown:
             message = "No products found"
-            if self.search_text:
-                message += f" matching '{self.search_text}'"
-            
-            no_products_label = ctk.CTkLabel(
-                no_products_frame,
-                text=message,
-                font=("Segoe UI", 16),
-                text_color=AppStyles.GRAY
-            )
-            no_products_label.pack(pady=10)
+            if search_text:
+                message += f" matching '{search_text}'"
+            self.empty_label.configure(text=message)
             
-            if self.search_text:
-                clear_btn = ModernButton(
-                    no_products_frame,
-                    text="Clear Search",
-                    variant="outline",
-                    size="md",
-                    command=lambda: self.search_bar.clear_search()
-                )
-                clear_btn.pack()
-        
-        # Recreate product cards
+            if search_text:
+                self.clear_search_button.pack()
+            else:
+                self.clear_search_button.pack_forget()
+            self.empty_frame.place(relx=0.5, rely=0.0, anchor="n", y=50)
         else:
-            for name in list(filtered.keys()):
-                product_card = ProductCard(
-                    self.scrollable_frame,
-                    filtered[name],
-                    self.controller
-                )
-                product_card.pack(fill="x", pady=(0, 10))
+            self.empty_frame.place_forget()
+    
+    def _refresh_forecasts(self):
+        """Recompute forecasts on a worker thread; the cards then redraw from the cache
+        
+        Reading the movement history can wait for another process's file
+        lock, so it never runs on the main loop. Requests made while a
+        refresh runs are folded into one more refresh after it.
+        """
+        if self._forecasting:
+            self._forecast_again = True
+            return
+        self._forecasting = True
+        threading.Thread(target=self._compute_forecasts, name="forecasts", daemon=True).start()
+    
+    def _compute_forecasts(self):
+        """Worker thread: fill the controller's forecast cache"""
+        try:
+            self.controller.get_forecasts()
+        except Exception:
+            logger.warning("Could not update the demand forecasts", exc_info=True)
+        finally:
+            self.dispatcher.call(self._forecasts_ready)
+    
+    def _forecasts_ready(self):
+        """Redraw the visible cards with the new forecasts (main loop only)"""
+        self._forecasting = False
+        self.product_list.refresh_rows(0, len(self.list_model.rows))
+        if self._forecast_again:
+            self._forecast_again = False
+            self._refresh_forecasts()
+    
+    def _schedule_statistics_check(self):
+        """Periodically recompute statistics from scratch to catch drift"""
+        if not self.controller.verify_statistics():
+            self.stats_panel.update_statistics()
+        # Forecasts also age: today's demand bucket fills up hour by hour
+        self._refresh_forecasts()
+        self.app.after(STATS_VERIFY_INTERVAL_MS, self._schedule_statistics_check)
+    
+    def load_inventory(self):
+        """Load the inventory behind a progress bar instead of a frozen window"""
+        overlay = ctk.CTkFrame(self.app, fg_color=AppStyles.WHITE, corner_radius=AppStyles.RADIUS_MD)
+        overlay.place(relx=0.5, rely=0.5, anchor="center")
+        
+        loading_label = ctk.CTkLabel(
+            overlay,
+            text="Loading inventory...",
+            font=("Segoe UI", 14),
+            text_color=AppStyles.DARK
+        )
+        loading_label.pack(padx=30, pady=(20, 10))
+        
+        progress_bar = ctk.CTkProgressBar(overlay, width=300)
+        progress_bar.set(0)
+        progress_bar.pack(padx=30, pady=(0, 20))
+        
+        def on_progress(fraction):
+            progress_bar.set(fraction)
+            # Redraw only; input events wait until the load has finished
+            self.app.update_idletasks()
+        
+        self.app.update_idletasks()
+        try:
+            self.controller.load_products(progress=on_progress)
+        finally:
+            overlay.destroy()
     
     def run(self):
         """Run the application"""
+        self.load_inventory()
         self.refresh_display()
+        # Cards show forecast badges once the history has been read off the main loop
+        self._refresh_forecasts()
+        # Index for search off the main loop; searches scan until it is ready
+        self.controller.prepare_search()
+        # Pick up changes saved by other instances sharing the inventory file
+        self.controller.watch(SHARED_POLL_MS / 1000)
+        self.app.after(STATS_VERIFY_INTERVAL_MS, self._schedule_statistics_check)
         self.app.mainloop()
\ No newline at end of file
@@ -0,0 +1,26 @@
+import logging
+from tkinter import messagebox
+
+class MessageBoxHandler(logging.Handler):
+    """Show warnings and errors logged by the application as message boxes
+    
+    Records logged from worker threads (e.g. a failed autosave) go through
+    the UiDispatcher instead of opening a dialog off the main thread.
+    A record may pass extra={"title": ...} to set the dialog title.
+    """
+    
+    def __init__(self, dispatcher, level: int = logging.WARNING):
+        super().__init__(level)
+        self.dispatcher = dispatcher
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = self.format(record)
+            if record.levelno >= logging.ERROR:
+                show, default_title = messagebox.showerror, "Error"
+            else:
+                show, default_title = messagebox.showwarning, "Warning"
+            title = getattr(record, "title", default_title)
+            self.dispatcher.call(show, title, message)
+        except Exception:
+            self.handleError(record)
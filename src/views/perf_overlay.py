@@ -0,0 +1,76 @@
+import os
+import time
+import customtkinter as ctk
+from src.assets.styles import AppStyles
+from src.utils.instrumentation import instrumentation
+from src.config.settings import PERF_OVERLAY_REFRESH_MS, PROFILE_DIR
+
+class PerfOverlay(ctk.CTkFrame):
+    """Floating panel with rolling hot-path latencies and profiling controls
+    
+    F12 shows or hides it; F9 starts a cProfile session and, pressed again,
+    saves it to PROFILE_DIR.
+    """
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(
+            parent,
+            fg_color=AppStyles.DARK,
+            corner_radius=AppStyles.RADIUS_MD,
+            **kwargs
+        )
+        self.parent = parent
+        self.visible = False
+        self._pending_refresh = None
+        self.status = "F9: start profiling"
+        
+        self.report_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Consolas", 11),
+            text_color=AppStyles.WHITE,
+            justify="left"
+        )
+        self.report_label.pack(padx=10, pady=(8, 0), anchor="w")
+        
+        self.status_label = ctk.CTkLabel(
+            self,
+            text=self.status,
+            font=("Segoe UI", 10),
+            text_color=AppStyles.GRAY,
+            justify="left"
+        )
+        self.status_label.pack(padx=10, pady=(0, 8), anchor="w")
+    
+    def toggle(self):
+        """Show or hide the overlay"""
+        if self.visible:
+            self.visible = False
+            self.place_forget()
+            if self._pending_refresh:
+                self.after_cancel(self._pending_refresh)
+                self._pending_refresh = None
+        else:
+            self.visible = True
+            self.place(relx=1.0, rely=1.0, anchor="se", x=-20, y=-20)
+            self.lift()
+            self._refresh()
+    
+    def toggle_profile(self):
+        """Start profiling, or stop and save the profile of what happened since"""
+        if instrumentation.profiling:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, time.strftime("profile-%Y%m%d-%H%M%S.prof"))
+            instrumentation.stop_profile(path)
+            self.status = f"Saved {path}\n(open with python -m pstats or snakeviz)"
+        else:
+            instrumentation.start_profile()
+            self.status = "Profiling... press F9 to stop and save"
+        self.status_label.configure(text=self.status)
+        if not self.visible:
+            self.toggle()
+    
+    def _refresh(self):
+        """Redraw the latency table while visible"""
+        self.report_label.configure(text=instrumentation.report())
+        self._pending_refresh = self.after(PERF_OVERLAY_REFRESH_MS, self._refresh)
@@ -1,6 +1,11 @@
+import logging
 import customtkinter as ctk
 from src.assets.styles import AppStyles
 from src.views.components.modern_button import ModernButton
+from src.controllers.forecasting import REORDER_NOW, REORDER_SOON
+from src.utils.file_lock import FileLockTimeout
+
+logger = logging.getLogger(__name__)
 
 class ProductCard(ctk.CTkFrame):
     """Compact product card component"""
@@ -19,6 +24,7 @@ class ProductCard(ctk.CTkFrame):
         self.controller = controller
         
         self._setup_ui()
+        self._render()
     
     def _setup_ui(self):
         # Main content
@@ -26,21 +32,21 @@ class ProductCard(ctk.CTkFrame):
         main_frame.pack(fill="both", expand=True, padx=12, pady=10)
         
         # Top row: Name, Category, Value
-        top_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        top_frame.pack(fill="x", pady=(0, 8))
+        self.top_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        self.top_frame.pack(fill="x", pady=(0, 8))
         
         # Name and category
-        name_frame = ctk.CTkFrame(top_frame, fg_color="transparent")
+        name_frame = ctk.CTkFrame(self.top_frame, fg_color="transparent")
         name_frame.pack(side="left", fill="x", expand=True)
         
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             name_frame,
-            text=self.product.name,
+            text="",
             font=("Segoe UI", 14, "bold"),
             text_color=AppStyles.DARK,
             anchor="w"
         )
-        name_label.pack(anchor="w")
+        self.name_label.pack(anchor="w")
         
         # Category badge
         category_badge = ctk.CTkFrame(
@@ -51,55 +57,65 @@ class ProductCard(ctk.CTkFrame):
         )
         category_badge.pack(anchor="w", pady=(2, 0))
         
-        category_label = ctk.CTkLabel(
+        self.category_label = ctk.CTkLabel(
             category_badge,
-            text=self.product.category,
+            text="",
             font=("Segoe UI", 10),
             text_color=AppStyles.DARK,
             padx=8
         )
-        category_label.pack()
+        self.category_label.pack()
         
-        # Value badge (if exists)
-        if self.product.value and self.product.value != "0":
-            value_badge = ctk.CTkFrame(
-                top_frame,
-                fg_color=AppStyles.SUCCESS_GRADIENT[0],
-                corner_radius=15,
-                height=30
-            )
-            value_badge.pack(side="right")
-            
-            value_label = ctk.CTkLabel(
-                value_badge,
-                text=f"${self.product.value}",
-                font=("Segoe UI", 13, "bold"),
-                text_color=AppStyles.WHITE,
-                padx=12
-            )
-            value_label.pack()
+        # Value badge (shown only when a value is set)
+        self.value_badge = ctk.CTkFrame(
+            self.top_frame,
+            fg_color=AppStyles.SUCCESS_GRADIENT[0],
+            corner_radius=15,
+            height=30
+        )
         
-        # Stock status indicator
-        status_color = self.product.get_status_color()
-        status_text = self.product.get_stock_status()
+        self.value_label = ctk.CTkLabel(
+            self.value_badge,
+            text="",
+            font=("Segoe UI", 13, "bold"),
+            text_color=AppStyles.WHITE,
+            padx=12
+        )
+        self.value_label.pack()
         
-        if status_text != "In Stock":
-            status_badge = ctk.CTkFrame(
-                top_frame,
-                fg_color=status_color,
-                corner_radius=12,
-                height=24
-            )
-            status_badge.pack(side="right", padx=(0, 8))
-            
-            status_label = ctk.CTkLabel(
-                status_badge,
-                text=status_text,
-                font=("Segoe UI", 11, "bold"),
-                text_color=AppStyles.WHITE,
-                padx=10
-            )
-            status_label.pack()
+        # Stock status indicator (hidden while "In Stock")
+        self.status_badge = ctk.CTkFrame(
+            self.top_frame,
+            fg_color=AppStyles.SUCCESS,
+            corner_radius=12,
+            height=24
+        )
+        
+        self.status_label = ctk.CTkLabel(
+            self.status_badge,
+            text="",
+            font=("Segoe UI", 11, "bold"),
+            text_color=AppStyles.WHITE,
+            padx=10
+        )
+        self.status_label.pack()
+        
+        # Forecast indicator (shown only when the product should be reordered)
+        self.forecast_badge = ctk.CTkFrame(
+            self.top_frame,
+            fg_color=AppStyles.WARNING,
+            corner_radius=12,
+            height=24
+        )
+        
+        self.forecast_label = ctk.CTkLabel(
+            self.forecast_badge,
+            text="",
+            font=("Segoe UI", 11, "bold"),
+            text_color=AppStyles.WHITE,
+            padx=10
+        )
+        self.forecast_label.pack()
         
         # Bottom row: Quantity and controls
         bottom_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -117,29 +133,20 @@ class ProductCard(ctk.CTkFrame):
         )
         qty_label.pack(side="left", padx=(0, 5))
         
-        qty_value = ctk.CTkLabel(
+        self.qty_value = ctk.CTkLabel(
             qty_frame,
-            text=str(self.product.quantity),
-            font=("Segoe UI", 16, "bold"),
-            text_color=status_color
+            text="",
+            font=("Segoe UI", 16, "bold")
         )
-        qty_value.pack(side="left")
+        self.qty_value.pack(side="left")
         
         # Stock limits
-        limits = []
-        if self.product.min_stock > 0:
-            limits.append(f"Min: {self.product.min_stock}")
-        if self.product.max_stock:
-            limits.append(f"Max: {self.product.max_stock}")
-        
-        if limits:
-            limits_label = ctk.CTkLabel(
-                qty_frame,
-                text=f"({', '.join(limits)})",
-                font=("Segoe UI", 10),
-                text_color=AppStyles.GRAY
-            )
-            limits_label.pack(side="left", padx=(8, 0))
+        self.limits_label = ctk.CTkLabel(
+            qty_frame,
+            text="",
+            font=("Segoe UI", 10),
+            text_color=AppStyles.GRAY
+        )
         
         # Controls
         controls_frame = ctk.CTkFrame(bottom_frame, fg_color="transparent")
@@ -180,12 +187,85 @@ class ProductCard(ctk.CTkFrame):
         )
         btn_delete.pack(side="left", padx=(5, 0))
     
+    def bind_product(self, product):
+        """Show a different product in this card, reusing its widgets"""
+        self.product = product
+        self._render()
+    
+    def _render(self):
+        """Push the current product's fields into the existing widgets"""
+        product = self.product
+        self.name_label.configure(text=product.name)
+        self.category_label.configure(text=product.category)
+        
+        # Badges are packed right-to-left, so re-pack them in a fixed order
+        self.value_badge.pack_forget()
+        self.status_badge.pack_forget()
+        self.forecast_badge.pack_forget()
+        
+        if product.value and product.value != "0":
+            self.value_label.configure(text=f"${product.value}")
+            self.value_badge.pack(side="right")
+        
+        status_color = product.get_status_color()
+        status_text = product.get_stock_status()
+        if status_text != "In Stock":
+            self.status_badge.configure(fg_color=status_color)
+            self.status_label.configure(text=status_text)
+            self.status_badge.pack(side="right", padx=(0, 8))
+        
+        forecast = self.controller.get_cached_forecast(product.name)
+        if forecast is not None and forecast.status in (REORDER_NOW, REORDER_SOON):
+            self.forecast_badge.configure(
+                fg_color=AppStyles.DANGER if forecast.status == REORDER_NOW else AppStyles.WARNING
+            )
+            self.forecast_label.configure(
+                text=f"{forecast.status} · {forecast.days_until_stockout:.0f}d left"
+            )
+            self.forecast_badge.pack(side="right", padx=(0, 8))
+        
+        self.qty_value.configure(text=str(product.quantity), text_color=status_color)
+        
+        limits = []
+        if product.min_stock > 0:
+            limits.append(f"Min: {product.min_stock}")
+        if product.max_stock:
+            limits.append(f"Max: {product.max_stock}")
+        if forecast is not None and forecast.reorder_point:
+            limits.append(f"Reorder at: {forecast.reorder_point}")
+        
+        if limits:
+            self.limits_label.configure(text=f"({', '.join(limits)})")
+            self.limits_label.pack(side="left", padx=(8, 0))
+        else:
+            self.limits_label.pack_forget()
+    
     def _adjust_quantity(self, delta):
         """Adjust product quantity"""
-        self.controller.update_quantity(self.product.name, delta)
+        self._submit(self.controller.update_quantity, self.product.name, delta)
     
     def _confirm_delete(self):
         """Show delete confirmation"""
         from tkinter import messagebox
         if messagebox.askyesno("Confirm Delete", f"Delete '{self.product.name}'?"):
-            self.controller.delete_product(self.product.name)
\ No newline at end of file
+            self._submit(self.controller.delete_product, self.product.name)
+    
+    def _submit(self, function, *args):
+        """Run a change on the controller's writer thread
+        
+        With a shared inventory the change may wait for another process's
+        file lock, which must not freeze the window. The card is redrawn by
+        the change event; failures are logged and shown as a dialog.
+        """
+        self.controller.submit(function, *args).add_done_callback(self._report_failure)
+    
+    @staticmethod
+    def _report_failure(future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if isinstance(error, FileLockTimeout):
+            logger.error("The inventory is busy in another window or on another workstation. "
+                         "Try again in a moment.")
+        elif error is not None:
+            logger.error("Could not update the inventory: %s", error)
\ No newline at end of file
@@ -0,0 +1,227 @@
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from src.models.product import Product
+from src.controllers.search_engine import ProductSearchEngine
+from src.utils.instrumentation import instrumentation
+
+# Ascending key per sort mode; names break ties
+SORT_KEYS: Dict[str, Callable[[Product], tuple]] = {
+    "name": lambda product: (product.name,),
+    "quantity": lambda product: (-product.quantity, product.name),
+    "value": lambda product: (-product.value_cents, product.name),
+    "category": lambda product: (product.category, product.name)
+}
+
+# Below this share of all products, sorting the matches beats filtering a cached ordering
+SORT_MATCHES_RATIO = 16
+
+class SortedOrdering:
+    """Products kept sorted by one key, patched with binary searches"""
+    
+    def __init__(self, sort_key: Callable[[Product], tuple]):
+        self.sort_key = sort_key
+        self.keys: List[tuple] = []
+        self.products: List[Product] = []
+        self._key_by_name: Dict[str, tuple] = {}
+    
+    def __len__(self) -> int:
+        return len(self.products)
+    
+    def build(self, products: Iterable[Product]):
+        """Sort products from scratch"""
+        keyed = sorted(
+            ((self.sort_key(product), product) for product in products),
+            key=itemgetter(0)
+        )
+        self.keys = [key for key, _ in keyed]
+        self.products = [product for _, product in keyed]
+        self._key_by_name = {product.name: key for key, product in keyed}
+    
+    def filtered(self, names: Set[str]) -> "SortedOrdering":
+        """A new ordering holding only the named products, without re-sorting"""
+        subset = SortedOrdering(self.sort_key)
+        for key, product in zip(self.keys, self.products):
+            if product.name in names:
+                subset.keys.append(key)
+                subset.products.append(product)
+                subset._key_by_name[product.name] = key
+        return subset
+    
+    def index_of(self, name: str) -> Optional[int]:
+        """Position of a product"""
+        key = self._key_by_name.get(name)
+        if key is None:
+            return None
+        return bisect_left(self.keys, key)
+    
+    def add(self, product: Product) -> int:
+        """Insert a product at its sorted position (repositions it if already present)
+        
+        A change event can arrive after a rebuild that already included it.
+        """
+        if product.name in self._key_by_name:
+            return self.update(product)[1]
+        key = self.sort_key(product)
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.products.insert(index, product)
+        self._key_by_name[product.name] = key
+        return index
+    
+    def discard(self, name: str) -> Optional[int]:
+        """Remove a product; returns the index it occupied"""
+        index = self.index_of(name)
+        if index is None:
+            return None
+        del self.keys[index]
+        del self.products[index]
+        del self._key_by_name[name]
+        return index
+    
+    def update(self, product: Product) -> Optional[Tuple[int, int]]:
+        """Move a changed product to its new sorted position; returns (old, new) index"""
+        old_index = self.index_of(product.name)
+        if old_index is None:
+            return None
+        key = self.sort_key(product)
+        if key == self.keys[old_index]:
+            return old_index, old_index
+        
+        del self.keys[old_index]
+        del self.products[old_index]
+        new_index = bisect_left(self.keys, key)
+        self.keys.insert(new_index, key)
+        self.products.insert(new_index, product)
+        self._key_by_name[product.name] = key
+        return old_index, new_index
+
+class ProductListModel:
+    """Filtered, sorted row order for the product list, independent of Tk
+    
+    Each sort mode keeps a cached ordering of every product, patched with
+    binary searches as products change, so switching sort mode or changing a
+    single product never re-sorts everything. The shown rows are the current
+    ordering itself, or a filtered copy of it while a search is active.
+    """
+    
+    SORT_OPTIONS = tuple(SORT_KEYS)
+    
+    def __init__(self):
+        self.search_text = ""
+        self.sort_by = "name"
+        self._view = SortedOrdering(self.sort_key)
+        self._orderings: Dict[str, SortedOrdering] = {}
+        # Controller generation the cached orderings were built from
+        self._generation: Optional[int] = None
+    
+    @property
+    def rows(self) -> List[Product]:
+        """Shown products in display order"""
+        return self._view.products
+    
+    def sort_key(self, product: Product) -> tuple:
+        """Ascending key for the current sort mode; names break ties"""
+        return SORT_KEYS.get(self.sort_by, SORT_KEYS["name"])(product)
+    
+    def matches(self, product: Product) -> bool:
+        """Check a single product against the search text"""
+        if not self.search_text:
+            return True
+        return self.search_text in ProductSearchEngine.search_key(product)
+    
+    def invalidate(self):
+        """Drop the cached orderings, e.g. after the inventory was replaced"""
+        self._orderings.clear()
+        self._generation = None
+    
+    @instrumentation.timed("list_model.rebuild")
+    def rebuild(self, products: Mapping[str, Product],
+                matching: Optional[Iterable[str]] = None) -> List[Product]:
+        """Filter and sort all products from scratch, without using the cache
+        
+        `matching` is the set of names already known to match the search text
+        (from the search index); without it every product is checked.
+        """
+        self.invalidate()
+        if matching is not None:
+            candidates = (products[name] for name in matching if name in products)
+        else:
+            candidates = (product for product in products.values() if self.matches(product))
+        self._view = SortedOrdering(SORT_KEYS.get(self.sort_by, SORT_KEYS["name"]))
+        self._view.build(candidates)
+        return self.rows
+    
+    @instrumentation.timed("list_model.refresh")
+    def rebuild_from(self, controller) -> List[Product]:
+        """Filter and sort the controller's products, reusing the cached ordering
+        
+        Only the first use of a sort mode sorts every product; after that the
+        ordering is already up to date and a search just filters it.
+        """
+        if controller.generation != self._generation:
+            # The inventory was reloaded since the orderings were built
+            self.invalidate()
+            self._generation = controller.generation
+        products = controller.get_all_products()
+        ordering = self._ordering(products)
+        if not self.search_text:
+            self._view = ordering
+            return self.rows
+        
+        matching = controller.search(self.search_text)
+        if len(matching) * SORT_MATCHES_RATIO < len(ordering):
+            # A handful of matches: sorting them is cheaper than a full scan
+            self._view = SortedOrdering(ordering.sort_key)
+            self._view.build(products[name] for name in matching if name in products)
+        else:
+            self._view = ordering.filtered(matching)
+        return self.rows
+    
+    def _ordering(self, products: Mapping[str, Product]) -> SortedOrdering:
+        """Cached ordering of every product for the current sort mode"""
+        sort_by = self.sort_by if self.sort_by in SORT_KEYS else "name"
+        ordering = self._orderings.get(sort_by)
+        # The count check catches changes that bypassed insert/remove
+        if ordering is None or len(ordering) != len(products):
+            ordering = SortedOrdering(SORT_KEYS[sort_by])
+            ordering.build(products.values())
+            self._orderings[sort_by] = ordering
+        return ordering
+    
+    def _is_cached(self) -> bool:
+        return any(ordering is self._view for ordering in self._orderings.values())
+    
+    def index_of(self, name: str) -> Optional[int]:
+        """Row index of a shown product"""
+        return self._view.index_of(name)
+    
+    def insert(self, product: Product) -> Optional[int]:
+        """Add a product to every ordering; returns its row, or None if it is filtered out"""
+        for ordering in self._orderings.values():
+            ordering.add(product)
+        if self._is_cached():
+            return self._view.index_of(product.name)
+        if not self.matches(product):
+            return None
+        return self._view.add(product)
+    
+    def remove(self, name: str) -> Optional[int]:
+        """Remove a product from every ordering; returns the row it occupied"""
+        index = self._view.index_of(name)
+        for ordering in self._orderings.values():
+            ordering.discard(name)
+        if not self._is_cached() and index is not None:
+            self._view.discard(name)
+        return index
+    
+    def reposition(self, product: Product) -> Optional[Tuple[int, int]]:
+        """Move a changed product in every ordering; returns its (old, new) row"""
+        moved = None
+        for ordering in self._orderings.values():
+            result = ordering.update(product)
+            if ordering is self._view:
+                moved = result
+        if not self._is_cached():
+            moved = self._view.update(product)
+        return moved
@@ -0,0 +1,10 @@
+from typing import Any, Dict
+
+def format_statistics(stats: Dict[str, Any]) -> Dict[str, str]:
+    """Card texts for StatisticsPanel from InventoryController.get_statistics()"""
+    return {
+        "total_products": str(stats["total_products"]),
+        "low_stock": str(stats["low_stock"]),
+        "out_of_stock": str(stats["out_of_stock"]),
+        "total_value": f"${stats['total_value']:,.0f}"
+    }
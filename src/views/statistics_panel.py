@@ -1,5 +1,7 @@
 import customtkinter as ctk
 from src.assets.styles import AppStyles
+from src.views.statistics_model import format_statistics
+from src.utils.instrumentation import instrumentation
 
 class StatisticsPanel(ctk.CTkFrame):
     """Compact statistics dashboard panel"""
@@ -59,21 +61,12 @@ class StatisticsPanel(ctk.CTkFrame):
         card.value_label = value_label
         return card
     
-    def update_statistics(self, products):
-        """Update statistics based on current products"""
-        total_products = len(products)
-        low_stock = sum(1 for p in products.values() if p.is_low_stock())
-        out_of_stock = sum(1 for p in products.values() if p.quantity == 0)
+    @instrumentation.timed("update_statistics")
+    def update_statistics(self):
+        """Update statistics from the controller's running aggregates"""
+        texts = format_statistics(self.controller.get_statistics())
         
-        total_value = 0
-        for product in products.values():
-            try:
-                value = float(product.value) if product.value else 0
-                total_value += value * product.quantity
-            except ValueError:
-                pass
-        
-        self.total_products_card.value_label.configure(text=str(total_products))
-        self.low_stock_card.value_label.configure(text=str(low_stock))
-        self.out_of_stock_card.value_label.configure(text=str(out_of_stock))
-        self.total_value_card.value_label.configure(text=f"${total_value:,.0f}")
\ No newline at end of file
+        self.total_products_card.value_label.configure(text=texts["total_products"])
+        self.low_stock_card.value_label.configure(text=texts["low_stock"])
+        self.out_of_stock_card.value_label.configure(text=texts["out_of_stock"])
+        self.total_value_card.value_label.configure(text=texts["total_value"])
\ No newline at end of file
@@ -0,0 +1,41 @@
+import queue
+import threading
+from typing import Any, Callable
+from src.config.settings import UI_DISPATCH_POLL_MS
+
+class UiDispatcher:
+    """Runs callbacks on the Tk main loop, whichever thread asks
+    
+    Tk must only be touched from the thread that created it. Calls made on
+    that thread run immediately. Calls from other threads (the API writer, the
+    autosave worker) are queued and drained by an `after` poll on the main
+    loop, so no other thread ever calls into Tk, not even `after` itself.
+    """
+    
+    def __init__(self, root, poll_ms: int = UI_DISPATCH_POLL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._thread = threading.current_thread()
+        self._pending: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self.root.after(self.poll_ms, self._drain)
+    
+    def on_ui_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+    
+    def call(self, callback: Callable[..., Any], *args):
+        """Run callback(*args) on the main loop, now if already on it"""
+        if self.on_ui_thread():
+            callback(*args)
+        else:
+            self._pending.put((callback, args))
+    
+    def _drain(self):
+        try:
+            while True:
+                try:
+                    callback, args = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+        finally:
+            self.root.after(self.poll_ms, self._drain)
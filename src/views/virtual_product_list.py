@@ -0,0 +1,148 @@
+import tkinter as tk
+from typing import Dict, List, Tuple
+from src.assets.styles import AppStyles
+from src.views.product_card import ProductCard
+from src.utils.instrumentation import instrumentation
+
+class VirtualProductList(tk.Frame):
+    """Scrollable product list that only materializes cards for visible rows
+    
+    Cards live in a fixed pool and are re-bound to whichever products scroll
+    into view, so the widget count stays proportional to the viewport height
+    rather than to the number of products.
+    """
+    
+    CARD_HEIGHT = 104
+    ROW_SPACING = 10
+    ROW_HEIGHT = CARD_HEIGHT + ROW_SPACING
+    OVERSCAN = 3  # Extra rows built above and below the viewport
+    
+    def __init__(self, parent, controller, **kwargs):
+        super().__init__(parent, bg=AppStyles.WHITE, **kwargs)
+        
+        self.controller = controller
+        self.products: List = []
+        
+        # row index -> (card, canvas window id)
+        self._visible: Dict[int, Tuple[ProductCard, int]] = {}
+        self._free: List[Tuple[ProductCard, int]] = []
+        
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        self.canvas = tk.Canvas(
+            self,
+            bg=AppStyles.WHITE,
+            highlightthickness=0
+        )
+        
+        self.scrollbar = tk.Scrollbar(
+            self,
+            orient="vertical",
+            command=self._on_scrollbar
+        )
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+    
+    def set_products(self, products: List):
+        """Show an ordered list of products"""
+        self.products = products
+        self._update_scrollregion()
+        
+        # Every visible row may now hold a different product
+        for row in list(self._visible):
+            self._release_row(row)
+        self._update_visible()
+    
+    def refresh_rows(self, start: int, stop: int):
+        """Re-bind visible cards for rows in [start, stop) after the row list changed in place"""
+        self._update_scrollregion()
+        for row in list(self._visible):
+            if row >= len(self.products):
+                self._release_row(row)
+            elif start <= row < stop:
+                card, _ = self._visible[row]
+                with instrumentation.time("product_card.bind"):
+                    card.bind_product(self.products[row])
+        self._update_visible()
+    
+    def scroll_units(self, units: int):
+        """Scroll by a number of units (mouse wheel)"""
+        self.canvas.yview_scroll(units, "units")
+        self._update_visible()
+    
+    def scroll_to_top(self):
+        """Jump back to the first row"""
+        self.canvas.yview_moveto(0)
+        self._update_visible()
+    
+    def _on_scrollbar(self, *args):
+        """Scrollbar drag/click handler"""
+        self.canvas.yview(*args)
+        self._update_visible()
+    
+    def _on_canvas_configure(self, event):
+        """Stretch cards to the canvas width and fill newly exposed rows"""
+        for card, item in list(self._visible.values()) + self._free:
+            self.canvas.itemconfigure(item, width=event.width)
+        self._update_scrollregion()
+        self._update_visible()
+    
+    def _update_scrollregion(self):
+        """Size the scroll region from the row count instead of measuring widgets"""
+        height = max(len(self.products) * self.ROW_HEIGHT, self.canvas.winfo_height())
+        self.canvas.configure(
+            scrollregion=(0, 0, self.canvas.winfo_width(), height),
+            yscrollincrement=self.ROW_HEIGHT // 4
+        )
+    
+    def _visible_range(self) -> range:
+        """Rows intersecting the viewport, plus overscan"""
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        first = max(0, int(top // self.ROW_HEIGHT) - self.OVERSCAN)
+        last = min(
+            len(self.products),
+            int((top + height) // self.ROW_HEIGHT) + 1 + self.OVERSCAN
+        )
+        return range(first, last)
+    
+    def _update_visible(self):
+        """Recycle cards that left the viewport and bind cards to rows that entered it"""
+        wanted = self._visible_range()
+        
+        for row in list(self._visible):
+            if row not in wanted:
+                self._release_row(row)
+        
+        for row in wanted:
+            if row not in self._visible:
+                self._show_row(row)
+    
+    def _show_row(self, row: int):
+        """Place a pooled card at a row"""
+        if self._free:
+            card, item = self._free.pop()
+            self.canvas.coords(item, 0, row * self.ROW_HEIGHT)
+            with instrumentation.time("product_card.bind"):
+                card.bind_product(self.products[row])
+        else:
+            with instrumentation.time("product_card.create"):
+                card = ProductCard(self.canvas, self.products[row], self.controller)
+            item = self.canvas.create_window(
+                0, row * self.ROW_HEIGHT,
+                window=card,
+                anchor="nw",
+                width=self.canvas.winfo_width(),
+                height=self.CARD_HEIGHT
+            )
+        self._visible[row] = (card, item)
+    
+    def _release_row(self, row: int):
+        """Park a row's card above the scroll region and return it to the pool"""
+        card, item = self._visible.pop(row)
+        self.canvas.coords(item, 0, -2 * self.ROW_HEIGHT)
+        self._free.append((card, item))
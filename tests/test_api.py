@@ -0,0 +1,91 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from src.api.server import ApiError, InventoryApiServer
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository
+
+class ApiReadTest(unittest.IsolatedAsyncioTestCase):
+    """Reads run off the event loop and page before sorting"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.controller = InventoryController(
+            JsonRepository(os.path.join(directory.name, "inventory.json"))
+        )
+        self.addCleanup(self.controller.close)
+        for name in ("Cable", "Adapter", "Battery"):
+            self.controller.add_product(name, 5)
+        self.server = InventoryApiServer(self.controller)
+    
+    async def test_list_products_returns_first_page_by_name(self):
+        status, payload = await self.server.dispatch("GET", "/products?limit=2", b"")
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["total"], 3)
+        self.assertEqual([row["name"] for row in payload["products"]], ["Adapter", "Battery"])
+    
+    async def test_unknown_status_is_rejected(self):
+        with self.assertRaises(ApiError) as raised:
+            await self.server.dispatch("GET", "/products?status=bogus", b"")
+        self.assertEqual(raised.exception.status, 400)
+    
+    async def test_held_lock_does_not_stall_other_requests(self):
+        held, release = threading.Event(), threading.Event()
+        
+        def hold():
+            with self.controller.locked():
+                held.set()
+                release.wait(5)
+        
+        thread = threading.Thread(target=hold)
+        thread.start()
+        try:
+            held.wait()
+            stats = asyncio.ensure_future(self.server.dispatch("GET", "/stats", b""))
+            product = await asyncio.wait_for(self.server.dispatch("GET", "/products/Cable", b""), 1)
+            self.assertEqual(product[1]["quantity"], 5)
+            with self.assertRaises(ApiError):
+                await asyncio.wait_for(self.server.dispatch("GET", "/nowhere", b""), 1)
+            self.assertFalse(stats.done())
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual((await stats)[1]["total_products"], 3)
+
+class ApiBatchTest(unittest.IsolatedAsyncioTestCase):
+    """Malformed batch operations are client errors and change nothing"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.controller = InventoryController(
+            JsonRepository(os.path.join(directory.name, "inventory.json"))
+        )
+        self.addCleanup(self.controller.close)
+        self.controller.add_product("Cable", 5)
+        self.server = InventoryApiServer(self.controller)
+    
+    async def test_bad_fields_are_rejected_with_400(self):
+        for body in (b'{"operations": [["adjust", "Cable", 1],'
+                     b' ["add", "X", {"quantity": 1, "min_stock": "abc"}]]}',
+                     b'{"operations": [["add", "X", {"quantity": 1, "value": 1e999}]]}',
+                     b'{"operations": [["add", "X", {"quantity": 1e999}]]}'):
+            with self.subTest(body=body), self.assertRaises(ApiError) as raised:
+                await self.server.dispatch("POST", "/batch", body)
+            self.assertEqual(raised.exception.status, 400)
+        self.assertEqual(set(self.controller.get_all_products()), {"Cable"})
+        self.assertEqual(self.controller.get_product("Cable").quantity, 5)
+        self.assertTrue(self.controller.verify_statistics())
+    
+    async def test_valid_batch_is_applied(self):
+        status, payload = await self.server.dispatch(
+            "POST", "/batch", b'{"operations": [["add", "X", {"quantity": 2, "value": "1.50"}]]}'
+        )
+        self.assertEqual((status, payload), (200, {"applied": 1}))
+        self.assertEqual(self.controller.get_product("X").quantity, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.controllers.batch import BatchError
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository
+from src.utils.journal import InventoryJournal
+
+class PersistFailureTest(unittest.TestCase):
+    """When a change cannot be written, memory must not run ahead of disk"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "inventory.json")
+        self.journal = InventoryJournal(os.path.join(directory.name, "inventory.journal"))
+        self.controller = InventoryController(JsonRepository(self.path, journal=self.journal))
+        self.addCleanup(self.controller.close)
+        self.controller.add_product("A", 10)
+        self.view = mock.Mock(spec=["on_inventory_changed"])
+        self.controller.set_view(self.view)
+    
+    def failing_append(self):
+        return mock.patch.object(self.journal, "append_many", side_effect=OSError("disk full"))
+    
+    def quantities(self, controller: InventoryController):
+        return {name: product.quantity for name, product in controller.get_all_products().items()}
+    
+    def test_batch_is_rolled_back(self):
+        with self.failing_append(), self.assertRaises(OSError):
+            with self.controller.batch():
+                self.controller.update_quantity("A", 5)
+                self.controller.add_product("B", 1)
+        self.assertEqual(self.quantities(self.controller), {"A": 10})
+        self.assertTrue(self.controller.verify_statistics())
+        self.view.on_inventory_changed.assert_not_called()
+    
+    def test_single_changes_are_rolled_back(self):
+        with self.failing_append():
+            with self.assertRaises(OSError):
+                self.controller.update_quantity("A", 5)
+            with self.assertRaises(OSError):
+                self.controller.add_product("B", 1)
+            with self.assertRaises(OSError):
+                self.controller.delete_product("A")
+        self.assertEqual(self.quantities(self.controller), {"A": 10})
+        self.view.on_inventory_changed.assert_not_called()
+        
+        self.controller.close()
+        reloaded = InventoryController(JsonRepository(self.path, journal=self.journal))
+        self.addCleanup(reloaded.close)
+        self.assertEqual(self.quantities(reloaded), {"A": 10})
+
+class FailedOperationTest(unittest.TestCase):
+    """A batch that fails on a malformed product leaves the controller as it was"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "inventory.json")
+        self.controller = InventoryController(JsonRepository(self.path))
+        self.addCleanup(self.controller.close)
+        self.controller.add_product("A", 10, "2.50", "Tools", min_stock=5)
+        self.controller.add_product("B", 3, "1.00", "Parts")
+        self.controller.search("a")
+    
+    def state(self):
+        controller = self.controller
+        return (
+            {name: product.to_dict() for name, product in controller.get_all_products().items()},
+            controller.get_statistics(),
+            set(controller.get_low_stock_products()),
+            set(controller.get_products_by_category("Parts")),
+            controller.search("b")
+        )
+    
+    def test_malformed_fields_are_rejected(self):
+        before = self.state()
+        for fields in ({"quantity": 1, "min_stock": "abc"}, {"quantity": -1},
+                       {"quantity": 1, "value": 1e999}, {"quantity": 1, "value": "nan"},
+                       {"quantity": 1, "category": 5}, {"quantity": True},
+                       {"quantity": 1, "max_stock": 1.5}):
+            with self.subTest(fields=fields), self.assertRaises(BatchError):
+                self.controller.apply_batch([("adjust", "A", 1), ("add", "X", fields)])
+        self.assertEqual(self.state(), before)
+    
+    def test_failing_insert_is_undone(self):
+        before = self.state()
+        with self.assertRaises(TypeError):
+            self.controller.import_products({"C": {"quantity": 2},
+                                             "X": {"quantity": 1, "min_stock": "5"}})
+        self.assertEqual(self.state(), before)
+        self.assertTrue(self.controller.verify_statistics())
+        
+        self.controller.close()
+        reloaded = InventoryController(JsonRepository(self.path))
+        self.addCleanup(reloaded.close)
+        self.assertEqual(set(reloaded.get_all_products()), {"A", "B"})
+
+if __name__ == "__main__":
+    unittest.main()
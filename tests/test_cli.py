@@ -0,0 +1,17 @@
+import unittest
+from unittest import mock
+from src import cli
+from src.utils.file_lock import FileLockTimeout
+
+class CliErrorTest(unittest.TestCase):
+    
+    def test_load_failure_is_reported_with_exit_code(self):
+        failure = FileLockTimeout("Timed out waiting for inventory.json.lock")
+        with mock.patch("src.controllers.inventory_controller.InventoryController",
+                        side_effect=failure), \
+                self.assertLogs("src.cli", "ERROR") as logs:
+            self.assertEqual(cli.main(["stats"]), 1)
+        self.assertIn("Timed out waiting", logs.output[0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from src.controllers.inventory_controller import InventoryController
+from src.storage import JsonRepository
+from src.utils.journal import InventoryJournal
+
+class JournalRecoveryTest(unittest.TestCase):
+    """A torn trailing line from a crash must not swallow later records"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.journal_path = os.path.join(self.directory.name, "inventory.journal")
+    
+    def open_controller(self) -> InventoryController:
+        controller = InventoryController(JsonRepository(
+            os.path.join(self.directory.name, "inventory.json"),
+            journal=InventoryJournal(self.journal_path)
+        ))
+        controller.load_products()
+        self.addCleanup(controller.close)
+        return controller
+    
+    def test_appends_after_torn_line_survive_reload(self):
+        controller = self.open_controller()
+        controller.add_product("A", 5)
+        controller.close()
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.write('{"op":"qty","na')
+        
+        controller = self.open_controller()
+        controller.add_product("B", 1)
+        controller.update_quantity("A", 3)
+        controller.close()
+        
+        products = self.open_controller().get_all_products()
+        self.assertEqual({name: product.quantity for name, product in products.items()},
+                         {"A": 8, "B": 1})
+    
+    def test_read_from_continues_past_trimmed_line(self):
+        journal = InventoryJournal(self.journal_path)
+        journal.append({"op": "del", "name": "A"})
+        offset = journal.live_size()
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.write('{"op":"del","na')
+        self.assertEqual(journal.read_from(offset), ([], offset))
+        
+        journal.append({"op": "del", "name": "B"})
+        records, _ = journal.read_from(offset)
+        self.assertEqual(records, [{"op": "del", "name": "B"}])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from src.models.product import Product
+from src.storage.binary_snapshot import capture_rows, iter_products, write_snapshot
+
+STORED = {
+    "quantity": 3,
+    "value": None,
+    "category": "Tools",
+    "description": "",
+    "min_stock": 0,
+    "max_stock": None,
+    "created_at": "2025-06-01T10:00:00+00:00",
+    "updated_at": "2025-03-09T02:30:00",
+    "sku": "ABCD1234"
+}
+
+@unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+class ProductRoundTripTest(unittest.TestCase):
+    """to_dict writes back what was read, whatever the local timezone"""
+    
+    def setUp(self):
+        previous = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        Product._local_hours.clear()
+        
+        def restore():
+            if previous is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = previous
+            time.tzset()
+            Product._local_hours.clear()
+        self.addCleanup(restore)
+    
+    def test_stored_fields_round_trip(self):
+        for created_at, updated_at in (
+            ("2025-06-01T10:00:00+00:00", "2025-03-09T02:30:00"),  # offset, DST gap
+            ("2025-06-01", "2025-06-01T12:00:00Z"),
+            ("2025-06-01T06:00:00", "2025-06-01T06:00:00.250000"),  # canonical
+            ("not a date", 1748772000),
+        ):
+            with self.subTest(created_at=created_at, updated_at=updated_at):
+                stored = dict(STORED, name="Hammer", created_at=created_at, updated_at=updated_at)
+                self.assertEqual(Product.hydrate("Hammer", stored).to_dict(), stored)
+    
+    def test_canonical_timestamps_are_not_kept(self):
+        product = Product.hydrate("Hammer", dict(STORED, created_at="2025-06-01T06:00:00"))
+        self.assertIsNone(product._created_raw)
+    
+    def test_changed_timestamp_is_written_in_local_iso_form(self):
+        product = Product.hydrate("Hammer", STORED)
+        product.update_quantity(1)
+        self.assertEqual(product.updated_at, datetime.fromtimestamp(product.updated_ts).isoformat())
+        self.assertEqual(product.value, "")
+    
+    def test_binary_snapshot_keeps_stored_text(self):
+        product = Product.hydrate("Hammer", STORED)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "inventory.snap")
+        with open(path, "wb") as file:
+            write_snapshot(file, capture_rows([product]))
+        (loaded,) = list(iter_products(path))
+        self.assertEqual(loaded.to_dict(), product.to_dict())
+
+class ValueRoundTripTest(unittest.TestCase):
+    """Stored values that are not prices load as non-numeric and are written back unchanged"""
+    
+    def test_non_finite_values_round_trip(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "inventory.snap")
+        for value in ("inf", "-inf", "nan", "1e999", "1e300", "12.50"):
+            with self.subTest(value=value):
+                stored = dict(STORED, name="Hammer", value=value)
+                product = Product.hydrate("Hammer", stored)
+                self.assertEqual(product.value_cents, 1250 if value == "12.50" else 0)
+                self.assertEqual(product.to_dict(), stored)
+                with open(path, "wb") as file:
+                    write_snapshot(file, capture_rows([product]))
+                (loaded,) = list(iter_products(path))
+                self.assertEqual(loaded.to_dict(), stored)
+
+if __name__ == "__main__":
+    unittest.main()
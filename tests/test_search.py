@@ -0,0 +1,67 @@
+import threading
+import time
+import unittest
+from src.controllers.search_engine import ProductSearchEngine
+from src.models.product import Product
+
+class GatedProducts(dict):
+    """A product mapping whose iteration waits until the test opens the gate"""
+    
+    def __init__(self, products):
+        super().__init__(products)
+        self.gate = threading.Event()
+    
+    def values(self):
+        self.gate.wait(5)
+        return super().values()
+
+class SearchEngineTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.products = {
+            name: Product(name, 1, category=category, description=description)
+            for name, category, description in (
+                ("USB Cable", "Electronics", "Braided, two metres"),
+                ("HDMI Cable", "Electronics", ""),
+                ("Desk Lamp", "Office", "Warm white LED"),
+                ("Stapler", "Office", "Uses 26/6 staples"),
+            )
+        }
+    
+    def test_index_matches_linear_scan(self):
+        engine = ProductSearchEngine()
+        engine.build(self.products)
+        for query in ("cable", "CAB", "led", "office", "26/6", "e", "zzz", "hdmi cable"):
+            with self.subTest(query=query):
+                self.assertEqual(engine.search(query), ProductSearchEngine.scan(self.products, query))
+        # Narrowing a previous query re-checks descriptions too
+        self.assertEqual(engine.search("wa"), {"Desk Lamp"})
+        self.assertEqual(engine.search("warm"), {"Desk Lamp"})
+    
+    def test_changes_during_background_build_are_replayed(self):
+        engine = ProductSearchEngine()
+        products = GatedProducts(self.products)
+        engine.start_build(products)
+        self.assertFalse(engine.ready)
+        with engine.lock:
+            engine.remove("Stapler")
+            engine.add(Product("Cable Tie", 1, description="Pack of 100"))
+        products.gate.set()
+        deadline = time.monotonic() + 5
+        while not engine.ready and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(engine.ready)
+        self.assertEqual(engine.search("cable"), {"USB Cable", "HDMI Cable", "Cable Tie"})
+        self.assertEqual(engine.search("staple"), set())
+    
+    def test_invalidate_discards_a_running_build(self):
+        engine = ProductSearchEngine()
+        products = GatedProducts(self.products)
+        engine.start_build(products)
+        engine.invalidate()
+        products.gate.set()
+        time.sleep(0.1)
+        self.assertFalse(engine.ready)
+
+if __name__ == "__main__":
+    unittest.main()
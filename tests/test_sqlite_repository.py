@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from src.controllers.inventory_controller import InventoryController
+from src.storage import SqliteRepository
+
+class SqliteRepositoryTest(unittest.TestCase):
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "inventory.db")
+    
+    def test_iter_load_streams_rows_with_progress(self):
+        repository = SqliteRepository(self.path)
+        self.addCleanup(repository.close)
+        repository.save_snapshot({
+            f"Product {i:04d}": {"quantity": i, "value": "1.50", "sku": f"SKU{i}"}
+            for i in range(2500)
+        })
+        progress = []
+        records = repository.iter_load(progress.append)
+        op, name, data = next(records)
+        # The first product arrives before the rest of the table has been read
+        self.assertEqual(progress, [])
+        self.assertEqual(op, "put")
+        self.assertEqual(data["name"], name)
+        self.assertNotIn("stock_status", data)
+        self.assertEqual(sum(1 for _ in records) + 1, 2500)
+        self.assertEqual(progress[-1], 1.0)
+        self.assertEqual(progress, sorted(progress))
+    
+    def test_controller_round_trip(self):
+        controller = InventoryController(SqliteRepository(self.path))
+        controller.add_product("Widget", 5, "2.00", "Parts")
+        controller.update_quantity("Widget", -2)
+        controller.close()
+        
+        controller = InventoryController(SqliteRepository(self.path))
+        self.addCleanup(controller.close)
+        widget = controller.get_product("Widget")
+        self.assertEqual((widget.quantity, widget.value, widget.category), (3, "2.00", "Parts"))
+        self.assertIs(controller.get_by_sku(widget.sku), widget)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import tempfile
+import unittest
+from benchmarks import stress_controller, stress_shared_file
+
+class ControllerStressTest(unittest.TestCase):
+    """A short run of benchmarks/stress_controller.py: threads on one controller"""
+    
+    def test_invariants_hold(self):
+        with tempfile.TemporaryDirectory() as directory:
+            failures, workers, readers, _ = stress_controller.stress(directory, 1.0, 4)
+        self.assertEqual(failures, [])
+        self.assertTrue(all(worker.operations for worker in workers))
+        self.assertTrue(all(reader.reads for reader in readers))
+
+class SharedFileStressTest(unittest.TestCase):
+    """A short run of benchmarks/stress_shared_file.py: processes on one inventory file"""
+    
+    def test_no_lost_updates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            failures, outcomes, _ = stress_shared_file.stress(directory, 3, 300)
+        self.assertEqual(failures, [])
+        self.assertEqual(len(outcomes), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+from src.utils import numpy_support
+from src.utils.validators import Validators
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:
+    st = None
+
+# Characters that sit on the edges of the validation rules
+TRICKY = ["", " ", "\t", "\n", " ", "　", "-", "_", "$", ",", ".", "+", "e", "E",
+          "0", "1", "9", "_1", "nan", "inf", "-inf", "1e999", "١", "é", "/", "%",
+          "999999", "1000000", "999999.99", "999999.995", "-0", "0x1"]
+
+def scalar_row(name: str, quantity: str, value: str) -> tuple:
+    """What the single-field validators say about one row"""
+    name_ok, name_error = Validators.validate_product_name(name)
+    quantity_ok, quantity_error, parsed_quantity = Validators.validate_quantity(quantity)
+    value_ok, value_error, parsed_value = Validators.validate_value(value)
+    errors = [error for error in (name_error, quantity_error, value_error) if error]
+    return (name_ok and quantity_ok and value_ok, errors,
+            parsed_quantity if quantity_ok else None, parsed_value if value_ok else None)
+
+def bulk_rows(names, quantities, values) -> list:
+    result = Validators.validate_bulk(names, quantities, values)
+    return [
+        (bool(result.valid[row]), result.errors(row), result.quantities[row], result.values[row])
+        for row in range(len(result))
+    ]
+
+def random_field(rng: random.Random) -> str:
+    parts = rng.choices(TRICKY, k=rng.randint(0, 4))
+    if rng.random() < 0.3:
+        parts.append(str(rng.randint(-10**7, 10**7)))
+    if rng.random() < 0.2:
+        parts.append("".join(rng.choices("aZ9 -_", k=rng.randint(95, 105))))
+    return "".join(parts)
+
+def clean_row(rng: random.Random) -> tuple:
+    """A row in the form the bulk fast paths accept, with values near the limits"""
+    name = "".join(rng.choices("aZ9 -_\t", k=rng.choice([0, 1, 5, 100, 101])))
+    quantity = str(rng.choice([0, 7, 999999, 1000000, 10**17, 10**19]))
+    if rng.random() < 0.2:
+        quantity = "0" + quantity
+    value = rng.choice(["", "0", "1.", "$1,000.5", "999999.99", "999999.995",
+                        "1000000", "12,34", str(rng.randint(0, 10**8))])
+    return name, quantity, value
+
+class ValidateBulkTest(unittest.TestCase):
+    """validate_bulk agrees with the single-field validators on every row"""
+    
+    def tearDown(self):
+        numpy_support.enabled = True
+    
+    def check(self, rows):
+        names, quantities, values = (list(column) for column in zip(*rows)) if rows else ([], [], [])
+        expected = [scalar_row(*row) for row in rows]
+        for enabled in (True, False):
+            numpy_support.enabled = enabled
+            actual = bulk_rows(names, quantities, values)
+            for row, want, got in zip(rows, expected, actual):
+                self.assertEqual(got, want, f"row {row!r}, NumPy enabled: {enabled}")
+            self.assertEqual(len(actual), len(expected))
+    
+    def test_random_rows(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            self.check([tuple(random_field(rng) for _ in range(3)) for _ in range(rng.randint(0, 20))])
+    
+    def test_clean_columns(self):
+        rng = random.Random(4321)
+        for _ in range(200):
+            self.check([clean_row(rng) for _ in range(rng.randint(1, 20))])
+    
+    @unittest.skipIf(st is None, "Hypothesis is not installed")
+    def test_property(self):
+        field = st.one_of(
+            st.text(),
+            st.lists(st.sampled_from(TRICKY), max_size=4).map("".join),
+            st.integers(-10**12, 10**12).map(str),
+            st.floats(allow_nan=True, allow_infinity=True).map(str),
+            st.text(alphabet="aZ9 -_", min_size=95, max_size=105)
+        )
+        
+        @settings(max_examples=300, deadline=None)
+        @given(st.lists(st.tuples(field, field, field), max_size=20))
+        def property_holds(rows):
+            self.check(rows)
+        
+        property_holds()
+
+if __name__ == "__main__":
+    unittest.main()